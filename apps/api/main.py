@@ -1,10 +1,38 @@
+import asyncio
+import logging
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 
-from apps.api.routes import router
+from apps.api.routes import close_orchestrator, get_orchestrator, peek_orchestrator, router
+from spoon.config import SETTINGS
 
-app = FastAPI(title="GATTEN GATE")
+
+def _start() -> None:
+    try:
+        orchestrator = get_orchestrator()
+    except Exception:
+        logging.getLogger("gatten_gate.api").exception("STARTUP: building the gate failed; retrying on first request")
+        return
+    if SETTINGS.gate_warmup:
+        orchestrator.warm_up()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The gate is built (and with GATE_WARMUP=1 warmed up) in the background so
+    # the server answers /health at once; /ready reports when it is done.
+    start = asyncio.create_task(asyncio.to_thread(_start))
+    try:
+        yield
+    finally:
+        await asyncio.gather(start, return_exceptions=True)
+        close_orchestrator()
+
+
+app = FastAPI(title="GATTEN GATE", lifespan=lifespan)
 app.include_router(router)
 
 
@@ -13,6 +41,19 @@ def health() -> dict:
     return {"status": "ok"}
 
 
+@app.get("/ready")
+def ready() -> JSONResponse:
+    """200 once the gate is built and, with GATE_WARMUP=1, warmed up; 503 until then."""
+    orchestrator = peek_orchestrator()
+    subsystems = {"orchestrator": "ready" if orchestrator is not None else "pending"}
+    if orchestrator is not None:
+        subsystems.update(orchestrator.readiness())
+    # With GATE_WARMUP=1, "lazy" only means the warm-up has not reached that subsystem yet.
+    done = {"ready", "unavailable"} if SETTINGS.gate_warmup else {"ready", "unavailable", "lazy"}
+    is_ready = all(state in done for state in subsystems.values())
+    return JSONResponse({"ready": is_ready, "subsystems": subsystems}, status_code=200 if is_ready else 503)
+
+
 if __name__ == "__main__":
     import uvicorn
 
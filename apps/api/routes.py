@@ -1,23 +1,66 @@
-from typing import Any, Dict
+import json
+import threading
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from spoon.config import SETTINGS
-from spoon.orchestrator import Orchestrator
 from spoon.security import require_api_key
 
+if TYPE_CHECKING:
+    from spoon.orchestrator import Orchestrator
+
 router = APIRouter()
 
 POLICY_PATH = SETTINGS.policy_path
 DATA_DIR = SETTINGS.data_dir
 
-orchestrator = Orchestrator(policy_path=POLICY_PATH, data_dir=DATA_DIR)
+_orchestrator: Optional["Orchestrator"] = None
+_orchestrator_lock = threading.Lock()
+
+
+def get_orchestrator() -> "Orchestrator":
+    """The process's Orchestrator, built on first use.
+
+    spoon.orchestrator is imported here, not at module level: it pulls in
+    spoon_ai, whose import alone takes seconds. The app's lifespan hook builds
+    it in the background so /health answers meanwhile; requests that need it
+    wait here until it is built.
+    """
+    global _orchestrator
+    if _orchestrator is None:
+        with _orchestrator_lock:
+            if _orchestrator is None:
+                from spoon.orchestrator import Orchestrator
+
+                _orchestrator = Orchestrator(policy_path=POLICY_PATH, data_dir=DATA_DIR)
+    return _orchestrator
+
+
+def peek_orchestrator() -> Optional["Orchestrator"]:
+    """The Orchestrator if it has been built, without building it."""
+    return _orchestrator
+
+
+def close_orchestrator() -> None:
+    global _orchestrator
+    with _orchestrator_lock:
+        orchestrator, _orchestrator = _orchestrator, None
+    if orchestrator is not None:
+        orchestrator.close()
 
 
 class SubmitRequest(BaseModel):
     user_request: str = Field(..., min_length=1)
     context: Dict[str, Any] = Field(default_factory=dict)
+    fresh: bool = False
+
+
+class SubmitBatchRequest(BaseModel):
+    items: List[SubmitRequest] = Field(..., min_length=1)
+    concurrency: Optional[int] = Field(default=None, ge=1)
 
 
 class ExecuteRequest(BaseModel):
@@ -25,16 +68,67 @@ class ExecuteRequest(BaseModel):
     action: Dict[str, Any]
 
 
+class PolicyEvaluateItem(BaseModel):
+    decision: str
+    context: Dict[str, Any] = Field(default_factory=dict)
+
+
+class PolicyEvaluateBatchRequest(BaseModel):
+    items: List[PolicyEvaluateItem] = Field(..., min_length=1)
+
+
 @router.post("/gate/submit", dependencies=[Depends(require_api_key)])
-def gate_submit(payload: SubmitRequest) -> Dict[str, Any]:
-    return orchestrator.run(user_request=payload.user_request, context=payload.context)
+async def gate_submit(
+    payload: SubmitRequest, orchestrator: "Orchestrator" = Depends(get_orchestrator)
+) -> Dict[str, Any]:
+    return await orchestrator.arun(
+        user_request=payload.user_request, context=payload.context, fresh=payload.fresh
+    )
+
+
+@router.post("/gate/submit_batch", dependencies=[Depends(require_api_key)])
+async def gate_submit_batch(
+    payload: SubmitBatchRequest, orchestrator: "Orchestrator" = Depends(get_orchestrator)
+) -> StreamingResponse:
+    async def lines() -> AsyncIterator[str]:
+        async for result in orchestrator.run_batch(
+            [item.model_dump() for item in payload.items], concurrency=payload.concurrency
+        ):
+            yield json.dumps(result, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 @router.post("/gate/execute", dependencies=[Depends(require_api_key)])
-def gate_execute(payload: ExecuteRequest) -> Dict[str, Any]:
-    result = orchestrator.execute(permit_id=payload.permit_id, action=payload.action)
+async def gate_execute(
+    payload: ExecuteRequest, orchestrator: "Orchestrator" = Depends(get_orchestrator)
+) -> Dict[str, Any]:
+    result = await orchestrator.aexecute(permit_id=payload.permit_id, action=payload.action)
     if result.get("status") == "REJECTED":
         from fastapi import HTTPException
 
         raise HTTPException(status_code=403, detail=result.get("reason", "rejected"))
     return result
+
+
+@router.get("/gate/stats", dependencies=[Depends(require_api_key)])
+def gate_stats(orchestrator: "Orchestrator" = Depends(get_orchestrator)) -> Dict[str, Any]:
+    return orchestrator.stats()
+
+
+@router.get("/llm/stats", dependencies=[Depends(require_api_key)])
+def llm_stats(orchestrator: "Orchestrator" = Depends(get_orchestrator)) -> Dict[str, Any]:
+    stats: Dict[str, Any] = orchestrator.llm.stats()
+    if orchestrator.decision_cache is not None:
+        stats["decision_cache"] = orchestrator.decision_cache.stats()
+    return stats
+
+
+@router.post("/policy/evaluate_batch", dependencies=[Depends(require_api_key)])
+def policy_evaluate_batch(
+    payload: PolicyEvaluateBatchRequest, orchestrator: "Orchestrator" = Depends(get_orchestrator)
+) -> Dict[str, Any]:
+    policy_tool = orchestrator.policy_tool
+    policy = policy_tool.snapshot()
+    results = policy_tool.evaluate_batch([(item.decision, item.context) for item in payload.items], policy=policy)
+    return {"policy_version": policy.version, "results": results}
@@ -1,6 +1,11 @@
+from typing import List
+
 from boa3.builtin import public, atoi
+from boa3.builtin.interop.crypto import sha256
 from boa3.builtin.storage import get, put
 
+BATCH_PREFIX = b"batch:"
+
 
 @public
 def register_permit(permit_id: str, decision_hash: bytes, issued_at: int, expires_at: int, policy_version: str) -> bool:
@@ -33,3 +38,64 @@ def is_valid(permit_id: str, decision_hash: bytes, now: int) -> bool:
     stored_hash = data[0]
     expires = atoi(data[3])
     return stored_hash == decision_hash and now <= expires
+
+
+@public
+def register_batch_root(batch_id: str, merkle_root: bytes, count: int, anchored_at: int) -> bool:
+    # One transaction anchors every permit of a batch; each permit proves its
+    # membership with a Merkle path (see is_valid_with_proof).
+    if len(get(BATCH_PREFIX + batch_id.encode())) != 0:
+        return False
+    put(BATCH_PREFIX + batch_id.encode(), merkle_root)
+    put(BATCH_PREFIX + batch_id.encode() + b"|meta", str(count).encode() + b"|" + str(anchored_at).encode())
+    return True
+
+
+@public
+def get_batch_root(batch_id: str) -> bytes:
+    return get(BATCH_PREFIX + batch_id.encode())
+
+
+@public
+def is_valid_with_proof(
+    permit_id: str,
+    decision_hash: bytes,
+    policy_version: str,
+    issued_at: int,
+    expires_at: int,
+    batch_id: str,
+    proof: List[bytes],
+    now: int,
+) -> bool:
+    """Counterpart of is_valid for batch-anchored permits.
+
+    Each proof step is one position byte (0x00: sibling on the left,
+    0x01: sibling on the right) followed by the 32-byte sibling hash. Leaves
+    and inner nodes use the 0x00 / 0x01 prefixes of spoon/merkle.py.
+    """
+    if now > expires_at:
+        return False
+    root = get(BATCH_PREFIX + batch_id.encode())
+    if len(root) == 0:
+        return False
+    record = (
+        permit_id.encode()
+        + b"|"
+        + decision_hash
+        + b"|"
+        + policy_version.encode()
+        + b"|"
+        + str(issued_at).encode()
+        + b"|"
+        + str(expires_at).encode()
+    )
+    node = sha256(b"\x00" + sha256(record))
+    for step in proof:
+        if len(step) != 33:
+            return False
+        sibling = step[1:]
+        if step[0] == 0:
+            node = sha256(b"\x01" + sibling + node)
+        else:
+            node = sha256(b"\x01" + node + sibling)
+    return node == root
@@ -0,0 +1,88 @@
+"""Benchmark AuditLogger.append throughput for a typical gate record.
+
+Usage: JSON_BACKEND=stdlib|orjson python scripts/bench_audit_append.py [--records 20000] [--threads 1,8]
+
+Records are buffered (STORAGE_DURABILITY=buffered) so the figure is dominated
+by encoding and hashing rather than by the disk. Run once per JSON_BACKEND to
+compare backends; run against an older checkout for the double-encoding
+baseline.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import spoon.config as config  # noqa: E402
+from spoon.audit import AuditLogger  # noqa: E402
+from spoon.tools.storage_tool import StorageTool  # noqa: E402
+
+RECORD = {
+    "request_id": "6f1c2a9e-3b7d-4c5e-9f10-2a3b4c5d6e7f",
+    "user_request": "Deploy the payment service update to production tonight",
+    "context": {"tools": ["policy_check", "notify"], "service": "payments", "window": "22:00-23:00"},
+    "explain_ref": "9f2b5c1d7e3a8b4c6d0e2f1a3b5c7d9e0f2a4b6c8d0e1f3a5b7c9d1e3f5a7b9c",
+    "decision_cached": False,
+    "stage": "pipeline",
+    "policy": {"ok": True, "violations": [], "required_human_approval": False, "risk_level": "LOW"},
+    "status": "APPROVED",
+    "final_status": "APPROVED",
+    "reason": None,
+    "permit": {
+        "permit_id": "0b8e6d1c-2f4a-4d3b-8c7e-1a2b3c4d5e6f",
+        "decision_hash": "5e884898da28047151d0e56f8dc6292773603d0d6aabbdd62a11ef721d1542d8",
+        "policy_version": "v1.0",
+        "risk_level": "LOW",
+        "issued_at": "2026-10-18T09:00:00+00:00",
+        "expires_at": "2026-10-18T09:05:00+00:00",
+        "neo_tx_hash": "MOCK_TX_0b8e6d1c2f4a4d3b8c7e1a2b",
+        "neo_mode": "mock",
+    },
+    "neo": {"tx_hash": "MOCK_TX_0b8e6d1c2f4a4d3b8c7e1a2b", "neo_mode": "mock", "rpc_url": ""},
+    "notify_status": "OK",
+    "notify_error": None,
+}
+
+
+def run(records: int, threads: int) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = StorageTool(tmp)
+        audit = AuditLogger(storage)
+        per_thread = records // threads
+
+        def worker() -> None:
+            for _ in range(per_thread):
+                audit.append(RECORD)
+
+        pool = [threading.Thread(target=worker) for _ in range(threads)]
+        started = time.perf_counter()
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+        elapsed = time.perf_counter() - started
+        storage.close("audit_log.jsonl")
+        return per_thread * threads / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--threads", default="1,8")
+    args = parser.parse_args()
+
+    object.__setattr__(config.SETTINGS, "storage_durability", "buffered")
+    object.__setattr__(config.SETTINGS, "audit_hmac_secret", "bench-secret")
+    object.__setattr__(config.SETTINGS, "audit_checkpoint_every", 10**9)
+    backend = os.getenv("JSON_BACKEND", "auto")
+    run(min(args.records, 1000), 1)  # warm-up
+    for threads in (int(t) for t in args.threads.split(",")):
+        rate = run(args.records, threads)
+        print(f"backend={backend:<7} threads={threads:<3} {rate:12,.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
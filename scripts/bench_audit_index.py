@@ -0,0 +1,106 @@
+"""Benchmark /gate/execute latency against audit logs of increasing size.
+
+Usage: python scripts/bench_audit_index.py [--sizes 10000,100000,1000000,10000000]
+
+Each size gets a fresh data dir filled with synthetic audit records and one
+real permit in the middle of the log. The first logger start pays the one-off
+index build; execute latency is then measured with the index in place.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spoon.audit import AuditLogger  # noqa: E402
+from spoon.orchestrator import Orchestrator  # noqa: E402
+from spoon.permit import PermitIssuer  # noqa: E402
+from spoon.status import APPROVED  # noqa: E402
+from spoon.tools.storage_tool import StorageTool  # noqa: E402
+
+import spoon.config as config  # noqa: E402
+
+EXPLAIN = {
+    "decision": "Deploy",
+    "rationale": ["ok"],
+    "assumptions": ["ok"],
+    "risks": [{"risk": "Risk", "severity": "LOW", "mitigation": "Mitigate"}],
+    "alternatives": [{"option": "Alt", "why_not": "Slower"}],
+}
+
+
+def _fill(path: str, count: int) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        batch = []
+        for i in range(count):
+            batch.append(
+                json.dumps(
+                    {
+                        "request_id": f"req-{i}",
+                        "permit": {"permit_id": f"filler-{i}"},
+                        "status": APPROVED,
+                        "hash": f"{i:064x}",
+                    }
+                )
+                + "\n"
+            )
+            if len(batch) >= 10000:
+                f.write("".join(batch))
+                batch = []
+        f.write("".join(batch))
+
+
+def bench(size: int, rounds: int, policy_path: str) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = StorageTool(tmp)
+        log_path = os.path.join(tmp, "audit_log.jsonl")
+        _fill(log_path, size // 2)
+        permit = PermitIssuer(storage, ttl_seconds=3600).issue(
+            explain_payload=EXPLAIN,
+            policy_version="v1.0",
+            risk_level="LOW",
+            neo_tx_hash="MOCK_TX",
+            permit_id="bench-permit",
+        )
+        storage.append_jsonl("permits.jsonl", permit.to_dict())
+        AuditLogger(storage).append({"permit": permit.to_dict(), "explain": EXPLAIN, "status": APPROVED})
+        _fill(log_path, size - size // 2)
+
+        started = time.perf_counter()
+        orch = Orchestrator(policy_path=policy_path, data_dir=tmp)
+        startup = time.perf_counter() - started
+
+        samples = []
+        for _ in range(rounds):
+            t0 = time.perf_counter()
+            result = orch.execute("bench-permit", action={"tool": "unknown"})
+            samples.append(time.perf_counter() - t0)
+        assert result["reason"] == "unknown tool", result
+
+        samples.sort()
+        print(
+            f"entries={size:>10}  index_build={startup:8.2f}s  "
+            f"execute p50={statistics.median(samples) * 1e3:7.3f}ms  "
+            f"p99={samples[int(len(samples) * 0.99) - 1] * 1e3:7.3f}ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    object.__setattr__(config.SETTINGS, "audit_hmac_secret", "bench-secret")
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    policy_path = os.path.join(base_dir, "policies", "policy.json")
+    for size in (int(s) for s in args.sizes.split(",")):
+        bench(size, args.rounds, policy_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Benchmark API cold start: import time and time to first /health and /ready byte.
+
+Usage: python scripts/bench_cold_start.py [--runs 3] [--records 50000] [--port 8765]
+
+The data directory is seeded with --records audit records and permits so the
+start-up cost of reading them shows. "import" is the wall time of importing
+apps.api.main in a fresh interpreter; "health" and "ready" are the times from
+spawning uvicorn to the first successful response from each endpoint (/ready
+with GATE_WARMUP=1; it is 404 on builds without it).
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import spoon.config as config  # noqa: E402
+from spoon.audit import AuditLogger  # noqa: E402
+from spoon.permit import Permit  # noqa: E402
+from spoon.tools.storage_tool import StorageTool  # noqa: E402
+
+_IMPORT = "import time; t = time.perf_counter(); import apps.api.main; print(time.perf_counter() - t)"
+
+
+def _seed(data_dir: str, records: int) -> None:
+    object.__setattr__(config.SETTINGS, "storage_durability", "buffered")
+    object.__setattr__(config.SETTINGS, "audit_hmac_secret", "bench-secret")
+    storage = StorageTool(data_dir)
+    audit = AuditLogger(storage)
+    issued = datetime.now(timezone.utc)
+    for _ in range(records):
+        permit = Permit(
+            permit_id=str(uuid.uuid4()),
+            decision_hash="ab" * 32,
+            policy_version="v1.0",
+            risk_level="LOW",
+            issued_at=issued,
+            expires_at=issued + timedelta(seconds=300),
+            neo_tx_hash="MOCK_TX",
+        )
+        storage.append_jsonl("permits.jsonl", permit.to_dict())
+        audit.append({"request_id": str(uuid.uuid4()), "status": "APPROVED", "permit": permit.to_dict()})
+    storage.close("permits.jsonl")
+    storage.close("audit_log.jsonl")
+
+
+def _first_ok(url: str, deadline: float) -> Optional[float]:
+    while time.perf_counter() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return time.perf_counter()
+        except urllib.error.HTTPError as exc:
+            if exc.code == 404:
+                return None
+        except OSError:
+            pass
+        time.sleep(0.01)
+    return None
+
+
+def _serve_once(env: Dict[str, str], port: int) -> Dict[str, Optional[float]]:
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "apps.api.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT,
+        env=env,
+    )
+    try:
+        base = f"http://127.0.0.1:{port}"
+        health = _first_ok(f"{base}/health", started + 60)
+        ready = _first_ok(f"{base}/ready", started + 60)
+    finally:
+        proc.terminate()
+        proc.wait(30)
+    return {
+        "health": None if health is None else health - started,
+        "ready": None if ready is None else ready - started,
+    }
+
+
+def _fmt(samples) -> str:
+    samples = [s for s in samples if s is not None]
+    return f"{statistics.median(samples) * 1e3:9.1f}ms" if samples else "      n/a"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--records", type=int, default=50000)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        _seed(data_dir, args.records)
+        env = dict(
+            os.environ,
+            DATA_DIR=data_dir,
+            POLICY_PATH=os.path.join(ROOT, "policies", "policy.json"),
+            AUDIT_HMAC_SECRET="bench-secret",
+            GATE_WARMUP="1",
+            OLLAMA_HEALTH_INTERVAL="0",
+        )
+        imports = [
+            float(subprocess.run([sys.executable, "-c", _IMPORT], cwd=ROOT, env=env, check=True,
+                                 capture_output=True, text=True).stdout.strip().splitlines()[-1])
+            for _ in range(args.runs)
+        ]
+        serves = [_serve_once(env, args.port) for _ in range(args.runs)]
+    print(
+        f"records={args.records:<8} import={_fmt(imports)} "
+        f"health={_fmt(s['health'] for s in serves)} ready={_fmt(s['ready'] for s in serves)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark validate_explain_payload against the bundled explain schema.
+
+Usage: python scripts/bench_explain_validate.py [--iterations 20000]
+
+Validates a typical valid payload and an invalid one (every error is collected,
+so the invalid case walks the whole payload too). Run against an older checkout
+for the per-call schema loading baseline.
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from spoon.validators import ExplainValidationError, validate_explain_payload  # noqa: E402
+
+SCHEMA = os.path.join(ROOT, "schemas", "explain.schema.json")
+
+VALID = {
+    "decision": "Deploy the payment service update during the maintenance window",
+    "rationale": ["Fixes the retry storm seen last week", "Change is behind a feature flag"],
+    "assumptions": ["Maintenance window is approved", "Rollback script is tested"],
+    "risks": [
+        {"risk": "Elevated error rate", "severity": "MEDIUM", "mitigation": "Watch dashboards for 30 minutes"},
+        {"risk": "Data migration stalls", "severity": "HIGH", "mitigation": "Run the migration in batches"},
+    ],
+    "alternatives": [
+        {"option": "Wait a week", "why_not": "Keeps the retry storm in production"},
+        {"option": "Hotfix only the client", "why_not": "Does not fix the server-side cause"},
+    ],
+}
+
+INVALID = dict(
+    VALID,
+    rationale=[],
+    risks=[{"risk": "Data loss", "severity": "CRITICAL", "mitigation": ""}],
+    alternatives=[{"option": "", "why_not": "n/a"}],
+)
+
+
+def _rate(payload, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        try:
+            validate_explain_payload(payload, schema_path=SCHEMA)
+        except ExplainValidationError:
+            pass
+        except Exception:  # older trees let jsonschema's own error escape
+            pass
+    return iterations / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    _rate(VALID, 100)  # warm-up
+    for label, payload in (("valid", VALID), ("invalid", INVALID)):
+        print(f"{label:<8} {_rate(payload, args.iterations):12,.0f} validations/s")
+
+
+if __name__ == "__main__":
+    main()
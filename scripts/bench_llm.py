@@ -0,0 +1,89 @@
+"""Benchmark SpoonLLM round trips against a local fake Ollama server.
+
+Usage: python scripts/bench_llm.py [--requests 400] [--concurrency 1,16,64] [--delay-ms 20]
+
+"per-call" is the previous behaviour (initialize the provider before every
+chat and clean it up afterwards); "pooled" is the current long-lived provider
+with OLLAMA_MAX_CONCURRENCY slots. Reports p50/p99 latency and throughput.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+from fake_ollama import serve  # noqa: E402
+from spoon.llm import Message, OllamaProvider, SpoonLLM  # noqa: E402
+
+
+class PerCallLLM(SpoonLLM):
+    async def _chat(self, system: str, user: str) -> str:
+        provider = OllamaProvider()
+        await provider.initialize(
+            {"api_key": "ollama", "model": self.model, "base_url": self.base_url, "timeout": self.timeout}
+        )
+        try:
+            response = await provider.chat(
+                [Message(role="system", content=system), Message(role="user", content=user)]
+            )
+        finally:
+            await provider.cleanup()
+        return response.content
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * pct / 100), len(ordered) - 1)]
+
+
+async def _drive(llm: SpoonLLM, requests: int, concurrency: int) -> List[float]:
+    latencies: List[float] = []
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with gate:
+            started = time.perf_counter()
+            await llm.agenerate("You are a decision agent.", f"Request {i}")
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", default="1,16,64")
+    parser.add_argument("--delay-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    server, url = serve(delay_ms=args.delay_ms)
+    os.environ["OLLAMA_BASE_URL"] = url
+    try:
+        for concurrency in (int(c) for c in args.concurrency.split(",")):
+            for label, cls in (("per-call", PerCallLLM), ("pooled", SpoonLLM)):
+                llm = cls(max_concurrency=max(concurrency, 1))
+                asyncio.run(_drive(llm, min(concurrency, 4), concurrency))  # warm-up
+                started = time.perf_counter()
+                latencies = asyncio.run(_drive(llm, args.requests, concurrency))
+                elapsed = time.perf_counter() - started
+                llm.close()
+                print(
+                    f"concurrency={concurrency:<4} {label:<9} "
+                    f"p50={_percentile(latencies, 50) * 1e3:8.2f}ms "
+                    f"p99={_percentile(latencies, 99) * 1e3:8.2f}ms "
+                    f"mean={statistics.fmean(latencies) * 1e3:8.2f}ms "
+                    f"{args.requests / elapsed:8.1f} req/s"
+                )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark SpoonLLM over one fake Ollama backend vs a pool of them.
+
+Usage: python scripts/bench_llm_pool.py [--requests 400] [--backends 3] [--concurrency 64] [--delay-ms 20] [--slots 4]
+
+Each fake backend answers after --delay-ms and SpoonLLM allows --slots chats
+per backend (OLLAMA_MAX_CONCURRENCY), so one backend caps throughput at about
+slots / delay. "pool-one-slow" adds five times the delay on the first backend
+to show least-outstanding routing steering around it.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+from fake_ollama import serve  # noqa: E402
+from spoon.llm import SpoonLLM  # noqa: E402
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * pct / 100), len(ordered) - 1)]
+
+
+async def _drive(llm: SpoonLLM, requests: int, concurrency: int) -> List[float]:
+    latencies: List[float] = []
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with gate:
+            started = time.perf_counter()
+            await llm.agenerate("You are a decision agent.", f"Request {i}")
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--backends", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--delay-ms", type=float, default=20.0)
+    parser.add_argument("--slots", type=int, default=4)
+    args = parser.parse_args()
+
+    os.environ["OLLAMA_HEALTH_INTERVAL"] = "0"
+    servers = [serve(delay_ms=args.delay_ms) for _ in range(args.backends)]
+    urls = [url for _, url in servers]
+    try:
+        for label, backend_urls, slow in (
+            ("single", urls[:1], False),
+            ("pool", urls, False),
+            ("pool-one-slow", urls, True),
+        ):
+            servers[0][0].RequestHandlerClass.delay = args.delay_ms * (5 if slow else 1) / 1000.0
+            llm = SpoonLLM(max_concurrency=args.slots, base_urls=backend_urls)
+            asyncio.run(_drive(llm, len(backend_urls) * args.slots, args.concurrency))  # warm-up
+            started = time.perf_counter()
+            latencies = asyncio.run(_drive(llm, args.requests, args.concurrency))
+            elapsed = time.perf_counter() - started
+            share = "/".join(str(b["completed"]) for b in llm.stats()["backends"])
+            llm.close()
+            print(
+                f"{label:<14} backends={len(backend_urls):<2} "
+                f"p50={_percentile(latencies, 50) * 1e3:8.2f}ms "
+                f"p99={_percentile(latencies, 99) * 1e3:8.2f}ms "
+                f"mean={statistics.fmean(latencies) * 1e3:8.2f}ms "
+                f"{args.requests / elapsed:8.1f} req/s  completed={share}"
+            )
+    finally:
+        for server, _ in servers:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Benchmark real-mode Neo writes: in-process JSON-RPC client vs the neoxp subprocess.
+
+Usage: python scripts/bench_neo_rpc.py [--writes 200] [--delay-ms 2] [--neoxp CMD]
+
+Both paths run NeoTool._write_real against a local fake Neo RPC node. Without
+--neoxp (or a neoxp on PATH) the subprocess path spawns a small Python stand-in
+that does one RPC round trip and prints a tx hash; it measures process start-up
+plus output scraping and is a lower bound for the real .NET CLI.
+"""
+import argparse
+import os
+import shutil
+import stat
+import statistics
+import sys
+import tempfile
+import time
+from typing import List
+
+import base58
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+from fake_neo_rpc import serve  # noqa: E402
+import spoon.config as config  # noqa: E402
+from spoon.tools.neo_tool import NeoTool  # noqa: E402
+from spoon.tools.storage_tool import StorageTool  # noqa: E402
+
+WIF = base58.b58encode_check(b"\x80" + b"\x01" * 32 + b"\x01").decode("ascii")
+
+_STAND_IN = """#!{python}
+import json, sys, urllib.request
+url = sys.argv[sys.argv.index("--rpc") + 1]
+body = json.dumps({{"jsonrpc": "2.0", "id": 1, "method": "getblockcount", "params": []}}).encode()
+urllib.request.urlopen(urllib.request.Request(url, body, {{"Content-Type": "application/json"}})).read()
+print("Transaction 0x" + "00" * 32 + " submitted")
+"""
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * pct / 100), len(ordered) - 1)]
+
+
+def _drive(tool: NeoTool, writes: int) -> List[float]:
+    latencies: List[float] = []
+    for i in range(writes):
+        started = time.perf_counter()
+        tool._write_real(f"permit-{i}", "cd" * 32, "v1", 1, 2)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--writes", type=int, default=200)
+    parser.add_argument("--delay-ms", type=float, default=2.0)
+    parser.add_argument("--neoxp", default="")
+    args = parser.parse_args()
+
+    server, url = serve(delay_ms=args.delay_ms)
+    for name, value in (
+        ("neo_rpc_url", url),
+        ("neo_wif", WIF),
+        ("neo_contract_hash", "0x" + "ab" * 20),
+        ("neo_simulate", False),
+    ):
+        object.__setattr__(config.SETTINGS, name, value)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        neoxp = args.neoxp or shutil.which("neoxp")
+        if not neoxp:
+            neoxp = os.path.join(tmp, "neoxp-stand-in")
+            with open(neoxp, "w", encoding="utf-8") as f:
+                f.write(_STAND_IN.format(python=sys.executable))
+            os.chmod(neoxp, os.stat(neoxp).st_mode | stat.S_IEXEC)
+        os.environ["NEO_EXPRESS_CMD"] = neoxp
+
+        try:
+            for label in ("neoxp", "rpc"):
+                object.__setattr__(config.SETTINGS, "neo_client", label)
+                tool = NeoTool(StorageTool(os.path.join(tmp, label)))
+                writes = args.writes if label == "rpc" else max(args.writes // 10, 10)
+                _drive(tool, 3)  # warm-up
+                started = time.perf_counter()
+                latencies = _drive(tool, writes)
+                elapsed = time.perf_counter() - started
+                tool.close()
+                print(
+                    f"{label:<6} writes={writes:<5} "
+                    f"p50={_percentile(latencies, 50) * 1e3:8.2f}ms "
+                    f"p99={_percentile(latencies, 99) * 1e3:8.2f}ms "
+                    f"mean={statistics.fmean(latencies) * 1e3:8.2f}ms "
+                    f"{writes / elapsed:8.1f} writes/s"
+                )
+        finally:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
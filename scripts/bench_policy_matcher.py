@@ -0,0 +1,85 @@
+"""Benchmark policy pattern matching: per-rule substring loop vs one automaton.
+
+Usage: python scripts/bench_policy_matcher.py [--patterns 10,1000,10000,100000] [--sizes 1024,102400,1048576]
+
+"loop" is the previous PolicyTool.execute strategy (``p in lowered`` for
+every pattern of every rule); "automaton" is PolicyTool's compiled matcher.
+Loop runs whose estimated cost is far beyond the automaton's are skipped.
+"""
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spoon.policy import compile_policy, evaluate  # noqa: E402
+
+
+def _policy(pattern_count: int, rng: random.Random):
+    per_rule = max(pattern_count // 10, 1)
+    rules = []
+    for r in range(max(min(pattern_count, 10), 1)):
+        patterns = [
+            "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(6, 14)))
+            for _ in range(per_rule)
+        ]
+        rules.append({"id": f"r{r}", "type": "blocklist", "patterns": patterns, "message": f"rule {r}"})
+    return {"version": "bench", "rules": rules, "registered_tools": []}
+
+
+def _text(size: int, rng: random.Random) -> str:
+    words = []
+    length = 0
+    while length < size:
+        word = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 9)))
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)[:size]
+
+
+def _loop(raw, text: str):
+    lowered = text.lower()
+    return [rule["id"] for rule in raw["rules"] if any(p.lower() in lowered for p in rule["patterns"])]
+
+
+def _time(fn, budget: float = 1.0) -> float:
+    runs = 0
+    started = time.perf_counter()
+    while True:
+        fn()
+        runs += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= budget or runs >= 1000:
+            return elapsed / runs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--patterns", default="10,1000,10000,100000")
+    parser.add_argument("--sizes", default="1024,102400,1048576")
+    args = parser.parse_args()
+    rng = random.Random(1)
+
+    for pattern_count in (int(p) for p in args.patterns.split(",")):
+        raw = _policy(pattern_count, rng)
+        started = time.perf_counter()
+        policy = compile_policy(raw)
+        compile_s = time.perf_counter() - started
+        print(f"patterns={pattern_count:<7} compile={compile_s * 1e3:9.1f}ms")
+        for size in (int(s) for s in args.sizes.split(",")):
+            text = _text(size, rng)
+            automaton = _time(lambda: evaluate(policy, text, {}))
+            line = f"  input={size:>8}B  automaton={automaton * 1e3:10.3f}ms"
+            if pattern_count * size <= 2_000_000_000:
+                loop = _time(lambda: _loop(raw, text))
+                line += f"  loop={loop * 1e3:10.3f}ms  speedup={loop / automaton:7.1f}x"
+            else:
+                line += "  loop=skipped"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark per-request gate latency with notification and audit writes on and off the critical path.
+
+Usage: python scripts/bench_side_effects.py [--requests 500] [--durability flush,fsync] [--llm-ms 5]
+
+The LLM decision is stubbed with an --llm-ms sleep (the time background work
+gets to run in a real deployment) and explain returns a fixed payload. Modes:
+"sync" writes the notification and audit record before returning (the default);
+"notify-async" hands notifications to the background dispatcher (NOTIFY_ASYNC=1);
+"all-async" also moves the audit append to the writer thread (AUDIT_ASYNC=1,
+GATTEN_STRICT=0). Reports p50/p99/mean latency and the mean saved per request.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import spoon.config as config  # noqa: E402
+from spoon.orchestrator import Orchestrator  # noqa: E402
+
+EXPLAIN = {
+    "decision": "Deploy the update during the maintenance window",
+    "rationale": ["Low traffic", "Rollback tested"],
+    "assumptions": ["Target system is reachable"],
+    "risks": [{"risk": "Brief latency spike", "severity": "LOW", "mitigation": "Canary first"}],
+    "alternatives": [{"option": "Wait a week", "why_not": "Security fix is due"}],
+}
+
+MODES: Dict[str, Dict[str, bool]] = {
+    "sync": {"notify_async": False, "audit_async": False, "strict_mode": True},
+    "notify-async": {"notify_async": True, "audit_async": False, "strict_mode": True},
+    "all-async": {"notify_async": True, "audit_async": True, "strict_mode": False},
+}
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * pct / 100), len(ordered) - 1)]
+
+
+async def _drive(orch: Orchestrator, requests: int, offset: int) -> List[float]:
+    latencies: List[float] = []
+    for i in range(requests):
+        started = time.perf_counter()
+        await orch.arun(f"Deploy service {offset + i}", {"service": "payments"})
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def run(mode: str, durability: str, requests: int, llm_ms: float) -> List[float]:
+    object.__setattr__(config.SETTINGS, "storage_durability", durability)
+    for name, value in MODES[mode].items():
+        object.__setattr__(config.SETTINGS, name, value)
+    with tempfile.TemporaryDirectory() as tmp:
+        orch = Orchestrator(policy_path=os.path.join(ROOT, "policies", "policy.json"), data_dir=tmp)
+
+        async def decide(user_request, context, request_id="", fresh=False):
+            await asyncio.sleep(llm_ms / 1000.0)
+            return {"draft_decision": EXPLAIN["decision"], "context": context}
+
+        orch.decision_agent.arun = decide
+        orch.explain_agent.run = lambda user_request, draft_decision, context: dict(EXPLAIN)
+        try:
+            asyncio.run(_drive(orch, 20, 10**6))  # warm-up
+            return asyncio.run(_drive(orch, requests, 0))
+        finally:
+            orch.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--durability", default="flush,fsync")
+    parser.add_argument("--llm-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    object.__setattr__(config.SETTINGS, "audit_hmac_secret", "bench-secret")
+    object.__setattr__(config.SETTINGS, "gate_coalesce", False)
+    for durability in args.durability.split(","):
+        baseline = None
+        for mode in MODES:
+            latencies = run(mode, durability, args.requests, args.llm_ms)
+            mean = statistics.fmean(latencies)
+            baseline = mean if baseline is None else baseline
+            print(
+                f"durability={durability:<6} {mode:<13} "
+                f"p50={_percentile(latencies, 50) * 1e3:7.3f}ms "
+                f"p99={_percentile(latencies, 99) * 1e3:7.3f}ms "
+                f"mean={mean * 1e3:7.3f}ms saved={(baseline - mean) * 1e3:7.3f}ms/request"
+            )
+
+
+if __name__ == "__main__":
+    main()
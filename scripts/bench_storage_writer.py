@@ -0,0 +1,70 @@
+"""Benchmark StorageTool.append_jsonl throughput at each durability level.
+
+Usage: python scripts/bench_storage_writer.py [--records 20000] [--threads 1,8]
+
+"open-per-append" is the previous behaviour (open, write, close per record),
+kept as the baseline.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spoon.tools.storage_tool import StorageTool  # noqa: E402
+
+RECORD = {
+    "request_id": "00000000-0000-0000-0000-000000000000",
+    "status": "APPROVED",
+    "policy": {"ok": True, "violations": [], "risk_level": "LOW"},
+    "reason": None,
+}
+
+
+def _open_per_append(base_dir: str, filename: str, payload) -> None:
+    with open(os.path.join(base_dir, filename), "a", encoding="utf-8") as f:
+        f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+
+
+def run(level: str, records: int, threads: int) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = StorageTool(tmp)
+        per_thread = records // threads
+
+        def worker() -> None:
+            for _ in range(per_thread):
+                if level == "open-per-append":
+                    _open_per_append(tmp, "bench.jsonl", RECORD)
+                else:
+                    storage.append_jsonl("bench.jsonl", RECORD, durability=level)
+
+        pool = [threading.Thread(target=worker) for _ in range(threads)]
+        started = time.perf_counter()
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+        storage.close("bench.jsonl")
+        elapsed = time.perf_counter() - started
+        return per_thread * threads / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--threads", default="1,8")
+    args = parser.parse_args()
+
+    for threads in (int(t) for t in args.threads.split(",")):
+        for level in ("open-per-append", "buffered", "flush", "fsync"):
+            records = args.records if level != "fsync" else max(args.records // 10, threads)
+            rate = run(level, records, threads)
+            print(f"threads={threads:<3} durability={level:<16} {rate:12,.0f} appends/s")
+
+
+if __name__ == "__main__":
+    main()
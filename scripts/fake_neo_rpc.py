@@ -0,0 +1,127 @@
+"""Minimal stand-in for a Neo N3 JSON-RPC node, for tests and benchmarks.
+
+Usage: python scripts/fake_neo_rpc.py [--port 50012] [--delay-ms 2]
+
+Implements the calls NeoRpcClient makes: getversion, getblockcount,
+invokescript (HALT with a true result unless ``server.fault`` is set),
+calculatenetworkfee and sendrawtransaction. Sent transactions are decoded and
+their witness signature is checked against the network magic before the hash
+is returned; accepted transactions are kept in ``server.transactions`` and
+``server.connections`` counts the TCP connections opened.
+"""
+import argparse
+import base64
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List, Optional, Tuple
+
+from neo3.core import cryptography
+from neo3.network.payloads import transaction
+
+MAGIC = 894710606
+SYSTEM_FEE = 1_000_000
+NETWORK_FEE = 123_456
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.transactions: List[transaction.Transaction] = []
+        self.connections = 0
+        self.fault: Optional[str] = None
+        self.lock = threading.Lock()
+
+
+class _RpcError(Exception):
+    pass
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    delay = 0.0
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        pass
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def _getversion(self) -> Any:
+        return {"protocol": {"network": MAGIC, "maxvaliduntilblockincrement": 5760}}
+
+    def _getblockcount(self) -> Any:
+        return 1000
+
+    def _invokescript(self, script: str, signers: Any = None) -> Any:
+        base64.b64decode(script)
+        if self.server.fault:
+            return {"state": "FAULT", "gasconsumed": "0", "exception": self.server.fault, "stack": []}
+        return {"state": "HALT", "gasconsumed": str(SYSTEM_FEE), "stack": [{"type": "Boolean", "value": True}]}
+
+    def _calculatenetworkfee(self, raw: str) -> Any:
+        transaction.Transaction.deserialize_from_bytes(base64.b64decode(raw))
+        return {"networkfee": str(NETWORK_FEE)}
+
+    def _sendrawtransaction(self, raw: str) -> Any:
+        tx = transaction.Transaction.deserialize_from_bytes(base64.b64decode(raw))
+        message = MAGIC.to_bytes(4, "little") + tx.hash().to_array()
+        for witness in tx.witnesses:
+            # Single-sig: PUSHDATA1 64 <sig> / PUSHDATA1 33 <pubkey> SYSCALL CheckSig
+            signature, public_key = witness.invocation_script[2:], witness.verification_script[2:35]
+            if not cryptography.verify_signature(message, signature, public_key):
+                raise _RpcError("invalid signature")
+        with self.server.lock:
+            self.server.transactions.append(tx)
+        return {"hash": f"0x{tx.hash()}"}
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length", "0"))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        time.sleep(self.delay)
+        method = getattr(self, f"_{request.get('method')}", None)
+        try:
+            if method is None:
+                raise _RpcError(f"method not found: {request.get('method')}")
+            response = {"jsonrpc": "2.0", "id": request.get("id"), "result": method(*request.get("params", []))}
+        except Exception as exc:
+            response = {"jsonrpc": "2.0", "id": request.get("id"), "error": {"code": -500, "message": str(exc)}}
+        body = json.dumps(response).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def serve(host: str = "127.0.0.1", port: int = 0, delay_ms: float = 0.0) -> Tuple[_Server, str]:
+    """Start the fake node on a daemon thread and return it with its RPC URL."""
+    handler = type("Handler", (_Handler,), {"delay": delay_ms / 1000.0})
+    server = _Server((host, port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=50012)
+    parser.add_argument("--delay-ms", type=float, default=2.0)
+    args = parser.parse_args()
+    server, url = serve(args.host, args.port, args.delay_ms)
+    print(f"fake neo rpc listening on {url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
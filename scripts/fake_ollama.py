@@ -0,0 +1,111 @@
+"""Minimal stand-in for the Ollama HTTP API, for benchmarks and local runs.
+
+Usage: python scripts/fake_ollama.py [--port 11434] [--delay-ms 20]
+
+Answers POST /api/chat (streaming and non-streaming) and GET /api/tags after
+an artificial per-request delay that stands in for model latency. Setting
+``fail_status`` on the handler class (``server.RequestHandlerClass``) makes
+every request fail with that HTTP status, to simulate a broken backend.
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Tuple
+
+REPLY = "Deploy the update during the next maintenance window"
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    delay = 0.0
+    reply = REPLY
+    fail_status = 0
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        pass
+
+    def _send_json(self, payload) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # noqa: N802
+        if self.fail_status:
+            self.send_error(self.fail_status)
+        elif self.path == "/api/tags":
+            self._send_json({"models": [{"name": "tinyllama"}]})
+        else:
+            self.send_error(404)
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length", "0"))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        if self.path != "/api/chat":
+            self.send_error(404)
+            return
+        time.sleep(self.delay)
+        if self.fail_status:
+            self.send_error(self.fail_status)
+            return
+        model = request.get("model", "tinyllama")
+        if not request.get("stream", False):
+            self._send_json(
+                {
+                    "model": model,
+                    "message": {"role": "assistant", "content": self.reply},
+                    "done": True,
+                }
+            )
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        words = self.reply.split(" ")
+        chunks = [
+            {"model": model, "message": {"role": "assistant", "content": w + " "}, "done": False}
+            for w in words[:-1]
+        ]
+        chunks.append({"model": model, "message": {"role": "assistant", "content": words[-1]}, "done": True})
+        for chunk in chunks:
+            line = json.dumps(chunk).encode("utf-8") + b"\n"
+            self.wfile.write(f"{len(line):x}\r\n".encode("ascii") + line + b"\r\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+
+def serve(host: str = "127.0.0.1", port: int = 0, delay_ms: float = 0.0) -> Tuple[ThreadingHTTPServer, str]:
+    """Start the fake server on a daemon thread and return it with its base URL."""
+    handler = type("Handler", (_Handler,), {"delay": delay_ms / 1000.0})
+    server = _Server((host, port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11434)
+    parser.add_argument("--delay-ms", type=float, default=20.0)
+    args = parser.parse_args()
+    server, url = serve(args.host, args.port, args.delay_ms)
+    print(f"fake ollama listening on {url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -24,6 +24,7 @@ POLICY = {
         },
     ],
     "registered_tools": ["policy_check", "audit_store", "neo_write", "notify", "execution_guard"],
+    "accept_pending_low_risk": False,
 }
 
 
@@ -1,20 +1,108 @@
-from typing import Any, Dict
+import asyncio
+from contextlib import aclosing
+from typing import Any, Dict, List, Optional, Tuple
 
+from spoon.decision_cache import DecisionCache
 from spoon.llm import SpoonLLM
+from spoon.policy import CompiledPolicy, StreamScreen
 
 
 class DecisionAgent:
-    def __init__(self, llm: SpoonLLM) -> None:
+    def __init__(self, llm: SpoonLLM, cache: Optional[DecisionCache] = None) -> None:
         self.llm = llm
+        self.cache = cache
 
-    def run(self, user_request: str, context: Dict[str, Any], request_id: str = "") -> Dict[str, Any]:
+    def _prompts(self, user_request: str, context: Dict[str, Any]) -> Tuple[str, str]:
         system = "You are a decision agent. Produce a concise actionable decision." \
                  "Return plain text only."
         prompt = f"Request: {user_request}\nContext: {context}"
-        if request_id:
-            self.llm.set_request_id(request_id)
-        draft = self.llm.generate(system=system, user=prompt)
+        return system, prompt
+
+    def _cache_key(self, system: str, user_request: str, context: Dict[str, Any]) -> Optional[str]:
+        if self.cache is None:
+            return None
+        return DecisionCache.key(self.llm.model, system, user_request, context)
+
+    def _result(self, draft: str, context: Dict[str, Any], cached: bool) -> Dict[str, Any]:
         return {
             "draft_decision": draft.strip(),
             "context": context,
+            "cached": cached,
         }
+
+    def run(
+        self, user_request: str, context: Dict[str, Any], request_id: str = "", fresh: bool = False
+    ) -> Dict[str, Any]:
+        """Draft a decision. ``fresh`` skips the cache lookup (the new draft is still stored)."""
+        system, prompt = self._prompts(user_request, context)
+        key = self._cache_key(system, user_request, context)
+        if key is not None and not fresh:
+            draft = self.cache.get(key)
+            if draft is not None:
+                return self._result(draft, context, cached=True)
+        if request_id:
+            self.llm.set_request_id(request_id)
+        draft = self.llm.generate(system=system, user=prompt)
+        if key is not None:
+            self.cache.put(key, draft)
+        return self._result(draft, context, cached=False)
+
+    async def _acache_put(self, key: str, draft: str) -> None:
+        if self.cache.storage is None:
+            self.cache.put(key, draft)
+        else:
+            # A persisted cache appends to its file; keep that off the event loop.
+            await asyncio.to_thread(self.cache.put, key, draft)
+
+    async def arun(
+        self, user_request: str, context: Dict[str, Any], request_id: str = "", fresh: bool = False
+    ) -> Dict[str, Any]:
+        system, prompt = self._prompts(user_request, context)
+        key = self._cache_key(system, user_request, context)
+        if key is not None and not fresh:
+            draft = self.cache.get(key)
+            if draft is not None:
+                return self._result(draft, context, cached=True)
+        draft = await self.llm.agenerate(system=system, user=prompt, request_id=request_id or None)
+        if key is not None:
+            await self._acache_put(key, draft)
+        return self._result(draft, context, cached=False)
+
+    async def astream(
+        self,
+        user_request: str,
+        context: Dict[str, Any],
+        policy: CompiledPolicy,
+        request_id: str = "",
+        fresh: bool = False,
+    ) -> Dict[str, Any]:
+        """Like ``arun``, but screens the draft against ``policy`` while it streams.
+
+        On the first blocklist hit the generation is cancelled; the result then
+        has ``aborted`` set, the triggering ``violations`` and the partial draft.
+        Aborted drafts are not cached.
+        """
+        system, prompt = self._prompts(user_request, context)
+        key = self._cache_key(system, user_request, context)
+        if key is not None and not fresh:
+            draft = self.cache.get(key)
+            if draft is not None:
+                return self._result(draft, context, cached=True)
+
+        screen = StreamScreen(policy)
+        pieces: List[str] = []
+        violations: List[str] = []
+        async with aclosing(self.llm.astream(system=system, user=prompt, request_id=request_id or None)) as stream:
+            async for piece in stream:
+                pieces.append(piece)
+                violations = screen.feed(piece)
+                if violations:
+                    break
+        draft = "".join(pieces)
+        result = self._result(draft, context, cached=False)
+        if violations:
+            result["aborted"] = True
+            result["violations"] = violations
+        elif key is not None:
+            await self._acache_put(key, draft)
+        return result
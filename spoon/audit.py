@@ -1,76 +1,511 @@
 import hashlib
 import hmac
 import json
+import logging
 import os
+import queue
+import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+from spoon.audit_index import AuditIndex
 from spoon.config import SETTINGS
+from spoon.hashing import canonical_bytes
+from spoon.jsonl_writer import BUFFERED, FLUSH
+from spoon.merkle import merkle_proof, merkle_root, verify_proof
 from spoon.tools.storage_tool import StorageTool
 
+logger = logging.getLogger("gatten_gate.audit")
+
+_TAIL_BLOCK = 64 * 1024
+
+_PATH_LOCKS: Dict[str, threading.Lock] = {}
+_PATH_LOCKS_GUARD = threading.Lock()
+
+
+def _path_lock(path: str) -> threading.Lock:
+    # Loggers on the same file share one lock so their appends cannot interleave
+    # between reading the chain head and writing the next record.
+    with _PATH_LOCKS_GUARD:
+        return _PATH_LOCKS.setdefault(os.path.abspath(path), threading.Lock())
+
+
+class AuditIntegrityError(RuntimeError):
+    pass
+
+
+# Version 2 records hash their canonical bytes, which are also the bytes written.
+HASH_VERSION = 2
+
+
+def hash_body(payload: Dict[str, Any]) -> bytes:
+    """Bytes an audit record body (the record without hash and hmac) is hashed over."""
+    if payload.get("hash_v") == HASH_VERSION:
+        return canonical_bytes(payload)
+    # Records written before hash_v: sorted keys with json.dumps' default separators.
+    return json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8")
+
+
+def hash_entry(payload: Dict[str, Any], prev_hash: str) -> str:
+    return _hash_bytes(hash_body(payload), prev_hash)
+
+
+def _hash_bytes(body: bytes, prev_hash: str) -> str:
+    digest = hashlib.sha256()
+    digest.update(prev_hash.encode("utf-8"))
+    digest.update(body)
+    return digest.hexdigest()
+
+
+def hmac_hex(secret: str, entry_hash: str) -> str:
+    return hmac.new(secret.encode("utf-8"), entry_hash.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def audit_durability() -> str:
+    """STORAGE_DURABILITY for audit appends; strict mode never leaves a record only buffered."""
+    if SETTINGS.strict_mode and SETTINGS.storage_durability == BUFFERED:
+        return FLUSH
+    return SETTINGS.storage_durability
+
+
+def segment_hash(prev_segment_hash: str, merkle_root_hex: str) -> str:
+    """Link a sealed segment's Merkle root to the segment before it."""
+    return hashlib.sha256((prev_segment_hash + merkle_root_hex).encode("utf-8")).hexdigest()
+
 
 class AuditLogger:
     def __init__(self, storage: StorageTool) -> None:
         self.storage = storage
         self._path = os.path.join(self.storage.base_dir, "audit_log.jsonl")
+        self._checkpoint_path = os.path.join(self.storage.base_dir, "audit_log.checkpoint.json")
+        self._segments_path = os.path.join(self.storage.base_dir, "audit_segments.jsonl")
+        self._lock = _path_lock(self._path)
+        self._since_checkpoint = 0
+        self._end = 0
+        self._seals: List[Dict[str, Any]] = []
+        self._seals_size = 0
+        self._segment_records = 0
+        self._load_seals()
+        self._finish_rotation()
         self._last_hash = self._load_last_hash()
+        self._index_obj: Optional[AuditIndex] = None
+        self._index_lock = threading.Lock()
+
+    @property
+    def _index(self) -> AuditIndex:
+        index = self._index_obj
+        if index is None:
+            with self._index_lock:
+                if self._index_obj is None:
+                    self._index_obj = AuditIndex(
+                        os.path.join(self.storage.base_dir, "audit_log.idx.jsonl"),
+                        self._segment_path,
+                        self._segment,
+                        flush=lambda: self.storage.flush("audit_log.jsonl"),
+                    )
+                index = self._index_obj
+        return index
+
+    @property
+    def index_loaded(self) -> bool:
+        return self._index_obj is not None
+
+    def load_index(self) -> None:
+        """Load and catch up the permit/request index now instead of on first use."""
+        self._index
+
+    @property
+    def _segment(self) -> int:
+        """Sequence number of the active segment, ``audit_log.jsonl``."""
+        return len(self._seals) + 1
+
+    def _sealed_path(self, segment: int) -> str:
+        return os.path.join(self.storage.base_dir, f"audit_log.{segment:06d}.jsonl")
+
+    def _segment_path(self, segment: int) -> str:
+        return self._path if segment == self._segment else self._sealed_path(segment)
+
+    def _load_seals(self) -> None:
+        self._seals = []
+        self._seals_size = 0
+        if not os.path.exists(self._segments_path):
+            return
+        with open(self._segments_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    self._seals.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        self._seals_size = os.path.getsize(self._segments_path)
+
+    def _sync_seals(self) -> bool:
+        size = os.path.getsize(self._segments_path) if os.path.exists(self._segments_path) else 0
+        if size == self._seals_size:
+            return False
+        # Another logger sealed a segment since we last looked.
+        self._load_seals()
+        return True
+
+    def _finish_rotation(self) -> None:
+        # A crash between renaming the active file and writing its seal leaves an
+        # unsealed segment file behind; seal it before accepting new records.
+        if os.path.exists(self._sealed_path(self._segment)):
+            self._write_seal(self._segment)
 
     def _load_last_hash(self) -> str:
+        """Recover the chain head from the end of the log in constant time."""
+        self.storage.flush("audit_log.jsonl")
         if not os.path.exists(self._path):
+            self._end = 0
+            self._segment_records = 0
+            return self._sealed_head()
+        self._repair_torn_tail()
+        self._end = os.path.getsize(self._path)
+        self._check_checkpoint()
+        if SETTINGS.audit_segment_records > 0:
+            # Bounded by the segment size, not by the size of the whole log.
+            self._segment_records = sum(1 for _ in self._iter_records(self._path))
+        record = self._read_last_record()
+        if record:
+            return record.get("hash", "")
+        return self._sealed_head()
+
+    def _sealed_head(self) -> str:
+        # An empty active segment continues the chain from the last sealed record.
+        if not self._seals:
             return ""
-        last = ""
-        with open(self._path, "r", encoding="utf-8") as f:
+        return self._seals[-1].get("last_hash") or ""
+
+    def _repair_torn_tail(self) -> None:
+        # A crash mid-write can leave a final line without its newline. Terminate it so
+        # the next record starts on its own line; readers already skip undecodable lines.
+        with open(self._path, "rb+") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                logger.warning("audit log %s ends with a torn line; terminating it", self._path)
+                f.write(b"\n")
+
+    def _read_last_record(self) -> Optional[Dict[str, Any]]:
+        with open(self._path, "rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            pending = b""
+            while pos > 0:
+                step = min(_TAIL_BLOCK, pos)
+                pos -= step
+                f.seek(pos)
+                lines = (f.read(step) + pending).split(b"\n")
+                # The first piece may be the tail of a longer line; finish it next round.
+                pending = lines[0] if pos > 0 else b""
+                complete = lines[1:] if pos > 0 else lines
+                for raw in reversed(complete):
+                    if not raw.strip():
+                        continue
+                    try:
+                        data = json.loads(raw)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(data, dict) and "hash" in data:
+                        return data
+        return None
+
+    def _check_checkpoint(self) -> None:
+        if not os.path.exists(self._checkpoint_path):
+            return
+        try:
+            with open(self._checkpoint_path, "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            logger.warning("unreadable audit checkpoint %s; ignoring", self._checkpoint_path)
+            return
+        segment = checkpoint.get("segment", 1)
+        offset = checkpoint.get("offset", -1)
+        path = self._segment_path(segment)
+        if segment < self._segment and not os.path.exists(path):
+            # The segment was archived; its seal still pins the chain.
+            return
+        size = os.path.getsize(path) if segment <= self._segment and os.path.exists(path) else 0
+        record = self._read_at(offset, segment) if 0 <= offset < size else None
+        if record is None or record.get("hash") != checkpoint.get("hash"):
+            message = f"audit log does not match checkpoint at segment {segment} offset {offset}"
+            if SETTINGS.strict_mode:
+                raise AuditIntegrityError(message)
+            logger.warning(message)
+
+    def _write_checkpoint(self, offset: int, entry_hash: str) -> None:
+        tmp_path = f"{self._checkpoint_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"segment": self._segment, "offset": offset, "hash": entry_hash, "timestamp": int(time.time())},
+                f,
+            )
+        os.replace(tmp_path, self._checkpoint_path)
+
+    def _iter_records(self, path: str) -> Iterator[Dict[str, Any]]:
+        with open(path, "rb") as f:
             for line in f:
-                if not line.strip():
-                    continue
+                if not line.endswith(b"\n"):
+                    break
                 try:
                     data = json.loads(line)
-                    last = data.get("hash", last)
                 except json.JSONDecodeError:
                     continue
-        return last
+                if isinstance(data, dict) and "hash" in data:
+                    yield data
+
+    def _write_seal(self, segment: int) -> None:
+        path = self._sealed_path(segment)
+        hashes = [record["hash"] for record in self._iter_records(path)]
+        root = merkle_root(hashes)
+        prev_segment_hash = self._seals[-1]["segment_hash"] if self._seals else ""
+        seal = {
+            "segment": segment,
+            "file": os.path.basename(path),
+            "count": len(hashes),
+            "first_hash": hashes[0] if hashes else None,
+            "last_hash": hashes[-1] if hashes else self._sealed_head(),
+            "merkle_root": root,
+            "prev_segment_hash": prev_segment_hash,
+            "segment_hash": segment_hash(prev_segment_hash, root),
+            "sealed_at": int(time.time()),
+        }
+        seal["hmac"] = self._sign(seal["segment_hash"])
+        self.storage.append_jsonl("audit_segments.jsonl", seal)
+        self._seals.append(seal)
+        self._seals_size = os.path.getsize(self._segments_path)
 
-    def _hash_entry(self, payload: Dict[str, Any], prev_hash: str) -> str:
-        digest = hashlib.sha256()
-        digest.update(prev_hash.encode("utf-8"))
-        digest.update(json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8"))
-        return digest.hexdigest()
+    def _rotate(self) -> None:
+        segment = self._segment
+        self.storage.close("audit_log.jsonl")
+        os.replace(self._path, self._sealed_path(segment))
+        self._write_seal(segment)
+        self._segment_records = 0
+        self._end = 0
 
     def _sign(self, entry_hash: str) -> Optional[str]:
         if SETTINGS.audit_hmac_secret:
-            return hmac.new(
-                SETTINGS.audit_hmac_secret.encode("utf-8"),
-                entry_hash.encode("utf-8"),
-                hashlib.sha256,
-            ).hexdigest()
+            return hmac_hex(SETTINGS.audit_hmac_secret, entry_hash)
         if SETTINGS.strict_mode and not SETTINGS.audit_allow_unsigned:
             raise RuntimeError("AUDIT_HMAC_SECRET is required in strict mode")
         return None
 
     def append(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        record = dict(payload)
-        record["timestamp"] = int(time.time())
-        record["prev_hash"] = self._last_hash
-        record["hash"] = self._hash_entry(record, self._last_hash)
-        record["hmac"] = self._sign(record["hash"])
-
-        self.storage.append_jsonl("audit_log.jsonl", record)
-        self._last_hash = record["hash"]
+        with self._lock:
+            if self._sync_seals() or self.storage.size("audit_log.jsonl") != self._end:
+                # Another logger wrote to the log since our last append; re-read the head.
+                self._last_hash = self._load_last_hash()
+
+            record = {k: v for k, v in payload.items() if k not in ("hash", "hmac")}
+            record["timestamp"] = int(time.time())
+            record["prev_hash"] = self._last_hash
+            record["hash_v"] = HASH_VERSION
+            # Encode once: the canonical body is hashed, then written with hash and
+            # hmac spliced in as the object's last members.
+            body = canonical_bytes(record)
+            record["hash"] = _hash_bytes(body, self._last_hash)
+            record["hmac"] = self._sign(record["hash"])
+            line = b"%s,\"hash\":\"%s\",\"hmac\":%s}\n" % (
+                body[:-1],
+                record["hash"].encode("ascii"),
+                b"null" if record["hmac"] is None else b'"%s"' % record["hmac"].encode("ascii"),
+            )
+
+            # Hash and buffer under the lock so file order is chain order; wait for
+            # durability after releasing it so concurrent appends share one flush/fsync.
+            writer = self.storage.writer("audit_log.jsonl")
+            offset, ticket = writer.write_line(line)
+            self._last_hash = record["hash"]
+            self._end = writer.end
+            self._segment_records += 1
+            self._since_checkpoint += 1
+            if self._since_checkpoint >= SETTINGS.audit_checkpoint_every:
+                writer.commit(ticket, audit_durability())
+                self._write_checkpoint(offset, record["hash"])
+                self._since_checkpoint = 0
+            self._index.add(self._segment, offset, self._end, record)
+            if 0 < SETTINGS.audit_segment_records <= self._segment_records:
+                self._rotate()
+        writer.commit(ticket, audit_durability())
         return record
 
+    def _read_at(self, offset: int, segment: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        path = self._segment_path(segment or self._segment)
+        try:
+            with open(path, "rb") as f:
+                f.seek(offset)
+                line = f.readline()
+        except FileNotFoundError:
+            return None
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _refresh(self) -> None:
+        self.storage.flush("audit_log.jsonl")
+        with self._lock:
+            if self._sync_seals():
+                self._last_hash = self._load_last_hash()
+        self._index.catch_up(self._segment)
+
+    def _locate(self, permit_id: str = "", request_id: str = "") -> Optional[Tuple[int, int, Dict[str, Any]]]:
+        self._refresh()
+        if permit_id:
+            location = self._index.permit_location(permit_id)
+        else:
+            location = self._index.request_location(request_id)
+        if location is None:
+            return None
+        segment, offset = location
+        data = self._read_at(offset, segment)
+        if data is None:
+            return None
+        if permit_id and ((data.get("permit") or {}).get("permit_id") != permit_id):
+            return None
+        if not permit_id and data.get("request_id") != request_id:
+            return None
+        return segment, offset, data
+
     def find_latest_by_permit_id(self, permit_id: str) -> Optional[Dict[str, Any]]:
-        if not os.path.exists(self._path):
+        found = self._locate(permit_id=permit_id)
+        if found:
+            return found[2]
+        if self._index.permit_location(permit_id) is None:
             return None
-        latest = None
-        with open(self._path, "r", encoding="utf-8") as f:
-            for line in f:
-                if not line.strip():
-                    continue
-                try:
-                    data = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
+        return self._scan_latest_by_permit_id(permit_id)
+
+    def find_latest_by_request_id(self, request_id: str) -> Optional[Dict[str, Any]]:
+        found = self._locate(request_id=request_id)
+        return found[2] if found else None
+
+    def _scan_latest_by_permit_id(self, permit_id: str) -> Optional[Dict[str, Any]]:
+        for segment in range(self._segment, 0, -1):
+            path = self._segment_path(segment)
+            if not os.path.exists(path):
+                continue
+            latest = None
+            for data in self._iter_records(path):
                 permit = data.get("permit") or {}
                 if permit.get("permit_id") == permit_id:
                     latest = data
-        return latest
+            if latest is not None:
+                return latest
+        return None
+
+    def inclusion_proof(self, permit_id: str = "", request_id: str = "") -> Optional[Dict[str, Any]]:
+        """Merkle inclusion proof for the latest record of a permit or request.
+
+        Sealed segments prove against their recorded root; the active segment
+        proves against the root of the records written so far.
+        """
+        found = self._locate(permit_id=permit_id, request_id=request_id)
+        if not found:
+            return None
+        segment, _, record = found
+        hashes = [data["hash"] for data in self._iter_records(self._segment_path(segment))]
+        leaf_index = hashes.index(record["hash"])
+        seal = self._seals[segment - 1] if segment <= len(self._seals) else None
+        return {
+            "segment": segment,
+            "sealed": seal is not None,
+            "leaf_index": leaf_index,
+            "record_hash": record["hash"],
+            "proof": merkle_proof(hashes, leaf_index),
+            "merkle_root": seal["merkle_root"] if seal else merkle_root(hashes),
+            "prev_segment_hash": seal["prev_segment_hash"] if seal else None,
+            "segment_hash": seal["segment_hash"] if seal else None,
+        }
+
+    @staticmethod
+    def verify_inclusion(proof: Dict[str, Any]) -> bool:
+        if not verify_proof(proof["record_hash"], proof["proof"], proof["merkle_root"]):
+            return False
+        if not proof.get("sealed"):
+            return True
+        return segment_hash(proof["prev_segment_hash"], proof["merkle_root"]) == proof["segment_hash"]
+
+
+class AuditWriter:
+    """Appends records to an ``AuditLogger`` from one worker thread, in submission order.
+
+    Records are appended as submitted; anything a reader needs before the
+    record lands (content-store payloads, the permit) must be written by the
+    caller first. At most ``max_queue`` records wait in memory: when the queue is full, or the writer is closed,
+    ``submit`` appends the record itself, so a disk that falls behind slows
+    requests down instead of growing the backlog. A queued record that fails to
+    append is logged and counted in ``stats``.
+    """
+
+    def __init__(
+        self,
+        audit_logger: AuditLogger,
+        max_queue: int = 1024,
+    ) -> None:
+        self.audit_logger = audit_logger
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=max(max_queue, 1))
+        self._lock = threading.Lock()
+        self._closed = False
+        self._written = 0
+        self._inline = 0
+        self._failed = 0
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    def offer(self, record: Dict[str, Any]) -> bool:
+        """Queue a record if there is room; returns False, without writing it, if not."""
+        with self._lock:
+            if self._closed:
+                return False
+            try:
+                self._queue.put_nowait(record)
+            except queue.Full:
+                return False
+            return True
+
+    def submit(self, record: Dict[str, Any]) -> bool:
+        """Queue a record; returns False if it was appended before returning instead."""
+        if self.offer(record):
+            return True
+        with self._lock:
+            self._inline += 1
+        self.audit_logger.append(record)
+        return False
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "queued": self._queue.qsize(),
+                "max_queue": self._queue.maxsize,
+                "written": self._written,
+                "inline": self._inline,
+                "failed": self._failed,
+            }
+
+    def _run(self) -> None:
+        while True:
+            record = self._queue.get()
+            if record is None:
+                return
+            try:
+                self.audit_logger.append(record)
+            except Exception:
+                logger.exception("AUDIT: async append failed request_id=%s", record.get("request_id"))
+                with self._lock:
+                    self._failed += 1
+            else:
+                with self._lock:
+                    self._written += 1
+
+    def close(self) -> None:
+        """Write what is queued and stop the worker."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(None)
+        self._thread.join()
@@ -0,0 +1,157 @@
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from spoon.jsonl_writer import get_writer, peek_writer
+
+Location = Tuple[int, int]
+
+
+class AuditIndex:
+    """Sidecar index: permit_id / request_id -> (segment, byte offset) of the latest audit record.
+
+    The index file is append-only JSONL. Each line records where one audit record
+    lives and the keys it carries, so loading it replays the mapping and the last
+    location tells where to resume scanning. Entries written before the log was
+    segmented have no ``segment`` and belong to segment 1.
+    """
+
+    def __init__(
+        self,
+        index_path: str,
+        segment_path: Callable[[int], str],
+        segment: int = 1,
+        flush: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self._index_path = index_path
+        self._segment_path = segment_path
+        self._flush = flush
+        self._lock = threading.Lock()
+        self._permits: Dict[str, Location] = {}
+        self._requests: Dict[str, Location] = {}
+        self._segment = 1
+        self._last_offset: Optional[int] = None
+        # End of the last indexed record when known; lets add() skip rescanning.
+        self._next: Optional[int] = None
+        self._load(segment)
+        self.catch_up(segment)
+
+    def _load(self, active_segment: int) -> None:
+        writer = peek_writer(self._index_path)
+        if writer is not None:
+            writer.flush()
+        if not os.path.exists(self._index_path):
+            return
+        with open(self._index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self._apply(entry)
+        if self._segment > active_segment or (
+            self._segment == active_segment
+            and self._last_offset is not None
+            and self._last_offset >= self._size(active_segment)
+        ):
+            # The audit log was replaced or truncated; the index no longer describes it.
+            self._permits.clear()
+            self._requests.clear()
+            self._segment = 1
+            self._last_offset = None
+            os.remove(self._index_path)
+
+    def _size(self, segment: int) -> int:
+        path = self._segment_path(segment)
+        return os.path.getsize(path) if os.path.exists(path) else 0
+
+    def _apply(self, entry: Dict[str, Any]) -> None:
+        offset = entry.get("offset")
+        if not isinstance(offset, int):
+            return
+        location = (entry.get("segment", 1), offset)
+        if entry.get("permit_id"):
+            self._permits[entry["permit_id"]] = location
+        if entry.get("request_id"):
+            self._requests[entry["request_id"]] = location
+        if location > (self._segment, -1 if self._last_offset is None else self._last_offset):
+            self._segment, self._last_offset = location
+
+    def _entry(self, segment: int, offset: int, record: Dict[str, Any]) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {"segment": segment, "offset": offset}
+        permit = record.get("permit") or {}
+        if isinstance(permit, dict) and permit.get("permit_id"):
+            entry["permit_id"] = permit["permit_id"]
+        if record.get("request_id"):
+            entry["request_id"] = record["request_id"]
+        return entry
+
+    def _write(self, entries: List[Dict[str, Any]]) -> None:
+        # Left buffered: anything lost in a crash is re-indexed from the audit log.
+        writer = get_writer(self._index_path)
+        for entry in entries:
+            writer.write(entry)
+
+    def _scan(self, stop: Optional[int] = None) -> None:
+        """Index complete records of the current segment after the last indexed offset."""
+        path = self._segment_path(self._segment)
+        if self._flush is not None:
+            self._flush()
+        if not os.path.exists(path):
+            return
+        entries: List[Dict[str, Any]] = []
+        with open(path, "rb") as f:
+            if self._last_offset is not None:
+                f.seek(self._last_offset)
+                f.readline()
+            self._next = f.tell()
+            while True:
+                offset = f.tell()
+                if stop is not None and offset >= stop:
+                    break
+                line = f.readline()
+                if not line.endswith(b"\n"):
+                    break
+                self._next = f.tell()
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                entry = self._entry(self._segment, offset, record)
+                self._apply(entry)
+                entries.append(entry)
+        self._write(entries)
+
+    def _advance(self, active_segment: int) -> None:
+        while self._segment < active_segment:
+            self._scan()
+            self._segment += 1
+            self._last_offset = None
+            self._next = 0
+
+    def catch_up(self, active_segment: int) -> None:
+        with self._lock:
+            self._advance(active_segment)
+            self._scan()
+
+    def add(self, segment: int, offset: int, end: int, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._advance(segment)
+            if self._last_offset is not None and offset <= self._last_offset:
+                return
+            if self._next != offset:
+                # Records from other writers sit between our last entry and this one.
+                self._scan(stop=offset)
+            entry = self._entry(segment, offset, record)
+            self._apply(entry)
+            self._write([entry])
+            self._next = end
+
+    def permit_location(self, permit_id: str) -> Optional[Location]:
+        return self._permits.get(permit_id)
+
+    def request_location(self, request_id: str) -> Optional[Location]:
+        return self._requests.get(request_id)
@@ -0,0 +1,273 @@
+"""End-to-end verifier for the audit log.
+
+Usage: python -m spoon.audit_verify [DATA_DIR] [--workers N] [--chunk-mb M]
+
+Each segment file is split into newline-aligned byte ranges, and the ranges
+are checked across a process pool. A worker recomputes every record hash,
+follows prev_hash links inside its range, and checks the HMAC. It returns only
+the range's boundary hashes and a capped list of errors. The parent streams
+those results in file order and stitches the boundaries together, so memory
+stays bounded by the number of workers, not by the size of the log. Segment
+seals are checked against a recomputed Merkle root and the seal chain.
+"""
+import argparse
+import hmac
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from spoon.audit import hash_entry, hmac_hex, segment_hash
+from spoon.merkle import merkle_root
+
+_MAX_ERRORS_PER_RANGE = 100
+
+
+@dataclass
+class RangeResult:
+    path: str
+    start: int
+    records: int = 0
+    torn: int = 0
+    first_prev_hash: Optional[str] = None
+    first_offset: Optional[int] = None
+    last_hash: Optional[str] = None
+    error_count: int = 0
+    errors: List[Tuple[int, str]] = field(default_factory=list)
+
+    def error(self, offset: int, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < _MAX_ERRORS_PER_RANGE:
+            self.errors.append((offset, message))
+
+
+def _lines(path: str, start: int, end: int) -> Iterator[Tuple[int, bytes]]:
+    """Yield (offset, line) for every line that starts inside [start, end)."""
+    with open(path, "rb") as f:
+        if start > 0:
+            f.seek(start - 1)
+            f.readline()
+        while True:
+            offset = f.tell()
+            if offset >= end:
+                return
+            line = f.readline()
+            if not line:
+                return
+            yield offset, line
+
+
+def verify_range(path: str, start: int, end: int, secret: str, allow_unsigned: bool) -> RangeResult:
+    result = RangeResult(path=path, start=start)
+    for offset, line in _lines(path, start, end):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            # A crash mid-write leaves a torn line that the logger terminates and skips.
+            result.torn += 1
+            continue
+        if not isinstance(record, dict) or "hash" not in record:
+            result.error(offset, "record has no hash")
+            continue
+
+        body = {k: v for k, v in record.items() if k not in ("hash", "hmac")}
+        prev_hash = record.get("prev_hash", "")
+        if hash_entry(body, prev_hash) != record["hash"]:
+            result.error(offset, "hash mismatch")
+        if result.last_hash is None:
+            result.first_prev_hash = prev_hash
+            result.first_offset = offset
+        elif prev_hash != result.last_hash:
+            result.error(offset, "prev_hash does not link to previous record")
+
+        signature = record.get("hmac")
+        if signature is None:
+            if not allow_unsigned:
+                result.error(offset, "record is unsigned")
+        elif not secret:
+            result.error(offset, "record is signed but no secret was given")
+        elif not hmac.compare_digest(signature, hmac_hex(secret, record["hash"])):
+            result.error(offset, "hmac mismatch")
+
+        result.last_hash = record["hash"]
+        result.records += 1
+    return result
+
+
+def verify_seal_root(path: str) -> Tuple[str, int, Optional[str], Optional[str]]:
+    hashes: List[str] = []
+    for _, line in _lines(path, 0, os.path.getsize(path)):
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(record, dict) and "hash" in record:
+            hashes.append(record["hash"])
+    return (
+        merkle_root(hashes),
+        len(hashes),
+        hashes[0] if hashes else None,
+        hashes[-1] if hashes else None,
+    )
+
+
+def _load_seals(data_dir: str) -> List[Dict[str, Any]]:
+    path = os.path.join(data_dir, "audit_segments.jsonl")
+    if not os.path.exists(path):
+        return []
+    seals = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                seals.append(json.loads(line))
+    return seals
+
+
+def _segment_files(data_dir: str, seals: List[Dict[str, Any]]) -> List[Tuple[Optional[Dict[str, Any]], str]]:
+    files = [(seal, os.path.join(data_dir, seal["file"])) for seal in seals]
+    files.append((None, os.path.join(data_dir, "audit_log.jsonl")))
+    return files
+
+
+def _ranges(path: str, chunk_size: int) -> Iterator[Tuple[int, int]]:
+    size = os.path.getsize(path)
+    for start in range(0, size, chunk_size):
+        yield start, min(start + chunk_size, size)
+
+
+class Report:
+    def __init__(self, out=sys.stdout) -> None:
+        self.out = out
+        self.records = 0
+        self.torn = 0
+        self.errors = 0
+
+    def error(self, where: str, message: str) -> None:
+        self.errors += 1
+        print(f"ERROR {where}: {message}", file=self.out)
+
+
+def verify(
+    data_dir: str,
+    secret: str = "",
+    allow_unsigned: bool = False,
+    workers: Optional[int] = None,
+    chunk_size: int = 64 * 1024 * 1024,
+    out=sys.stdout,
+) -> Report:
+    report = Report(out)
+    seals = _load_seals(data_dir)
+    files = _segment_files(data_dir, seals)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        root_futures = {
+            seal["segment"]: pool.submit(verify_seal_root, path)
+            for seal, path in files
+            if seal is not None and os.path.exists(path)
+        }
+        tasks = [
+            (path, start, end)
+            for _, path in files
+            if os.path.exists(path)
+            for start, end in _ranges(path, chunk_size)
+        ]
+        results = pool.map(
+            verify_range,
+            [t[0] for t in tasks],
+            [t[1] for t in tasks],
+            [t[2] for t in tasks],
+            [secret] * len(tasks),
+            [allow_unsigned] * len(tasks),
+        )
+
+        prev_segment_hash = ""
+        for seal in seals:
+            where = f"seal {seal['segment']}"
+            if seal.get("prev_segment_hash") != prev_segment_hash:
+                report.error(where, "seal does not link to previous seal")
+            if segment_hash(seal.get("prev_segment_hash", ""), seal.get("merkle_root", "")) != seal.get("segment_hash"):
+                report.error(where, "segment_hash mismatch")
+            if seal.get("hmac") is None:
+                if not allow_unsigned:
+                    report.error(where, "seal is unsigned")
+            elif not secret:
+                report.error(where, "seal is signed but no secret was given")
+            elif not hmac.compare_digest(seal["hmac"], hmac_hex(secret, seal["segment_hash"])):
+                report.error(where, "hmac mismatch")
+            prev_segment_hash = seal.get("segment_hash", "")
+
+        # Archived segments are skipped; their seals carry the chain across the gap.
+        position = {path: i for i, (_, path) in enumerate(files)}
+        last_hash: Optional[str] = None
+        current_path = None
+        for result in results:
+            if result.path != current_path:
+                i = position[result.path]
+                if i > 0 and not os.path.exists(files[i - 1][1]):
+                    last_hash = seals[i - 1].get("last_hash")
+                current_path = result.path
+            report.records += result.records
+            report.torn += result.torn
+            for offset, message in result.errors:
+                report.error(f"{os.path.basename(result.path)}:{offset}", message)
+            if result.error_count > len(result.errors):
+                report.errors += result.error_count - len(result.errors)
+                print(
+                    f"ERROR {os.path.basename(result.path)}: "
+                    f"{result.error_count - len(result.errors)} more errors in range starting at {result.start}",
+                    file=out,
+                )
+            if result.first_offset is not None:
+                if result.first_prev_hash != (last_hash or ""):
+                    report.error(
+                        f"{os.path.basename(result.path)}:{result.first_offset}",
+                        "prev_hash does not link to previous record",
+                    )
+                last_hash = result.last_hash
+
+        for seal in seals:
+            future = root_futures.get(seal["segment"])
+            if future is None:
+                continue
+            root, count, first_hash, seal_last_hash = future.result()
+            where = f"seal {seal['segment']}"
+            if root != seal.get("merkle_root"):
+                report.error(where, "merkle_root does not match segment records")
+            if count != seal.get("count") or first_hash != seal.get("first_hash"):
+                report.error(where, "seal does not match segment records")
+            if count and seal_last_hash != seal.get("last_hash"):
+                report.error(where, "seal last_hash does not match segment records")
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Verify the GATTEN audit log hash chain")
+    parser.add_argument("data_dir", nargs="?", default=os.getenv("DATA_DIR", "data"))
+    parser.add_argument("--workers", type=int, default=None, help="process pool size (default: CPU count)")
+    parser.add_argument("--chunk-mb", type=int, default=64, help="byte range per task")
+    parser.add_argument("--allow-unsigned", action="store_true", default=os.getenv("AUDIT_ALLOW_UNSIGNED", "0") == "1")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    report = verify(
+        args.data_dir,
+        secret=os.getenv("AUDIT_HMAC_SECRET", ""),
+        allow_unsigned=args.allow_unsigned,
+        workers=args.workers,
+        chunk_size=args.chunk_mb * 1024 * 1024,
+    )
+    elapsed = time.perf_counter() - started
+    print(
+        f"records={report.records} torn={report.torn} errors={report.errors} elapsed={elapsed:.2f}s",
+        file=sys.stderr,
+    )
+    sys.exit(1 if report.errors else 0)
+
+
+if __name__ == "__main__":
+    main()
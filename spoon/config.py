@@ -6,8 +6,25 @@ from dataclasses import dataclass
 class Settings:
     policy_path: str = os.getenv("POLICY_PATH", "policies/policy.json")
     data_dir: str = os.getenv("DATA_DIR", "data")
+    storage_durability: str = os.getenv("STORAGE_DURABILITY", "flush")
     api_key: str = os.getenv("GATTEN_API_KEY", "")
 
+    policy_batch_workers: int = int(os.getenv("POLICY_BATCH_WORKERS", "0"))
+    policy_batch_parallel_min: int = int(os.getenv("POLICY_BATCH_PARALLEL_MIN", "2000"))
+
+    llm_stream: bool = os.getenv("LLM_STREAM", "0") == "1"
+    gate_prescreen: bool = os.getenv("GATE_PRESCREEN", "1") == "1"
+    gate_coalesce: bool = os.getenv("GATE_COALESCE", "1") == "1"
+    gate_batch_concurrency: int = int(os.getenv("GATE_BATCH_CONCURRENCY", "32"))
+    gate_batch_decision_concurrency: int = int(os.getenv("GATE_BATCH_DECISION_CONCURRENCY", "8"))
+    gate_batch_neo_concurrency: int = int(os.getenv("GATE_BATCH_NEO_CONCURRENCY", "4"))
+    gate_warmup: bool = os.getenv("GATE_WARMUP", "0") == "1"
+
+    decision_cache_enabled: bool = os.getenv("DECISION_CACHE", "0") == "1"
+    decision_cache_size: int = int(os.getenv("DECISION_CACHE_SIZE", "1024"))
+    decision_cache_ttl: float = float(os.getenv("DECISION_CACHE_TTL", "300"))
+    decision_cache_persist: bool = os.getenv("DECISION_CACHE_PERSIST", "0") == "1"
+
     spoonos_base_url: str = os.getenv("SPOONOS_BASE_URL", "")
     spoonos_api_key: str = os.getenv("SPOONOS_API_KEY", "")
     spoonos_model: str = os.getenv("SPOONOS_LLM_MODEL", "")
@@ -17,11 +34,36 @@ class Settings:
     neo_wif: str = os.getenv("NEO_WIF", "")
     neo_contract_hash: str = os.getenv("NEO_CONTRACT_HASH", "")
     neo_network: str = os.getenv("NEO_NETWORK", "testnet")
+    neo_client: str = os.getenv("NEO_CLIENT", "rpc")
     neo_tx_timeout: int = int(os.getenv("NEO_TX_TIMEOUT", "30"))
     neo_simulate: bool = os.getenv("NEO_SIMULATE", "0") == "1"
+    neo_batch_size: int = int(os.getenv("NEO_BATCH_SIZE", "0"))
+    neo_batch_window_ms: float = float(os.getenv("NEO_BATCH_WINDOW_MS", "200"))
+    neo_outbox: bool = os.getenv("NEO_OUTBOX", "0") == "1"
+    neo_outbox_retry_base: float = float(os.getenv("NEO_OUTBOX_RETRY_BASE", "1"))
+    neo_outbox_retry_max: float = float(os.getenv("NEO_OUTBOX_RETRY_MAX", "60"))
 
     audit_hmac_secret: str = os.getenv("AUDIT_HMAC_SECRET", "")
     audit_allow_unsigned: bool = os.getenv("AUDIT_ALLOW_UNSIGNED", "0") == "1"
+    audit_checkpoint_every: int = int(os.getenv("AUDIT_CHECKPOINT_EVERY", "100"))
+    audit_segment_records: int = int(os.getenv("AUDIT_SEGMENT_RECORDS", "0"))
+    # Ignored in strict mode, where every record is written before the response.
+    audit_async: bool = os.getenv("AUDIT_ASYNC", "0") == "1"
+    audit_queue_size: int = int(os.getenv("AUDIT_QUEUE_SIZE", "1024"))
+
+    explain_attempts: int = int(os.getenv("EXPLAIN_ATTEMPTS", "3"))
+    explain_hedge: bool = os.getenv("EXPLAIN_HEDGE", "0") == "1"
+    explain_hedge_delay_ms: float = float(os.getenv("EXPLAIN_HEDGE_DELAY_MS", "0"))
+    explain_hedge_percentile: float = float(os.getenv("EXPLAIN_HEDGE_PERCENTILE", "95"))
+
+    notify_async: bool = os.getenv("NOTIFY_ASYNC", "0") == "1"
+    notify_queue_size: int = int(os.getenv("NOTIFY_QUEUE_SIZE", "1024"))
+    notify_batch_size: int = int(os.getenv("NOTIFY_BATCH_SIZE", "64"))
+    notify_batch_window_ms: float = float(os.getenv("NOTIFY_BATCH_WINDOW_MS", "50"))
+    notify_retry_delay: float = float(os.getenv("NOTIFY_RETRY_DELAY", "1"))
+
+    content_store: bool = os.getenv("CONTENT_STORE", "1") == "1"
+    content_store_context_min_bytes: int = int(os.getenv("CONTENT_STORE_CONTEXT_MIN_BYTES", "0"))
 
     strict_mode: bool = os.getenv("GATTEN_STRICT", "1") == "1"
 
@@ -0,0 +1,56 @@
+import hashlib
+import json
+import os
+import uuid
+from typing import Any, Dict, Optional
+
+from spoon.config import SETTINGS
+from spoon.hashing import canonical_bytes
+from spoon.tools.storage_tool import StorageTool
+
+
+class ContentStore:
+    """Write-once JSON payloads keyed by the sha256 of their canonical JSON.
+
+    Files live under ``cas/<first two hex chars>/<hash>.json`` in the storage
+    directory, so a payload's key is the same ``sha256_hex`` the permits carry
+    as ``decision_hash``. Identical payloads are stored once; writes go through
+    a temporary file and ``os.replace`` so readers never see a partial file.
+    """
+
+    def __init__(self, storage: StorageTool) -> None:
+        self.base_dir = os.path.join(storage.base_dir, "cas")
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.base_dir, digest[:2], f"{digest}.json")
+
+    def put(self, payload: Dict[str, Any]) -> str:
+        """Store ``payload`` if it is not there yet and return its hash."""
+        return self.put_canonical(canonical_bytes(payload))
+
+    def put_canonical(self, data: bytes) -> str:
+        """``put`` for a payload the caller already encoded with ``canonical_bytes``."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        # Concurrent writers of one payload each rename their own temp file over
+        # the same bytes, so no lock is needed.
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+                if SETTINGS.storage_durability == "fsync":
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        return digest
+
+    def get(self, digest: str) -> Optional[Dict[str, Any]]:
+        """Payload stored under ``digest``, or None. Callers that trust it should re-hash it."""
+        if len(digest) != 64 or not all(c in "0123456789abcdef" for c in digest):
+            return None
+        try:
+            with open(self._path(digest), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
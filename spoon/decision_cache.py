@@ -0,0 +1,115 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from spoon.hashing import sha256_hex
+from spoon.tools.storage_tool import StorageTool
+
+_FILENAME = "decision_cache.jsonl"
+
+
+class DecisionCache:
+    """Memoised draft decisions: a bounded LRU with TTL, optionally backed by disk.
+
+    Entries are keyed by the model, the system prompt and the canonical JSON of
+    the request and its context, so logically identical submissions share an
+    entry regardless of dict key order. With ``storage`` set, every stored entry
+    is also appended to ``decision_cache.jsonl`` and unexpired entries are
+    reloaded on start-up.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 300.0,
+        storage: Optional[StorageTool] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.storage = storage
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if storage is not None:
+            self._load()
+
+    @staticmethod
+    def key(model: str, system: str, user_request: str, context: Dict[str, Any]) -> Optional[str]:
+        """Cache key, or None when the context cannot be canonicalised."""
+        try:
+            return sha256_hex({"model": model, "system": system, "user_request": user_request, "context": context})
+        except (TypeError, ValueError):
+            return None
+
+    def _load(self) -> None:
+        path = os.path.join(self.storage.base_dir, _FILENAME)
+        self.storage.flush(_FILENAME)
+        if not os.path.exists(path):
+            return
+        now = self._clock()
+        lines = 0
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                lines += 1
+                try:
+                    entry = json.loads(line)
+                    created_at, key, draft = float(entry["created_at"]), entry["key"], entry["draft"]
+                except (ValueError, KeyError, TypeError):
+                    continue
+                if now - created_at < self.ttl_seconds:
+                    self._entries[key] = (created_at, draft)
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+        if lines > 2 * max(len(self._entries), 1):
+            self._compact(path)
+
+    def _compact(self, path: str) -> None:
+        # Rewrite the file with live entries only, so it stays proportional to
+        # the cache rather than to its history.
+        self.storage.close(_FILENAME)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for key, (created_at, draft) in self._entries.items():
+                f.write(json.dumps({"key": key, "created_at": created_at, "draft": draft}, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, path)
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() - entry[0] >= self.ttl_seconds:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, draft: str) -> None:
+        created_at = self._clock()
+        with self._lock:
+            self._entries[key] = (created_at, draft)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        if self.storage is not None:
+            self.storage.append_jsonl(_FILENAME, {"key": key, "created_at": created_at, "draft": draft})
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
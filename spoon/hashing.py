@@ -1,17 +1,98 @@
 import hashlib
 import json
+import math
+import os
+import re
 from typing import Any, Dict
 
+try:
+    import orjson
+except ImportError:  # optional fast backend; the stdlib encoder is the reference
+    orjson = None
+
+# JSON_BACKEND: "auto" (orjson when installed), "orjson" or "stdlib".
+_BACKEND = os.getenv("JSON_BACKEND", "auto")
+if _BACKEND == "orjson" and orjson is None:
+    raise ImportError("JSON_BACKEND=orjson but orjson is not installed")
+_USE_ORJSON = orjson is not None and _BACKEND != "stdlib"
+
+if orjson is not None:
+    # Subclasses, datetimes and dataclasses go to the stdlib encoder, which decides
+    # whether they serialise; orjson would render them its own way.
+    _ORJSON_OPTIONS = (
+        orjson.OPT_SORT_KEYS
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+# orjson prints some floats differently from repr() (1e-7 vs 1e-07, 0.000025 vs
+# 2.5e-05). Both differences only occur for numbers in exponent form or starting
+# 0.0000, so output containing such a number token is re-encoded by the stdlib.
+_EXPONENT = re.compile(rb"e[-+]\d")
+_NUMBER_BYTES = frozenset(b"0123456789.-")
+
+
+def _number_ends_at(encoded: bytes, end: int) -> bool:
+    # True when encoded[:end] ends in a number token rather than inside a string.
+    i = end - 1
+    while i >= 0 and encoded[i] in _NUMBER_BYTES:
+        i -= 1
+    return i < end - 1 and (i < 0 or encoded[i] in b":,[")
+
+
+def _has_float_form(encoded: bytes) -> bool:
+    for match in _EXPONENT.finditer(encoded):
+        if _number_ends_at(encoded, match.start()):
+            return True
+    pos = encoded.find(b"0.0000")
+    while pos != -1:
+        if _number_ends_at(encoded, pos + 6):
+            return True
+        pos = encoded.find(b"0.0000", pos + 1)
+    return False
+
+
+def _has_non_finite(data: Any) -> bool:
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite(value) for value in data)
+    return False
+
+
+def _stdlib_bytes(data: Any) -> bytes:
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def canonical_bytes(data: Any) -> bytes:
+    """UTF-8 canonical JSON: sorted keys, no whitespace, NaN and infinities as the
+    stdlib writes them (NaN, Infinity, -Infinity), so existing hashes do not change.
+
+    Uses orjson when available and falls back to the stdlib encoder for anything
+    orjson would print differently, so the bytes do not depend on the backend.
+    """
+    if _USE_ORJSON:
+        try:
+            encoded = orjson.dumps(data, option=_ORJSON_OPTIONS)
+        except (TypeError, orjson.JSONEncodeError):
+            pass
+        else:
+            # orjson writes non-finite floats as null; those need the stdlib spelling.
+            if not _has_float_form(encoded) and not (b"null" in encoded and _has_non_finite(data)):
+                return encoded
+    return _stdlib_bytes(data)
+
 
 def canonical_json(data: Dict[str, Any]) -> str:
-    return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return canonical_bytes(data).decode("utf-8")
 
 
 def sha256_hex(data: Dict[str, Any]) -> str:
-    payload = canonical_json(data).encode("utf-8")
-    return hashlib.sha256(payload).hexdigest()
+    return hashlib.sha256(canonical_bytes(data)).hexdigest()
 
 
 def sha256_bytes(data: Dict[str, Any]) -> bytes:
-    payload = canonical_json(data).encode("utf-8")
-    return hashlib.sha256(payload).digest()
+    return hashlib.sha256(canonical_bytes(data)).digest()
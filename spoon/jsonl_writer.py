@@ -0,0 +1,164 @@
+import atexit
+import json
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+BUFFERED = "buffered"
+FLUSH = "flush"
+FSYNC = "fsync"
+DURABILITY_LEVELS = (BUFFERED, FLUSH, FSYNC)
+
+
+class JsonlWriter:
+    """Long-lived appender for one JSONL file with group commit.
+
+    ``write`` assigns the record its offset and puts it in the file buffer under
+    one lock, so records land in call order. ``commit`` then waits for the record
+    to reach the requested durability. While one caller flushes or fsyncs, later
+    callers queue up behind it, and the next leader covers all of them with a
+    single flush or fsync.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "ab")
+        self._end = self._file.tell()
+        self._cond = threading.Condition()
+        self._written = 0
+        self._committed = {FLUSH: 0, FSYNC: 0}
+        self._syncing = False
+        self._closed = False
+
+    @property
+    def end(self) -> int:
+        """Offset just past the last record handed to ``write``."""
+        return self._end
+
+    def write(self, payload: Dict[str, Any]) -> Tuple[int, int]:
+        """Buffer one record; return its byte offset and a commit ticket."""
+        return self.write_line((json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8"))
+
+    def write_line(self, line: bytes) -> Tuple[int, int]:
+        """``write`` for a record the caller already encoded, newline included."""
+        with self._cond:
+            if self._closed:
+                raise ValueError(f"writer for {self.path} is closed")
+            if self._written == self._committed[FLUSH]:
+                self._follow_file()
+            offset = self._end
+            self._file.write(line)
+            self._end += len(line)
+            self._written += 1
+            return offset, self._written
+
+    def commit(self, ticket: int, durability: str) -> None:
+        if durability == BUFFERED:
+            return
+        if durability not in self._committed:
+            raise ValueError(f"unknown durability level: {durability}")
+        with self._cond:
+            while self._committed[durability] < ticket and not self._closed:
+                if self._syncing:
+                    self._cond.wait()
+                    continue
+                self._syncing = True
+                target = self._written
+                self._file.flush()
+                try:
+                    if durability == FSYNC:
+                        # fsync without the lock so new records can keep buffering behind it.
+                        self._cond.release()
+                        try:
+                            os.fsync(self._file.fileno())
+                        finally:
+                            self._cond.acquire()
+                    self._committed[FLUSH] = max(self._committed[FLUSH], target)
+                    if durability == FSYNC:
+                        self._committed[FSYNC] = max(self._committed[FSYNC], target)
+                finally:
+                    self._syncing = False
+                    self._cond.notify_all()
+
+    def _follow_file(self) -> None:
+        # Nothing is buffered, so the open file must match the path. Reopen if the
+        # path was removed or replaced, and pick up appends from other processes so
+        # offsets stay exact.
+        opened = os.fstat(self._file.fileno())
+        try:
+            current = os.stat(self.path)
+        except FileNotFoundError:
+            current = None
+        if current is None or current.st_ino != opened.st_ino or current.st_dev != opened.st_dev:
+            self._file.close()
+            self._file = open(self.path, "ab")
+            self._end = self._file.tell()
+        else:
+            self._end = opened.st_size
+
+    def flush(self) -> None:
+        with self._cond:
+            if not self._closed:
+                self._file.flush()
+                self._committed[FLUSH] = max(self._committed[FLUSH], self._written)
+
+    def close(self, durability: str = FLUSH) -> None:
+        with self._cond:
+            while self._syncing:
+                self._cond.wait()
+            if self._closed:
+                return
+            self._file.flush()
+            if durability == FSYNC:
+                os.fsync(self._file.fileno())
+            self._file.close()
+            self._closed = True
+            self._cond.notify_all()
+
+
+_WRITERS: Dict[str, JsonlWriter] = {}
+_WRITERS_LOCK = threading.Lock()
+
+
+def get_writer(path: str) -> JsonlWriter:
+    """Process-wide writer for ``path``, shared so every caller sees one ordered stream."""
+    key = os.path.abspath(path)
+    with _WRITERS_LOCK:
+        writer = _WRITERS.get(key)
+        if writer is None:
+            writer = JsonlWriter(path)
+            _WRITERS[key] = writer
+        return writer
+
+
+def peek_writer(path: str) -> Optional[JsonlWriter]:
+    with _WRITERS_LOCK:
+        return _WRITERS.get(os.path.abspath(path))
+
+
+def close_writer(path: str, durability: str = FLUSH) -> None:
+    with _WRITERS_LOCK:
+        writer = _WRITERS.pop(os.path.abspath(path), None)
+    if writer is not None:
+        writer.close(durability)
+
+
+def close_under(directory: str, durability: str = FLUSH) -> None:
+    """Close every writer for a file in ``directory`` or below it."""
+    prefix = os.path.join(os.path.abspath(directory), "")
+    with _WRITERS_LOCK:
+        paths = [path for path in _WRITERS if path.startswith(prefix)]
+        writers = [_WRITERS.pop(path) for path in paths]
+    for writer in writers:
+        writer.close(durability)
+
+
+def close_all(durability: str = FLUSH) -> None:
+    with _WRITERS_LOCK:
+        writers = list(_WRITERS.values())
+        _WRITERS.clear()
+    for writer in writers:
+        writer.close(durability)
+
+
+atexit.register(close_all)
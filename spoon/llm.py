@@ -1,12 +1,17 @@
 import asyncio
 import os
 import sys
+import time
+from collections import deque
 from pathlib import Path
-from typing import Optional
+from contextlib import aclosing, asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Coroutine, Deque, Dict, List, Optional, Set
 import threading
 import logging
 from concurrent.futures import Future
 
+import httpx
+
 from spoon.config import SETTINGS
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -14,22 +19,164 @@ SPOON_CORE = ROOT / "spoon-core"
 if str(SPOON_CORE) not in sys.path:
     sys.path.insert(0, str(SPOON_CORE))
 
-from spoon_ai.schema import Message  # type: ignore
-from spoon_ai.llm.providers.ollama_provider import OllamaProvider  # type: ignore
+if TYPE_CHECKING:
+    from spoon_ai.schema import Message  # type: ignore
+
+
+def _load_spoon_ai() -> None:
+    # spoon_ai imports every provider SDK it supports, which takes seconds; load it
+    # on the first chat rather than when the API process starts.
+    # Each name is imported only if it is not set yet, so a patched provider
+    # does not pull in the real one.
+    g = globals()
+    if "Message" not in g:
+        from spoon_ai.schema import Message  # type: ignore
+
+        g.setdefault("Message", Message)
+    if "OllamaProvider" not in g:
+        from spoon_ai.llm.providers.ollama_provider import OllamaProvider  # type: ignore
+
+        g.setdefault("OllamaProvider", OllamaProvider)
+
+
+def __getattr__(name: str) -> Any:
+    if name in ("Message", "OllamaProvider"):
+        _load_spoon_ai()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class LLMUnavailableError(RuntimeError):
+    """No backend could serve the chat: every breaker is open or every backend tried failed."""
+
+
+class _Backend:
+    """One Ollama endpoint with its provider, slots, load, circuit breaker and latencies.
+
+    Only the adapter's loop thread changes it. The breaker opens after
+    OLLAMA_BREAKER_FAILURES consecutive failures; after OLLAMA_BREAKER_COOLDOWN
+    seconds one probe chat is let through (half-open) and its outcome closes or
+    re-opens it.
+    """
+
+    def __init__(self, url: str, max_concurrency: int) -> None:
+        self.url = url
+        self.provider = None
+        self.init_failed_at: Optional[float] = None
+        self.slots = asyncio.Semaphore(max_concurrency)
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.probing = False
+        self.outstanding = 0
+        self.dispatched = 0
+        self.completed = 0
+        self.failed = 0
+        self.consecutive_failures = 0
+        self.latencies: Deque[float] = deque(maxlen=256)
+
+    def available(self, now: float, cooldown: float) -> bool:
+        if self.provider is None:
+            return False
+        if self.state == OPEN and now - self.opened_at >= cooldown:
+            self.state = HALF_OPEN
+        return self.state == CLOSED or (self.state == HALF_OPEN and not self.probing)
+
+    def succeeded(self, latency: Optional[float] = None) -> None:
+        if latency is not None:
+            self.completed += 1
+            self.latencies.append(latency)
+        self.consecutive_failures = 0
+        self.state = CLOSED
+
+    def failed_once(self, threshold: int, counted: bool = True) -> None:
+        if counted:
+            self.failed += 1
+        self.consecutive_failures += 1
+        if self.state != CLOSED or self.consecutive_failures >= threshold:
+            if self.state != OPEN:
+                logging.getLogger("gatten_gate.llm").warning("LLM_BREAKER: open url=%s", self.url)
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        samples = sorted(self.latencies)
+
+        def pct(p: float) -> Optional[float]:
+            if not samples:
+                return None
+            return round(samples[min(int(len(samples) * p / 100), len(samples) - 1)] * 1000, 2)
+
+        return {
+            "url": self.url,
+            "state": self.state,
+            "outstanding": self.outstanding,
+            "completed": self.completed,
+            "failed": self.failed,
+            "consecutive_failures": self.consecutive_failures,
+            "latency_p50_ms": pct(50),
+            "latency_p99_ms": pct(99),
+        }
+
+
+def _base_urls() -> List[str]:
+    urls = [u.strip().rstrip("/") for u in os.getenv("OLLAMA_BASE_URLS", "").split(",") if u.strip()]
+    return urls or [os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")]
 
 
 class SpoonLLM:
-    """SpoonOS unified LLM adapter using local Ollama via spoon-core."""
+    """SpoonOS unified LLM adapter using local Ollama via spoon-core.
+
+    Chats are spread over the backends in OLLAMA_BASE_URLS (comma-separated;
+    OLLAMA_BASE_URL when unset). Each gets one provider, with its pooled HTTP
+    client, on first use, kept for the adapter's lifetime; a backend whose
+    provider failed to initialize is tried again once a health check passes,
+    or on the next chat after OLLAMA_BREAKER_COOLDOWN. Every chat goes to the
+    available backend with a free slot and the fewest outstanding requests. A failed chat
+    counts against that backend's breaker and is retried once on each other
+    backend; when no backend can take it, LLMUnavailableError is raised. With
+    OLLAMA_HEALTH_INTERVAL > 0 each backend's /api/tags is also polled, which
+    closes the breaker of a recovered backend without waiting for a probe chat.
 
-    def __init__(self, model: Optional[str] = None) -> None:
+    Each backend has OLLAMA_MAX_CONCURRENCY slots, so that many chats at most
+    are in flight on it; when every available backend is full, chats wait in
+    the adapter's queue for a slot to free up.
+    """
+
+    def __init__(
+        self,
+        model: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        base_urls: Optional[List[str]] = None,
+    ) -> None:
         self.model = model or os.getenv("OLLAMA_MODEL", "tinyllama")
-        self.base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+        self.base_urls = list(base_urls or _base_urls())
+        self.base_url = self.base_urls[0]
         self.timeout = int(os.getenv("OLLAMA_TIMEOUT", "30"))
-        self._provider = None
+        self.max_concurrency = max_concurrency or int(os.getenv("OLLAMA_MAX_CONCURRENCY", "8"))
+        self.breaker_failures = max(int(os.getenv("OLLAMA_BREAKER_FAILURES", "3")), 1)
+        self.breaker_cooldown = float(os.getenv("OLLAMA_BREAKER_COOLDOWN", "10"))
+        self.health_interval = float(os.getenv("OLLAMA_HEALTH_INTERVAL", "5"))
+        self._backends = [_Backend(url, self.max_concurrency) for url in self.base_urls]
         self._initialized = False
+        self._init_lock: Optional[asyncio.Lock] = None
+        self._slot_freed: Optional[asyncio.Condition] = None
+        self._health_task: Optional[asyncio.Task] = None
+        self._health_client: Optional[httpx.AsyncClient] = None
+        self._queued = 0
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._aborted = 0
+        self._unavailable = 0
+        # The loop thread starts with the first call, not with the adapter.
         self._loop = None
         self._thread = None
-        self._start_loop()
+        self._loop_lock = threading.Lock()
 
     def _start_loop(self) -> None:
         if self._loop is not None:
@@ -39,50 +186,325 @@ class SpoonLLM:
             asyncio.set_event_loop(loop)
             loop.run_forever()
 
-        loop = asyncio.new_event_loop()
-        thread = threading.Thread(target=_run_loop, args=(loop,), daemon=True)
-        thread.start()
-        self._loop = loop
-        self._thread = thread
+        with self._loop_lock:
+            if self._loop is not None:
+                return
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=_run_loop, args=(loop,), daemon=True)
+            thread.start()
+            self._loop = loop
+            self._thread = thread
+
+    def _init_due(self, backend: _Backend, now: float) -> bool:
+        return backend.provider is None and (
+            backend.init_failed_at is None or now - backend.init_failed_at >= self.breaker_cooldown
+        )
+
+    async def _init_provider(self, backend: _Backend) -> None:
+        provider = OllamaProvider()
+        try:
+            await provider.initialize(
+                {
+                    "api_key": "ollama",
+                    "model": self.model,
+                    "base_url": backend.url,
+                    "timeout": self.timeout,
+                }
+            )
+        except Exception as exc:
+            # Left without a provider, so not picked until a retry succeeds; the
+            # other backends still serve.
+            backend.init_failed_at = time.monotonic()
+            logging.getLogger("gatten_gate.llm").warning(
+                "LLM_BACKEND: initialize failed url=%s error=%s", backend.url, exc
+            )
+            return
+        if backend.init_failed_at is not None:
+            logging.getLogger("gatten_gate.llm").info("LLM_BACKEND: initialized on retry url=%s", backend.url)
+        backend.init_failed_at = None
+        backend.provider = provider
 
     async def _ensure_initialized(self) -> None:
-        if self._initialized:
+        if self._initialized and not any(self._init_due(b, time.monotonic()) for b in self._backends):
             return
-        self._provider = OllamaProvider()
-        await self._provider.initialize(
-            {
-                "api_key": "ollama",
-                "model": self.model,
-                "base_url": self.base_url,
-                "timeout": self.timeout,
-            }
-        )
-        self._initialized = True
+        if self._init_lock is None:
+            self._init_lock = asyncio.Lock()
+        async with self._init_lock:
+            _load_spoon_ai()
+            now = time.monotonic()
+            for backend in self._backends:
+                if self._init_due(backend, now):
+                    await self._init_provider(backend)
+            if not self._initialized and self.health_interval > 0:
+                self._health_task = asyncio.ensure_future(self._health_loop())
+            self._initialized = True
 
-    async def _chat(self, system: str, user: str) -> str:
+    def _pick(self, exclude: Set[_Backend]) -> Optional[_Backend]:
+        """The backend to send a chat to, or None while every available one is full."""
+        now = time.monotonic()
+        candidates = [b for b in self._backends if b not in exclude and b.available(now, self.breaker_cooldown)]
+        if not candidates:
+            raise LLMUnavailableError("no LLM backend available: " + ", ".join(
+                f"{b.url}={b.state if b.provider is not None else 'uninitialized'}" for b in self._backends
+            ))
+        candidates = [b for b in candidates if not b.slots.locked()]
+        if not candidates:
+            return None
+        # Least outstanding requests; ties go to the backend dispatched to least.
+        backend = min(candidates, key=lambda b: (b.outstanding, b.dispatched))
+        if backend.state == HALF_OPEN:
+            backend.probing = True
+        backend.dispatched += 1
+        return backend
+
+    @asynccontextmanager
+    async def _slot(self, exclude: Set[_Backend]) -> AsyncIterator[_Backend]:
+        # Counters and backends are only touched on the adapter's loop thread.
+        if self._slot_freed is None:
+            self._slot_freed = asyncio.Condition()
+        self._queued += 1
+        try:
+            while True:
+                backend = self._pick(exclude)
+                if backend is not None:
+                    break
+                async with self._slot_freed:
+                    await self._slot_freed.wait()
+        finally:
+            self._queued -= 1
+        # Picked with a free slot, so this does not wait.
+        await backend.slots.acquire()
+        exclude.add(backend)
+        self._in_flight += 1
+        backend.outstanding += 1
+        started = time.perf_counter()
+        try:
+            yield backend
+        except asyncio.CancelledError:
+            self._aborted += 1
+            raise
+        except BaseException:
+            self._failed += 1
+            backend.failed_once(self.breaker_failures)
+            raise
+        else:
+            self._completed += 1
+            backend.succeeded(time.perf_counter() - started)
+        finally:
+            backend.probing = False
+            backend.outstanding -= 1
+            self._in_flight -= 1
+            backend.slots.release()
+            async with self._slot_freed:
+                self._slot_freed.notify_all()
+
+    async def _check(self, backend: _Backend) -> bool:
+        try:
+            response = await self._health_client.get(f"{backend.url}/api/tags")
+            response.raise_for_status()
+        except Exception:
+            if backend.provider is not None:
+                backend.failed_once(self.breaker_failures, counted=False)
+            return False
+        if backend.state != CLOSED:
+            logging.getLogger("gatten_gate.llm").info("LLM_BREAKER: closed by health check url=%s", backend.url)
+        backend.succeeded()
+        if backend.provider is None:
+            # The backend was down when its provider was first built; it answers now.
+            async with self._init_lock:
+                if backend.provider is None:
+                    await self._init_provider(backend)
+        return backend.provider is not None
+
+    async def _check_all(self) -> List[bool]:
+        if self._health_client is None:
+            self._health_client = httpx.AsyncClient(timeout=min(float(self.timeout), 5.0))
+        return await asyncio.gather(*(self._check(b) for b in self._backends if not b.probing))
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_interval)
+            await self._check_all()
+
+    async def _ping(self) -> bool:
         await self._ensure_initialized()
-        messages = [
+        return any(await self._check_all())
+
+    def ping(self, timeout: Optional[float] = None) -> bool:
+        """Initialize the providers and health-check every backend once.
+
+        Returns True if at least one backend answered. Used to warm the adapter up
+        before the first request; failures count against the breakers as usual.
+        """
+        self._start_loop()
+        return asyncio.run_coroutine_threadsafe(self._ping(), self._loop).result(timeout or self.timeout)
+
+    def _messages(self, system: str, user: str) -> List["Message"]:
+        return [
             Message(role="system", content=system),
             Message(role="user", content=user),
         ]
-        response = await self._provider.chat(messages)
-        await self._provider.cleanup()
+
+    def _unavailable_error(self, last_error: Optional[Exception]) -> LLMUnavailableError:
+        self._unavailable += 1
+        return LLMUnavailableError(f"all LLM backends failed: {last_error}")
+
+    async def _chat(self, system: str, user: str) -> str:
+        await self._ensure_initialized()
+        tried: Set[_Backend] = set()
+        last_error: Optional[Exception] = None
+        while True:
+            try:
+                async with self._slot(tried) as backend:
+                    response = await backend.provider.chat(self._messages(system, user))
+                return response.content
+            except LLMUnavailableError:
+                if last_error is None:
+                    self._unavailable += 1
+                    raise
+                raise self._unavailable_error(last_error) from last_error
+            except Exception as exc:
+                last_error = exc
+                logging.getLogger("gatten_gate.llm").warning(
+                    "LLM_BACKEND: chat failed url=%s error=%s", backend.url, exc
+                )
+                if len(tried) == len(self._backends):
+                    raise self._unavailable_error(exc) from exc
+
+    async def _stream_chat(self, system: str, user: str, emit: Callable[[str, Any], None]) -> None:
+        await self._ensure_initialized()
+        tried: Set[_Backend] = set()
+        last_error: Optional[Exception] = None
+        while True:
+            started = False
+            try:
+                async with self._slot(tried) as backend:
+                    async with aclosing(backend.provider.chat_stream(self._messages(system, user))) as chunks:
+                        async for chunk in chunks:
+                            if chunk.delta:
+                                started = True
+                                emit("delta", chunk.delta)
+                return
+            except LLMUnavailableError:
+                if last_error is None:
+                    self._unavailable += 1
+                    raise
+                raise self._unavailable_error(last_error) from last_error
+            except Exception as exc:
+                last_error = exc
+                logging.getLogger("gatten_gate.llm").warning(
+                    "LLM_BACKEND: stream failed url=%s error=%s", backend.url, exc
+                )
+                # Text already sent on cannot be restarted on another backend.
+                if started or len(tried) == len(self._backends):
+                    raise self._unavailable_error(exc) from exc
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self._in_flight,
+            "queue_depth": self._queued,
+            "completed": self._completed,
+            "failed": self._failed,
+            "aborted": self._aborted,
+            "unavailable": self._unavailable,
+            "backends": [backend.stats() for backend in self._backends],
+        }
+
+    async def _aclose(self) -> None:
+        task, self._health_task = self._health_task, None
+        if task is not None:
+            task.cancel()
+        client, self._health_client = self._health_client, None
+        if client is not None:
+            await client.aclose()
         self._initialized = False
-        return response.content
+        for backend in self._backends:
+            provider, backend.provider = backend.provider, None
+            if provider is not None:
+                await provider.cleanup()
 
-    def generate(self, system: str, user: str) -> str:
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Release the provider's connections and stop the loop thread."""
+        loop, thread = self._loop, self._thread
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._aclose(), loop).result(timeout or self.timeout)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not None:
+                thread.join(timeout or self.timeout)
+            loop.close()
+            self._loop = None
+            self._thread = None
+            # Loop-bound primitives are recreated if the adapter is used again.
+            self._init_lock = None
+            self._slot_freed = None
+            for backend in self._backends:
+                backend.slots = asyncio.Semaphore(self.max_concurrency)
+
+    def _submit(self, system: str, user: str, request_id: Optional[str]) -> Future:
+        return self._submit_coro(self._chat(system, user), request_id)
+
+    def _submit_coro(self, coro: Coroutine[Any, Any, Any], request_id: Optional[str]) -> Future:
         if self._loop is None:
             self._start_loop()
         logger = logging.getLogger("gatten_gate.llm")
         logger.info(
             "LLM_CALL: Agent -> SpoonOS(llm.py) -> Ollama request_id=%s model=%s",
-            getattr(self, "_request_id", "n/a"),
+            request_id or getattr(self, "_request_id", "n/a"),
             self.model,
         )
-        future: Future = asyncio.run_coroutine_threadsafe(self._chat(system, user), self._loop)  # type: ignore[arg-type]
+        # The provider and its HTTP client live on the adapter's own loop thread;
+        # every caller, sync or async, hands its coroutine over to that loop.
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)  # type: ignore[arg-type]
+
+    def generate(self, system: str, user: str) -> str:
+        future = self._submit(system, user, None)
         result = future.result()
         self._request_id = "n/a"
         return result
 
+    async def agenerate(self, system: str, user: str, request_id: Optional[str] = None) -> str:
+        """Awaitable ``generate`` that does not block the caller's event loop."""
+        return await asyncio.wrap_future(self._submit(system, user, request_id))
+
+    async def astream(self, system: str, user: str, request_id: Optional[str] = None) -> AsyncIterator[str]:
+        """Yield the completion in pieces as the provider produces them.
+
+        Closing the iterator early (``aclosing`` / ``aclose``) cancels the
+        generation on the adapter's loop and frees its concurrency slot.
+        """
+        caller = asyncio.get_running_loop()
+        pieces: asyncio.Queue = asyncio.Queue()
+
+        def emit(kind: str, value: Any) -> None:
+            try:
+                caller.call_soon_threadsafe(pieces.put_nowait, (kind, value))
+            except RuntimeError:
+                pass  # the consumer's loop is gone; nobody is listening
+
+        async def produce() -> None:
+            try:
+                await self._stream_chat(system, user, emit)
+            except Exception as exc:
+                emit("error", exc)
+            else:
+                emit("end", None)
+
+        future = self._submit_coro(produce(), request_id)
+        try:
+            while True:
+                kind, value = await pieces.get()
+                if kind == "delta":
+                    yield value
+                elif kind == "error":
+                    raise value
+                else:
+                    return
+        finally:
+            future.cancel()
+
     def set_request_id(self, request_id: str) -> None:
         self._request_id = request_id
@@ -0,0 +1,133 @@
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+# Below this many patterns, a handful of C-level ``in`` checks beats walking the
+# automaton character by character in Python (see scripts/bench_policy_matcher.py).
+_SUBSTRING_LIMIT = 128
+
+
+class PatternMatcher:
+    """Multi-pattern substring matcher that reports the tags of every pattern found.
+
+    Patterns are compiled into one Aho-Corasick automaton, so a text is scanned
+    once no matter how many patterns there are. Each pattern carries a tag
+    (the policy uses the rule index), and ``find`` returns the set of tags
+    whose patterns occur in the text. Matching is case-sensitive; callers
+    lowercase both sides.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, int]]) -> None:
+        self._pairs: List[Tuple[str, int]] = []
+        self._always: Set[int] = set()
+        for pattern, tag in patterns:
+            if pattern:
+                self._pairs.append((pattern, tag))
+            else:
+                # Like ``"" in text``, an empty pattern matches everything.
+                self._always.add(tag)
+        self._tags = frozenset(tag for _, tag in self._pairs) | self._always
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[FrozenSet[int]] = [frozenset()]
+        self._alphabet: FrozenSet[str] = frozenset()
+        if len(self._pairs) > _SUBSTRING_LIMIT:
+            self._build()
+
+    def _build(self) -> None:
+        outputs: List[Set[int]] = [set()]
+        for pattern, tag in self._pairs:
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append(set())
+                state = nxt
+            outputs[state].add(tag)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                outputs[nxt] |= outputs[self._fail[nxt]]
+        self._out = [frozenset(o) for o in outputs]
+        self._alphabet = frozenset(ch for pattern, _ in self._pairs for ch in pattern)
+
+    @property
+    def tags(self) -> FrozenSet[int]:
+        return self._tags
+
+    def find(self, text: str) -> Set[int]:
+        found = set(self._always)
+        if len(self._pairs) <= _SUBSTRING_LIMIT:
+            for pattern, tag in self._pairs:
+                if tag not in found and pattern in text:
+                    found.add(tag)
+            return found
+        self._advance(0, text, found)
+        return found
+
+    def _advance(self, state: int, text: str, found: Set[int]) -> int:
+        """Run the automaton over ``text`` from ``state``, adding hits to ``found``."""
+        goto, fail, out, alphabet = self._goto, self._fail, self._out, self._alphabet
+        for ch in text:
+            row = goto[state]
+            nxt = row.get(ch)
+            if nxt is None:
+                if ch not in alphabet:
+                    state = 0
+                    continue
+                fallback = fail[state]
+                while fallback and ch not in goto[fallback]:
+                    fallback = fail[fallback]
+                nxt = goto[fallback].get(ch, 0)
+                # Memoise the resolved transition; after construction goto only grows
+                # toward the equivalent DFA, so later scans skip the failure walk.
+                row[ch] = nxt
+            state = nxt
+            hits = out[state]
+            if hits and not hits <= found:
+                found |= hits
+                if len(found) == len(self._tags):
+                    break
+        return state
+
+    def scanner(self) -> "PatternScanner":
+        return PatternScanner(self)
+
+
+class PatternScanner:
+    """Incremental ``PatternMatcher.find`` for text that arrives in pieces.
+
+    Matches that straddle two ``feed`` calls are found, as if the pieces had
+    been concatenated and scanned once.
+    """
+
+    def __init__(self, matcher: PatternMatcher) -> None:
+        self._matcher = matcher
+        self._state = 0
+        self._tail = ""
+        self._overlap = max((len(p) for p, _ in matcher._pairs), default=1) - 1
+        self.found: Set[int] = set(matcher._always)
+
+    def feed(self, text: str) -> Set[int]:
+        """Scan the next piece and return every tag found so far."""
+        matcher = self._matcher
+        if len(matcher._pairs) <= _SUBSTRING_LIMIT:
+            window = self._tail + text
+            for pattern, tag in matcher._pairs:
+                if tag not in self.found and pattern in window:
+                    self.found.add(tag)
+            self._tail = window[-self._overlap:] if self._overlap else ""
+        else:
+            self._state = matcher._advance(self._state, text, self.found)
+        return self.found
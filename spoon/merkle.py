@@ -0,0 +1,80 @@
+import hashlib
+from typing import Dict, List
+
+# Leaves and inner nodes are hashed with distinct prefixes so an inner node can
+# never be passed off as a leaf. An odd node at the end of a level is carried up
+# unchanged.
+_LEAF = b"\x00"
+_NODE = b"\x01"
+
+
+def _leaf_hash(leaf_hex: str) -> bytes:
+    return hashlib.sha256(_LEAF + bytes.fromhex(leaf_hex)).digest()
+
+
+def _node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(_NODE + left + right).digest()
+
+
+def _next_level(level: List[bytes]) -> List[bytes]:
+    paired = [_node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+    if len(level) % 2:
+        paired.append(level[-1])
+    return paired
+
+
+def merkle_root(leaves: List[str]) -> str:
+    """Root over hex-encoded leaf hashes, in order."""
+    if not leaves:
+        return hashlib.sha256(b"").hexdigest()
+    level = [_leaf_hash(leaf) for leaf in leaves]
+    while len(level) > 1:
+        level = _next_level(level)
+    return level[0].hex()
+
+
+def merkle_proof(leaves: List[str], index: int) -> List[Dict[str, str]]:
+    """Sibling path from ``leaves[index]`` up to the root."""
+    if not 0 <= index < len(leaves):
+        raise IndexError("leaf index out of range")
+    proof: List[Dict[str, str]] = []
+    level = [_leaf_hash(leaf) for leaf in leaves]
+    while len(level) > 1:
+        sibling = index ^ 1
+        if sibling < len(level):
+            proof.append({"position": "left" if sibling < index else "right", "hash": level[sibling].hex()})
+        level = _next_level(level)
+        index //= 2
+    return proof
+
+
+def merkle_proofs(leaves: List[str]) -> List[List[Dict[str, str]]]:
+    """``merkle_proof`` for every leaf, building the tree once."""
+    proofs: List[List[Dict[str, str]]] = [[] for _ in leaves]
+    level = [_leaf_hash(leaf) for leaf in leaves]
+    # positions[i] is the index of leaf i's ancestor in the current level.
+    positions = list(range(len(leaves)))
+    while len(level) > 1:
+        for leaf, index in enumerate(positions):
+            sibling = index ^ 1
+            if sibling < len(level):
+                proofs[leaf].append({"position": "left" if sibling < index else "right", "hash": level[sibling].hex()})
+        level = _next_level(level)
+        positions = [index // 2 for index in positions]
+    return proofs
+
+
+def verify_proof(leaf: str, proof: List[Dict[str, str]], root: str) -> bool:
+    try:
+        node = _leaf_hash(leaf)
+        for step in proof:
+            sibling = bytes.fromhex(step["hash"])
+            if step["position"] == "left":
+                node = _node_hash(sibling, node)
+            elif step["position"] == "right":
+                node = _node_hash(node, sibling)
+            else:
+                return False
+    except (KeyError, TypeError, ValueError):
+        return False
+    return node.hex() == root
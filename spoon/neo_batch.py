@@ -0,0 +1,129 @@
+import hashlib
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from spoon.merkle import merkle_proofs, merkle_root, verify_proof
+
+# anchor(batch_id, merkle_root, leaves) -> {"tx_hash": ..., "neo_mode": ..., ...}
+Anchor = Callable[[str, str, List[str]], Dict[str, Any]]
+
+
+def permit_leaf(permit_id: str, decision_hash: str, policy_version: str, issued_at: int, expires_at: int) -> str:
+    """Leaf hash of one permit, byte-for-byte what ``is_valid_with_proof`` recomputes on chain."""
+    decision_hex = decision_hash[2:] if decision_hash.startswith("0x") else decision_hash
+    record = b"|".join(
+        [
+            permit_id.encode(),
+            bytes.fromhex(decision_hex),
+            policy_version.encode(),
+            str(issued_at).encode(),
+            str(expires_at).encode(),
+        ]
+    )
+    return hashlib.sha256(record).hexdigest()
+
+
+def verify_permit_proof(permit: Dict[str, Any]) -> bool:
+    """Check a permit dict's ``neo_proof`` against the permit's own fields."""
+    proof = permit.get("neo_proof")
+    if not isinstance(proof, dict):
+        return False
+    issued_at, expires_at = permit["issued_at"], permit["expires_at"]
+    if isinstance(issued_at, str):
+        issued_at = int(datetime.fromisoformat(issued_at).timestamp())
+        expires_at = int(datetime.fromisoformat(expires_at).timestamp())
+    leaf = permit_leaf(permit["permit_id"], permit["decision_hash"], permit["policy_version"], issued_at, expires_at)
+    return leaf == proof.get("leaf") and verify_proof(leaf, proof.get("path", []), proof.get("merkle_root", ""))
+
+
+def contract_proof(path: List[Dict[str, str]]) -> List[str]:
+    """Encode a Merkle path as the hex steps ``is_valid_with_proof`` takes on chain."""
+    return [("00" if step["position"] == "left" else "01") + step["hash"] for step in path]
+
+
+class NeoBatcher:
+    """Collects permit leaves and anchors them as one Merkle root per batch.
+
+    A batch closes when it reaches ``max_size`` leaves or ``window`` seconds
+    after its first leaf arrived, whichever comes first. ``anchor`` runs on the
+    batcher's thread; every permit in the batch then receives the anchor result
+    plus its own inclusion proof (``neo_proof``). If anchoring fails, every
+    permit in the batch sees the exception.
+    """
+
+    def __init__(self, anchor: Anchor, max_size: int = 64, window: float = 0.2) -> None:
+        self._anchor = anchor
+        self.max_size = max(max_size, 1)
+        self.window = window
+        self._pending: List[Tuple[float, str, Future]] = []
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def submit(self, leaf: str) -> Future:
+        future: Future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("neo batcher is closed")
+            self._pending.append((time.monotonic(), leaf, future))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="neo-batcher", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return future
+
+    def _take(self) -> List[Tuple[float, str, Future]]:
+        with self._cond:
+            while True:
+                if self._pending:
+                    due = self._pending[0][0] + self.window
+                    now = time.monotonic()
+                    if len(self._pending) >= self.max_size or now >= due or self._closed:
+                        batch = self._pending[: self.max_size]
+                        del self._pending[: self.max_size]
+                        return batch
+                    self._cond.wait(due - now)
+                elif self._closed:
+                    return []
+                else:
+                    self._cond.wait()
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take()
+            if not batch:
+                return
+            self._flush(batch)
+
+    def _flush(self, batch: List[Tuple[float, str, Future]]) -> None:
+        leaves = [leaf for _, leaf, _ in batch]
+        root = merkle_root(leaves)
+        batch_id = uuid.uuid4().hex
+        try:
+            anchored = self._anchor(batch_id, root, leaves)
+        except Exception as exc:
+            for _, _, future in batch:
+                future.set_exception(exc)
+            return
+        for index, ((_, leaf, future), path) in enumerate(zip(batch, merkle_proofs(leaves))):
+            proof = {
+                "batch_id": batch_id,
+                "merkle_root": root,
+                "leaf": leaf,
+                "index": index,
+                "path": path,
+            }
+            future.set_result(dict(anchored, neo_proof=proof))
+
+    def close(self) -> None:
+        """Anchor whatever is still pending and stop the batcher thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
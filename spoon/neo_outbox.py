@@ -0,0 +1,195 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from spoon.tools.neo_tool import NeoTool
+from spoon.tools.storage_tool import StorageTool
+
+logger = logging.getLogger("gatten_gate.neo")
+
+_FILENAME = "neo_outbox.jsonl"
+
+# on_anchored(permit_id, neo_result)
+AnchoredCallback = Callable[[str, Dict[str, Any]], None]
+
+
+class NeoOutbox:
+    """Durable queue of permits waiting to be anchored on Neo.
+
+    ``neo_outbox.jsonl`` is an event log: an ``enqueued`` line per permit, a
+    ``written`` line with the transaction once its Neo write succeeded and an
+    ``anchored`` line once ``on_anchored`` took it. Replaying it on start-up
+    recovers every permit still pending, so nothing is lost across restarts.
+    A worker thread drains due entries through ``NeoTool`` and reports each
+    written transaction to ``on_anchored``, retrying failures of either with
+    exponential backoff. A permit with a written transaction only has the
+    callback retried, so it is never anchored twice.
+    """
+
+    def __init__(
+        self,
+        storage: StorageTool,
+        neo_tool: NeoTool,
+        on_anchored: AnchoredCallback,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+    ) -> None:
+        self.storage = storage
+        self.neo_tool = neo_tool
+        self.on_anchored = on_anchored
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        # permit_id -> {"args": remaining NeoTool kwargs, "attempts": n, "due": monotonic time,
+        #               "result": NeoTool result, once written}
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._load()
+        if self._pending:
+            self._start()
+
+    def _load(self) -> None:
+        path = os.path.join(self.storage.base_dir, _FILENAME)
+        self.storage.flush(_FILENAME)
+        if not os.path.exists(path):
+            return
+        lines = 0
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                lines += 1
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if event.get("event") == "enqueued":
+                    self._pending[event["permit_id"]] = {"args": event["args"], "attempts": 0, "due": 0.0}
+                elif event.get("event") == "written":
+                    if event["permit_id"] in self._pending:
+                        self._pending[event["permit_id"]]["result"] = event["result"]
+                elif event.get("event") == "anchored":
+                    self._pending.pop(event["permit_id"], None)
+        if lines > 3 * len(self._pending):
+            # Keep the log proportional to the backlog, not to its history.
+            self.storage.close(_FILENAME)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for permit_id, entry in self._pending.items():
+                    f.write(json.dumps({"event": "enqueued", "permit_id": permit_id, "args": entry["args"]}) + "\n")
+                    if "result" in entry:
+                        event = {"event": "written", "permit_id": permit_id, "result": entry["result"]}
+                        f.write(json.dumps(event) + "\n")
+            os.replace(tmp_path, path)
+
+    def _start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="neo-outbox", daemon=True)
+            self._thread.start()
+
+    def enqueue(self, permit_id: str, **args: Any) -> None:
+        """Durably record a pending anchor; it is written before this returns."""
+        self.storage.append_jsonl(
+            _FILENAME, {"event": "enqueued", "permit_id": permit_id, "args": args}, durability="fsync"
+        )
+        with self._cond:
+            self._pending[permit_id] = {"args": args, "attempts": 0, "due": 0.0}
+            self._start()
+            self._cond.notify()
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def _due(self) -> List[str]:
+        with self._cond:
+            while not self._closed:
+                now = time.monotonic()
+                due = [pid for pid, entry in self._pending.items() if entry["due"] <= now]
+                if due:
+                    return due
+                wake = min((entry["due"] for entry in self._pending.values()), default=None)
+                self._cond.wait(None if wake is None else wake - now)
+            return []
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        try:
+            while True:
+                due = self._due()
+                if not due:
+                    return
+                loop.run_until_complete(self._drain(due))
+        finally:
+            loop.close()
+
+    async def _drain(self, permit_ids: List[str]) -> None:
+        # Sent together so NeoTool can anchor them in one batch when batching is on.
+        with self._cond:
+            calls = [
+                (pid, self._pending[pid]["args"])
+                for pid in permit_ids
+                if pid in self._pending and "result" not in self._pending[pid]
+            ]
+        results = await asyncio.gather(*(self.neo_tool(permit_id=pid, **args) for pid, args in calls), return_exceptions=True)
+        for (permit_id, _), result in zip(calls, results):
+            if isinstance(result, BaseException):
+                self._retry_later(permit_id, result)
+                continue
+            # Record the transaction before anything else can fail: from here on
+            # only the callback is retried, never the Neo write.
+            self.storage.append_jsonl(
+                _FILENAME, {"event": "written", "permit_id": permit_id, "result": result}, durability="fsync"
+            )
+            with self._cond:
+                if permit_id in self._pending:
+                    self._pending[permit_id]["result"] = result
+        with self._cond:
+            written = [
+                (pid, self._pending[pid]["result"])
+                for pid in permit_ids
+                if pid in self._pending and "result" in self._pending[pid]
+            ]
+        for permit_id, result in written:
+            # Update the permit before marking the entry done: a crash in between
+            # reports the written transaction again on restart.
+            try:
+                self.on_anchored(permit_id, result)
+            except Exception as exc:
+                logger.exception("NEO_OUTBOX: anchored callback failed permit_id=%s", permit_id)
+                self._retry_later(permit_id, exc, stage="callback")
+                continue
+            self.storage.append_jsonl(
+                _FILENAME, {"event": "anchored", "permit_id": permit_id, "tx_hash": result.get("tx_hash")}
+            )
+            with self._cond:
+                self._pending.pop(permit_id, None)
+
+    def _retry_later(self, permit_id: str, exc: BaseException, stage: str = "anchor") -> None:
+        with self._cond:
+            entry = self._pending.get(permit_id)
+            if entry is None:
+                return
+            entry["attempts"] += 1
+            delay = min(self.base_delay * 2 ** (entry["attempts"] - 1), self.max_delay)
+            entry["due"] = time.monotonic() + delay
+        logger.warning(
+            "NEO_OUTBOX: %s failed permit_id=%s attempt=%d retry_in=%.1fs error=%s",
+            stage,
+            permit_id,
+            entry["attempts"],
+            delay,
+            exc,
+        )
+
+    def close(self) -> None:
+        """Stop the worker. Entries still pending stay in the log for the next start."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
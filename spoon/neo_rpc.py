@@ -0,0 +1,127 @@
+import base64
+import secrets
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import httpx
+from neo3 import vm
+from neo3.contracts import utils as contractutils
+from neo3.core import cryptography, types
+from neo3.core import utils as coreutils
+from neo3.network.payloads import transaction, verification
+from neo3.wallet.account import Account
+
+# Contract arguments as the Python values ScriptBuilder pushes (ByteArray for bytes).
+ContractArg = Union[str, bytes, int, bool]
+
+_DEFAULT_VALID_BLOCKS = 5760
+
+
+class NeoRpcError(RuntimeError):
+    pass
+
+
+class NeoRpcClient:
+    """Signs and sends contract invocations over Neo N3 JSON-RPC.
+
+    One pooled keep-alive HTTP client is shared by every call, and the signing
+    key is decoded from the WIF once. ``invoke`` test-runs the script to get
+    the system fee, asks the node for the network fee, signs locally and
+    broadcasts, returning the transaction hash and fees as a dict. The client
+    is thread-safe.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        wif: str,
+        contract_hash: str,
+        timeout: float = 30.0,
+        max_connections: int = 16,
+    ) -> None:
+        self.url = url
+        self.contract_hash = types.UInt160.from_string(contract_hash)
+        self._private_key = Account.private_key_from_wif(wif)
+        public_key = cryptography.KeyPair(self._private_key).public_key
+        self._verification_script = contractutils.create_signature_redeemscript(public_key)
+        self.account = coreutils.to_script_hash(self._verification_script)
+        self._http = httpx.Client(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+        self._lock = threading.Lock()
+        self._ids = 0
+        self._magic: Optional[int] = None
+        self._valid_blocks = _DEFAULT_VALID_BLOCKS
+
+    def _call(self, method: str, params: Sequence[Any] = ()) -> Any:
+        with self._lock:
+            self._ids += 1
+            request_id = self._ids
+        try:
+            response = self._http.post(
+                self.url, json={"jsonrpc": "2.0", "id": request_id, "method": method, "params": list(params)}
+            )
+            response.raise_for_status()
+            body = response.json()
+        except (httpx.HTTPError, ValueError) as exc:
+            raise NeoRpcError(f"{method} failed: {exc}") from exc
+        if body.get("error"):
+            error = body["error"]
+            raise NeoRpcError(f"{method} failed: {error.get('message', error)}")
+        return body.get("result")
+
+    def _network(self) -> int:
+        if self._magic is None:
+            protocol = self._call("getversion")["protocol"]
+            self._valid_blocks = int(protocol.get("maxvaliduntilblockincrement", _DEFAULT_VALID_BLOCKS))
+            self._magic = int(protocol["network"])
+        return self._magic
+
+    def _witness(self, signature: bytes = b"") -> verification.Witness:
+        invocation = vm.ScriptBuilder().emit_push(signature).to_array() if signature else b""
+        return verification.Witness(invocation, self._verification_script)
+
+    def invoke(self, method: str, args: List[ContractArg]) -> Dict[str, Any]:
+        """Invoke ``method`` on the configured contract and broadcast the signed transaction."""
+        magic = self._network()
+        script = vm.ScriptBuilder().emit_contract_call_with_args(self.contract_hash, method, args).to_array()
+        signer = verification.Signer(self.account, verification.WitnessScope.CALLED_BY_ENTRY)
+
+        dry_run = self._call(
+            "invokescript",
+            [base64.b64encode(script).decode("ascii"), [{"account": f"0x{self.account}", "scopes": "CalledByEntry"}]],
+        )
+        if dry_run.get("state") != "HALT":
+            raise NeoRpcError(f"{method} faulted: {dry_run.get('exception') or dry_run.get('state')}")
+        stack = dry_run.get("stack") or []
+        if stack and stack[0].get("type") == "Boolean" and not stack[0].get("value"):
+            raise NeoRpcError(f"{method} returned false")
+
+        tx = transaction.Transaction(
+            version=0,
+            nonce=secrets.randbits(32),
+            system_fee=int(dry_run["gasconsumed"]),
+            network_fee=0,
+            valid_until_block=int(self._call("getblockcount")) + self._valid_blocks - 1,
+            attributes=[],
+            signers=[signer],
+            script=script,
+            witnesses=[self._witness()],
+        )
+        tx.network_fee = int(
+            self._call("calculatenetworkfee", [base64.b64encode(tx.to_array()).decode("ascii")])["networkfee"]
+        )
+        message = magic.to_bytes(4, "little") + tx.hash().to_array()
+        tx.witnesses = [self._witness(cryptography.sign(message, self._private_key))]
+
+        sent = self._call("sendrawtransaction", [base64.b64encode(tx.to_array()).decode("ascii")])
+        return {
+            "tx_hash": sent["hash"],
+            "system_fee": tx.system_fee,
+            "network_fee": tx.network_fee,
+            "valid_until_block": tx.valid_until_block,
+        }
+
+    def close(self) -> None:
+        self._http.close()
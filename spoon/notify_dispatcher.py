@@ -0,0 +1,189 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from spoon.config import SETTINGS
+from spoon.tools.notify_tool import NotifyTool
+from spoon.tools.storage_tool import StorageTool
+
+logger = logging.getLogger("gatten_gate.notify")
+
+_SPILL = "notify_spill.jsonl"
+_DRAINING = "notify_spill.draining.jsonl"
+
+QUEUED = "QUEUED"
+SPILLED = "SPILLED"
+
+Notification = Tuple[str, Dict[str, Any]]
+
+
+class NotifyDispatcher:
+    """Sends notifications from a worker thread so requests do not wait for them.
+
+    ``submit`` queues a notification and returns at once. The worker hands them
+    to ``NotifyTool.send_batch`` up to ``batch_size`` at a time, waiting up to
+    ``batch_window`` seconds for a batch to fill. At most ``max_queue`` wait in
+    memory: beyond that, and for batches the tool failed to send, notifications
+    are appended to ``notify_spill.jsonl``. The worker sends the spill file once
+    the queue is empty and failures have backed off for ``retry_delay``; a spill
+    file left by an earlier process is sent after start-up. Delivery is at least
+    once: a spill file that fails part-way is resent whole.
+    """
+
+    def __init__(
+        self,
+        storage: StorageTool,
+        notify_tool: NotifyTool,
+        max_queue: int = 1024,
+        batch_size: int = 64,
+        batch_window: float = 0.05,
+        retry_delay: float = 1.0,
+    ) -> None:
+        self.storage = storage
+        self.notify_tool = notify_tool
+        self.max_queue = max(max_queue, 1)
+        self.batch_size = max(batch_size, 1)
+        self.batch_window = batch_window
+        self.retry_delay = retry_delay
+        self._queue: Deque[Notification] = deque()
+        self._cond = threading.Condition()
+        self._spill_lock = threading.Lock()
+        self._spill_pending = any(
+            os.path.exists(os.path.join(storage.base_dir, name)) for name in (_SPILL, _DRAINING)
+        )
+        self._retry_at = 0.0
+        self._closed = False
+        self._sent = 0
+        self._batches = 0
+        self._spilled = 0
+        self._failed = 0
+        self._thread = threading.Thread(target=self._run, name="notify-dispatcher", daemon=True)
+        self._thread.start()
+
+    def offer(self, channel: str, payload: Dict[str, Any]) -> bool:
+        """Queue one notification if there is room; returns False, without spilling it, if not."""
+        with self._cond:
+            if self._closed or len(self._queue) >= self.max_queue:
+                return False
+            self._queue.append((channel, payload))
+            # Wake the worker to open a batch or to send a full one, not per item.
+            if len(self._queue) == 1 or len(self._queue) >= self.batch_size:
+                self._cond.notify()
+            return True
+
+    def submit(self, channel: str, payload: Dict[str, Any]) -> str:
+        """Queue one notification; returns QUEUED, or SPILLED if it went to disk."""
+        if self.offer(channel, payload):
+            return QUEUED
+        self._spill([(channel, payload)])
+        return SPILLED
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "queued": len(self._queue),
+                "sent": self._sent,
+                "batches": self._batches,
+                "spilled": self._spilled,
+                "failed": self._failed,
+            }
+
+    def _spill(self, items: List[Notification]) -> None:
+        with self._spill_lock:
+            writer = self.storage.writer(_SPILL)
+            ticket = 0
+            for channel, payload in items:
+                _, ticket = writer.write({"channel": channel, "payload": payload})
+            writer.commit(ticket, SETTINGS.storage_durability)
+        with self._cond:
+            self._spilled += len(items)
+            self._spill_pending = True
+            self._cond.notify()
+
+    def _spill_due(self) -> bool:
+        return self._spill_pending and time.monotonic() >= self._retry_at
+
+    def _take(self) -> Optional[List[Notification]]:
+        """Next batch, [] when the spill file is due instead, None once closed and idle."""
+        with self._cond:
+            while not self._queue and not self._spill_due():
+                if self._closed:
+                    return None
+                wait = self._retry_at - time.monotonic() if self._spill_pending else None
+                self._cond.wait(wait)
+            if self._queue and len(self._queue) < self.batch_size and not self._closed:
+                deadline = time.monotonic() + self.batch_window
+                while len(self._queue) < self.batch_size and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+            return [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+
+    def _send(self, batch: List[Notification]) -> bool:
+        try:
+            self.notify_tool.send_batch(batch)
+        except Exception as exc:
+            logger.warning("NOTIFY: batch of %d failed, retry in %.1fs error=%s", len(batch), self.retry_delay, exc)
+            with self._cond:
+                self._failed += len(batch)
+                self._retry_at = time.monotonic() + self.retry_delay
+            return False
+        with self._cond:
+            self._sent += len(batch)
+            self._batches += 1
+        return True
+
+    def _drain_spill(self) -> None:
+        draining = os.path.join(self.storage.base_dir, _DRAINING)
+        with self._spill_lock:
+            with self._cond:
+                self._spill_pending = False
+            if not os.path.exists(draining):
+                # Take over the spill file; later spills start a new one.
+                self.storage.close(_SPILL)
+                spill = os.path.join(self.storage.base_dir, _SPILL)
+                if not os.path.exists(spill):
+                    return
+                os.replace(spill, draining)
+        items: List[Notification] = []
+        with open(draining, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                items.append((entry["channel"], entry["payload"]))
+        for start in range(0, len(items), self.batch_size):
+            if not self._send(items[start : start + self.batch_size]):
+                with self._cond:
+                    self._spill_pending = True
+                return
+        os.remove(draining)
+        with self._cond:
+            # Anything spilled while this file was being sent is next.
+            self._spill_pending = self._spill_pending or os.path.exists(os.path.join(self.storage.base_dir, _SPILL))
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take()
+            if batch is None:
+                return
+            if not batch:
+                self._drain_spill()
+            elif not self._send(batch):
+                self._spill(batch)
+
+    def close(self) -> None:
+        """Send what is queued and stop the worker. A spill file that cannot be
+        sent yet is kept for the next start."""
+        with self._cond:
+            self._closed = True
+            self._retry_at = 0.0
+            self._cond.notify_all()
+        self._thread.join()
+        self.storage.close(_SPILL)
@@ -1,14 +1,27 @@
 import asyncio
+import contextvars
+import logging
+import threading
+import time
 import uuid
+from collections import deque
+from concurrent.futures import Future
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, Optional, Set, Tuple
 
 from spoon.agents.decision_agent import DecisionAgent
 from spoon.agents.explain_agent import ExplainAgent
-from spoon.audit import AuditLogger
-from spoon.hashing import sha256_hex
-from spoon.llm import SpoonLLM
+from spoon.audit import AuditLogger, AuditWriter
+from spoon.config import SETTINGS
+from spoon.content_store import ContentStore
+from spoon.decision_cache import DecisionCache
+from spoon.hashing import canonical_bytes, sha256_hex
+from spoon.llm import LLMUnavailableError, SpoonLLM
+from spoon.neo_outbox import NeoOutbox
+from spoon.notify_dispatcher import QUEUED, NotifyDispatcher
 from spoon.permit import PermitIssuer, PermitStore
+from spoon.policy import CompiledPolicy, screen_request
 from spoon.status import APPROVED, DENIED, ERROR, EXECUTED, HOLD, REJECTED
 from spoon.tools.neo_tool import NeoTool
 from spoon.tools.notify_tool import NotifyTool
@@ -16,6 +29,19 @@ from spoon.tools.policy_tool import PolicyTool
 from spoon.tools.storage_tool import StorageTool
 from spoon.validators import ExplainValidationError, validate_explain_payload
 
+logger = logging.getLogger("gatten_gate.orchestrator")
+
+# Hedge delay used until enough explain latencies are recorded to take a percentile.
+_HEDGE_DEFAULT_DELAY = 0.5
+_HEDGE_MIN_SAMPLES = 20
+
+# Per-stage semaphores of the batch a request belongs to; unset for single requests.
+_stage_limits: contextvars.ContextVar[Dict[str, asyncio.Semaphore]] = contextvars.ContextVar("stage_limits", default={})
+
+
+class _Abandoned(Exception):
+    """Handed to coalesced waiters when the submission they joined was cancelled."""
+
 
 class Orchestrator:
     def __init__(self, policy_path: str, data_dir: str, explain_schema: str = "schemas/explain.schema.json") -> None:
@@ -26,115 +52,543 @@ class Orchestrator:
         self.notify_tool = NotifyTool(self.storage)
         self.permit_store = PermitStore(self.storage)
         self.permit_issuer = PermitIssuer(self.storage)
+        self.content_store: Optional[ContentStore] = ContentStore(self.storage) if SETTINGS.content_store else None
         self.explain_schema = explain_schema
 
-        llm = SpoonLLM()
-        self.decision_agent = DecisionAgent(llm)
-        self.explain_agent = ExplainAgent(llm)
+        self.llm = SpoonLLM()
+        self.decision_cache: Optional[DecisionCache] = None
+        if SETTINGS.decision_cache_enabled:
+            self.decision_cache = DecisionCache(
+                max_entries=SETTINGS.decision_cache_size,
+                ttl_seconds=SETTINGS.decision_cache_ttl,
+                storage=self.storage if SETTINGS.decision_cache_persist else None,
+            )
+        self.decision_agent = DecisionAgent(self.llm, cache=self.decision_cache)
+        self.explain_agent = ExplainAgent(self.llm)
+
+        self.neo_outbox: Optional[NeoOutbox] = None
+        if SETTINGS.neo_outbox:
+            self.neo_outbox = NeoOutbox(
+                self.storage,
+                self.neo_tool,
+                self._on_anchored,
+                base_delay=SETTINGS.neo_outbox_retry_base,
+                max_delay=SETTINGS.neo_outbox_retry_max,
+            )
+
+        self.notify_dispatcher: Optional[NotifyDispatcher] = None
+        if SETTINGS.notify_async:
+            self.notify_dispatcher = NotifyDispatcher(
+                self.storage,
+                self.notify_tool,
+                max_queue=SETTINGS.notify_queue_size,
+                batch_size=SETTINGS.notify_batch_size,
+                batch_window=SETTINGS.notify_batch_window_ms / 1000.0,
+                retry_delay=SETTINGS.notify_retry_delay,
+            )
+        self._audit_writer: Optional[AuditWriter] = None
+        if SETTINGS.audit_async and not SETTINGS.strict_mode:
+            self._audit_writer = AuditWriter(self.audit_logger, max_queue=SETTINGS.audit_queue_size)
+
+        # Canonical request hash -> result of the submission currently running it.
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._screened = 0
+        self._screen_denied = 0
+        self._explain_latencies: Deque[float] = deque(maxlen=256)
+        # Subsystem -> "lazy" (loads on first use), "warming", "ready", "unavailable" or "error: ...".
+        self._readiness: Dict[str, str] = {name: "lazy" for name in ("policy", "permits", "audit_index", "llm")}
 
-    def _explain_with_retries(self, user_request: str, draft_decision: str, context: Dict[str, Any]) -> Dict[str, Any]:
-        last_error = None
-        for _ in range(3):
-            payload = self.explain_agent.run(user_request, draft_decision, context)
+    def close(self) -> None:
+        """Finish queued notifications and audit records, then release the LLM
+        connection pool, policy worker processes, Neo workers and the open data files."""
+        if self.notify_dispatcher is not None:
+            self.notify_dispatcher.close()
+        if self._audit_writer is not None:
+            self._audit_writer.close()
+        self.llm.close()
+        self.policy_tool.close()
+        if self.neo_outbox is not None:
+            self.neo_outbox.close()
+        self.neo_tool.close()
+        self.storage.close_all()
+
+    def warm_up(self) -> Dict[str, str]:
+        """Do now what the first request would otherwise pay for: compile the policy,
+        read the permit store, load the audit index and ping the LLM backends.
+
+        Each step's outcome shows in ``readiness``; a failed step is logged and the
+        subsystem is left to load on first use. An unreachable LLM is reported as
+        "unavailable" since requests then fail closed.
+        """
+        steps = (
+            ("policy", self.policy_tool.snapshot),
+            ("permits", self.permit_store.load),
+            ("audit_index", self.audit_logger.load_index),
+            ("llm", self.llm.ping),
+        )
+        with self._stats_lock:
+            self._readiness.update((name, "warming") for name, _ in steps)
+        for name, step in steps:
+            started = time.perf_counter()
             try:
-                validate_explain_payload(payload, schema_path=self.explain_schema)
-                return payload
-            except ExplainValidationError as exc:
-                last_error = str(exc)
-        raise ExplainValidationError(last_error or "explain validation failed")
+                outcome = step()
+            except Exception as exc:
+                state = f"error: {exc}"
+                logger.warning("WARMUP: %s failed error=%s", name, exc)
+            else:
+                state = "unavailable" if outcome is False else "ready"
+                logger.info("WARMUP: %s %s in %.1fms", name, state, (time.perf_counter() - started) * 1000)
+            with self._stats_lock:
+                self._readiness[name] = state
+        return self.readiness()
+
+    def readiness(self) -> Dict[str, str]:
+        with self._stats_lock:
+            return dict(self._readiness)
+
+    def _on_anchored(self, permit_id: str, neo_result: Dict[str, Any]) -> None:
+        permit = self.permit_store.get(permit_id)
+        if permit is None:
+            raise LookupError(f"permit {permit_id} is not stored yet")
+        permit.neo_tx_hash = neo_result.get("tx_hash", "")
+        permit.neo_mode = neo_result.get("neo_mode", "mock")
+        permit.neo_proof = neo_result.get("neo_proof")
+        self.permit_store.save(permit)
+        self.audit_logger.append({"action": "neo_anchor", "permit_id": permit_id, "neo": neo_result})
+
+    def _with_refs(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Swap the record's explain payload, and a context of at least
+        CONTENT_STORE_CONTEXT_MIN_BYTES, for ``explain_ref`` / ``context_ref`` hashes
+        into the content store. Anything that cannot be stored stays inline."""
+        if self.content_store is None:
+            return record
+        try:
+            if record.get("explain"):
+                record["explain_ref"] = self.content_store.put(record.pop("explain"))
+            min_bytes = SETTINGS.content_store_context_min_bytes
+            if min_bytes > 0 and record.get("context"):
+                data = canonical_bytes(record["context"])
+                if len(data) >= min_bytes:
+                    record["context_ref"] = self.content_store.put_canonical(data)
+                    del record["context"]
+        except (OSError, TypeError, ValueError) as exc:
+            logger.warning("CONTENT_STORE: keeping payload inline request_id=%s error=%s", record.get("request_id"), exc)
+        return record
+
+    def _write_audit(self, record: Dict[str, Any]) -> None:
+        self.audit_logger.append(self._with_refs(record))
+
+    async def _append_audit(self, record: Dict[str, Any]) -> None:
+        """Write a gate record: before returning in strict mode, else with AUDIT_ASYNC
+        on the audit writer thread (or inline while its queue is full). Writes made
+        before returning run in a worker thread, off the event loop.
+
+        Execute reads a permit's explain payload from the content store, or without
+        one from the permit's audit record, so those are written before returning
+        either way; only the finished record is queued.
+        """
+        if self._audit_writer is None or (self.content_store is None and record.get("permit")):
+            await asyncio.to_thread(self._write_audit, record)
+            return
+        record = await asyncio.to_thread(self._with_refs, record)
+        if not self._audit_writer.offer(record):
+            await asyncio.to_thread(self._audit_writer.submit, record)
+
+    def _count_screen(self, screen: Optional[Dict[str, Any]]) -> None:
+        if screen is None:
+            return
+        with self._stats_lock:
+            self._screened += 1
+            if not screen["ok"]:
+                self._screen_denied += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            screened, denied = self._screened, self._screen_denied
+        stats: Dict[str, Any] = {
+            "prescreen": {
+                "screened": screened,
+                "denied": denied,
+                "hit_rate": denied / screened if screened else 0.0,
+            }
+        }
+        if self.notify_dispatcher is not None:
+            stats["notify"] = self.notify_dispatcher.stats()
+        if self._audit_writer is not None:
+            stats["audit"] = self._audit_writer.stats()
+        return stats
+
+    def _hedge_delay(self) -> float:
+        if SETTINGS.explain_hedge_delay_ms > 0:
+            return SETTINGS.explain_hedge_delay_ms / 1000.0
+        with self._stats_lock:
+            samples = sorted(self._explain_latencies)
+        if len(samples) < _HEDGE_MIN_SAMPLES:
+            return _HEDGE_DEFAULT_DELAY
+        return samples[min(int(len(samples) * SETTINGS.explain_hedge_percentile / 100), len(samples) - 1)]
+
+    async def _explain_attempt(self, user_request: str, draft_decision: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        started = time.perf_counter()
+        cancelled = False
+        try:
+            payload = await asyncio.to_thread(self.explain_agent.run, user_request, draft_decision, context)
+        except asyncio.CancelledError:
+            # A losing hedge attempt was cut off; its duration would drag the hedge delay down.
+            cancelled = True
+            raise
+        finally:
+            if not cancelled:
+                with self._stats_lock:
+                    self._explain_latencies.append(time.perf_counter() - started)
+        validate_explain_payload(payload, schema_path=self.explain_schema)
+        return payload
+
+    async def _explain(self, user_request: str, draft_decision: str, context: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
+        """Return a valid explain payload and the number of attempts started for it.
+
+        Without EXPLAIN_HEDGE, attempts run one after another until one validates.
+        With it, another attempt starts whenever the running ones have taken longer
+        than the hedge delay (EXPLAIN_HEDGE_DELAY_MS, or the EXPLAIN_HEDGE_PERCENTILE
+        of recent explain latencies) or one fails validation. The first valid payload
+        wins and the other attempts are cancelled. Either way at most EXPLAIN_ATTEMPTS
+        attempts start; if none validates, the last error is raised.
+        """
+        max_attempts = max(SETTINGS.explain_attempts, 1)
+        last_error: Optional[Exception] = None
+        if not SETTINGS.explain_hedge:
+            for attempt in range(1, max_attempts + 1):
+                payload = await asyncio.to_thread(self.explain_agent.run, user_request, draft_decision, context)
+                try:
+                    validate_explain_payload(payload, schema_path=self.explain_schema)
+                    return payload, attempt
+                except ExplainValidationError as exc:
+                    last_error = exc
+            raise last_error or ExplainValidationError("explain validation failed")
+
+        running: Set[asyncio.Task] = set()
+        started = 0
+        try:
+            while True:
+                if not running or (last_error is not None and started < max_attempts):
+                    if started >= max_attempts:
+                        raise last_error or ExplainValidationError("explain validation failed")
+                    running.add(asyncio.ensure_future(self._explain_attempt(user_request, draft_decision, context)))
+                    started += 1
+                    last_error = None
+                timeout = self._hedge_delay() if started < max_attempts else None
+                done, running = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    # Slower than the hedge delay: start another attempt alongside.
+                    running.add(asyncio.ensure_future(self._explain_attempt(user_request, draft_decision, context)))
+                    started += 1
+                    continue
+                for task in done:
+                    try:
+                        return task.result(), started
+                    except Exception as exc:
+                        last_error = exc
+        finally:
+            # The agent call itself runs in a worker thread and finishes in the
+            # background; only its result is dropped.
+            for task in running:
+                task.cancel()
+
+    async def _arun_tool(self, tool, **kwargs: Any) -> Any:
+        return await tool(**kwargs)
+
+    def run(self, user_request: str, context: Dict[str, Any], fresh: bool = False) -> Dict[str, Any]:
+        """Blocking wrapper around ``arun`` for callers without an event loop."""
+        return asyncio.run(self.arun(user_request, context, fresh=fresh))
+
+    def execute(self, permit_id: str, action: Dict[str, Any]) -> Dict[str, Any]:
+        """Blocking wrapper around ``aexecute`` for callers without an event loop."""
+        return asyncio.run(self.aexecute(permit_id, action))
+
+    async def arun(self, user_request: str, context: Dict[str, Any], fresh: bool = False) -> Dict[str, Any]:
+        """Gate one request. ``fresh`` forces a new LLM decision even with the cache enabled.
+
+        Identical submissions that arrive while one is already running wait for
+        it instead of repeating the pipeline (GATE_COALESCE). Each still gets its
+        own request_id and an audit record with ``coalesced_with`` set to the
+        request that produced the shared result.
+        """
+        if not SETTINGS.gate_coalesce:
+            return await self._arun(user_request, context, fresh)
+        try:
+            key = sha256_hex({"user_request": user_request, "context": context, "fresh": fresh})
+        except (TypeError, ValueError):
+            return await self._arun(user_request, context, fresh)
+
+        while True:
+            with self._inflight_lock:
+                shared = self._inflight.get(key)
+                leader = shared is None
+                if leader:
+                    shared = self._inflight[key] = Future()
+                    shared.set_running_or_notify_cancel()
+            if leader:
+                break
+            try:
+                # Shielded so that a caller giving up does not cancel the shared result.
+                result = await asyncio.shield(asyncio.wrap_future(shared))
+            except _Abandoned:
+                # The first submitter was cancelled before finishing; take over.
+                continue
+            return await self._record_coalesced(user_request, context, result)
+
+        try:
+            result = await self._arun(user_request, context, fresh)
+        except BaseException as exc:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            shared.set_exception(exc if isinstance(exc, Exception) else _Abandoned())
+            raise
+        with self._inflight_lock:
+            self._inflight.pop(key, None)
+        shared.set_result(result)
+        return result
+
+    async def _record_coalesced(
+        self, user_request: str, context: Dict[str, Any], result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        request_id = str(uuid.uuid4())
+        permit = result.get("permit")
+        await self._append_audit(
+            {
+                "request_id": request_id,
+                "user_request": user_request,
+                "context": context,
+                "coalesced_with": result["request_id"],
+                "shared_permit_id": permit["permit_id"] if permit else None,
+                "policy": result.get("policy"),
+                "status": result["status"],
+                "final_status": result["status"],
+                "reason": result.get("reason"),
+            }
+        )
+        return dict(result, request_id=request_id, coalesced_with=result["request_id"])
+
+    @asynccontextmanager
+    async def _stage(self, name: str) -> AsyncIterator[None]:
+        limit = _stage_limits.get().get(name)
+        if limit is None:
+            yield
+        else:
+            async with limit:
+                yield
+
+    async def run_batch(
+        self,
+        items: Iterable[Dict[str, Any]],
+        concurrency: Optional[int] = None,
+        stage_limits: Optional[Dict[str, int]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Gate many requests at once, yielding each result as soon as it is ready.
+
+        Each item is ``{"user_request", "context", "fresh"}``; results carry the
+        item's ``index``. At most ``concurrency`` requests are in the pipeline,
+        and the LLM decision and Neo write stages are further capped by
+        per-batch semaphores from ``stage_limits`` (``{"decision": n, "neo": m}``).
+        Explain calls and audit appends run in worker threads and the policy
+        check on the loop, limited only by ``concurrency``. Each append hashes
+        and buffers its record under the audit log's lock, so records still
+        enter the hash chain one at a time, in the order their requests finish
+        (with AUDIT_ASYNC, the order they reach the writer's queue).
+        """
+        limits = stage_limits or {
+            "decision": SETTINGS.gate_batch_decision_concurrency,
+            "neo": SETTINGS.gate_batch_neo_concurrency,
+        }
+        gate = asyncio.Semaphore(concurrency or SETTINGS.gate_batch_concurrency)
+
+        async def one(index: int, item: Dict[str, Any]) -> Dict[str, Any]:
+            async with gate:
+                try:
+                    result = await self.arun(
+                        item["user_request"], item.get("context") or {}, fresh=item.get("fresh", False)
+                    )
+                except Exception as exc:
+                    result = {"request_id": None, "status": ERROR, "reason": f"gate error: {exc}"}
+            return {"index": index, **result}
 
-    def _run_tool(self, tool, **kwargs: Any) -> Any:
-        return asyncio.run(tool(**kwargs))
+        token = _stage_limits.set({name: asyncio.Semaphore(n) for name, n in limits.items() if n > 0})
+        try:
+            tasks = [asyncio.ensure_future(one(i, item)) for i, item in enumerate(items)]
+        finally:
+            _stage_limits.reset(token)
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _decide(
+        self, user_request: str, context: Dict[str, Any], request_id: str, fresh: bool, policy: CompiledPolicy
+    ) -> Dict[str, Any]:
+        if SETTINGS.llm_stream:
+            return await self.decision_agent.astream(
+                user_request, context, policy, request_id=request_id, fresh=fresh
+            )
+        return await self.decision_agent.arun(user_request, context, request_id=request_id, fresh=fresh)
 
-    def run(self, user_request: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def _arun(self, user_request: str, context: Dict[str, Any], fresh: bool) -> Dict[str, Any]:
         request_id = str(uuid.uuid4())
-        decision = self.decision_agent.run(user_request, context, request_id=request_id)
+        decision: Dict[str, Any] = {}
         explain_payload: Dict[str, Any] = {}
         policy_result: Dict[str, Any] = {}
         status = ERROR
         reason: Optional[str] = None
         permit = None
         neo_result: Optional[Dict[str, Any]] = None
+        stage = "pipeline"
+        explain_attempts = 0
 
         try:
-            explain_payload = self._explain_with_retries(
-                user_request, decision["draft_decision"], context
-            )
-        except ExplainValidationError as exc:
-            explain_payload = {
-                "decision": decision["draft_decision"],
-                "rationale": [],
-                "assumptions": [],
-                "risks": [{"risk": "invalid explain payload", "severity": "HIGH", "mitigation": ""}],
-                "alternatives": [{"option": "manual review", "why_not": "validation failed"}],
-            }
-            policy_result = {
+            # One snapshot per request: the rules checked and the version on the
+            # permit and the Neo record come from the same policy file.
+            policy = self.policy_tool.snapshot()
+            screen = screen_request(policy, user_request, context) if SETTINGS.gate_prescreen else None
+        except Exception as exc:
+            screen = {
                 "ok": False,
-                "violations": [f"explain validation failed: {exc}"],
+                "violations": [f"policy tool error: {exc}"],
                 "risk_level": "HIGH",
                 "required_human_approval": False,
             }
+        self._count_screen(screen)
+
+        if screen is not None and not screen["ok"]:
+            stage = "prescreen"
+        else:
+            try:
+                async with self._stage("decision"):
+                    decision = await self._decide(user_request, context, request_id, fresh, policy)
+            except LLMUnavailableError as exc:
+                stage = "llm"
+                screen = {
+                    "ok": False,
+                    "violations": [f"llm unavailable: {exc}"],
+                    "risk_level": "HIGH",
+                    "required_human_approval": False,
+                    "policy_version": policy.version,
+                }
+            if decision.get("aborted"):
+                stage = "stream"
+                screen = {
+                    "ok": False,
+                    "violations": decision["violations"],
+                    "risk_level": "HIGH",
+                    "required_human_approval": False,
+                    "policy_version": policy.version,
+                }
+
+        if stage != "pipeline":
+            # Denied on the raw request, mid-generation or with no LLM backend: no explain or Neo write.
+            policy_result = screen
             status = DENIED
-            reason = f"explain validation failed: {exc}"
-            permit = None
+            reason = "; ".join(screen["violations"])
         else:
             try:
-                policy_result = self._run_tool(
-                    self.policy_tool,
-                    decision=explain_payload["decision"],
-                    context=context,
+                explain_payload, explain_attempts = await self._explain(
+                    user_request, decision["draft_decision"], context
                 )
-            except Exception as exc:
+            except ExplainValidationError as exc:
+                explain_attempts = max(SETTINGS.explain_attempts, 1)
+                explain_payload = {
+                    "decision": decision["draft_decision"],
+                    "rationale": [],
+                    "assumptions": [],
+                    "risks": [{"risk": "invalid explain payload", "severity": "HIGH", "mitigation": ""}],
+                    "alternatives": [{"option": "manual review", "why_not": "validation failed"}],
+                }
                 policy_result = {
                     "ok": False,
-                    "violations": [f"policy tool error: {exc}"],
+                    "violations": [f"explain validation failed: {exc}"],
                     "risk_level": "HIGH",
                     "required_human_approval": False,
                 }
                 status = DENIED
-                reason = f"policy tool error: {exc}"
+                reason = f"explain validation failed: {exc}"
+                permit = None
             else:
-                if policy_result["violations"]:
+                try:
+                    policy_result = await self._arun_tool(
+                        self.policy_tool,
+                        decision=explain_payload["decision"],
+                        context=context,
+                        policy=policy,
+                    )
+                except Exception as exc:
+                    policy_result = {
+                        "ok": False,
+                        "violations": [f"policy tool error: {exc}"],
+                        "risk_level": "HIGH",
+                        "required_human_approval": False,
+                    }
                     status = DENIED
-                    reason = "; ".join(policy_result["violations"])
-                elif policy_result["required_human_approval"]:
-                    status = HOLD
-                    reason = "human approval required"
+                    reason = f"policy tool error: {exc}"
                 else:
-                    permit_id = str(uuid.uuid4())
-                    permit = self.permit_issuer.issue(
-                        explain_payload=explain_payload,
-                        policy_version=self.policy_tool.version,
-                        risk_level=policy_result["risk_level"],
-                        neo_tx_hash="PENDING",
-                        permit_id=permit_id,
-                        neo_mode="pending",
-                    )
-                    try:
-                        neo_result = self._run_tool(
-                            self.neo_tool,
-                            permit_id=permit_id,
-                            decision_hash=permit.decision_hash,
-                            policy_version=self.policy_tool.version,
-                            issued_at=int(permit.issued_at.timestamp()),
-                            expires_at=int(permit.expires_at.timestamp()),
-                        )
-                    except Exception as exc:
+                    if policy_result["violations"]:
+                        status = DENIED
+                        reason = "; ".join(policy_result["violations"])
+                    elif policy_result["required_human_approval"]:
                         status = HOLD
-                        reason = f"neo write failed: {exc}"
-                        permit = None
-                        neo_result = {"tx_hash": None, "neo_mode": "error", "error": str(exc)}
+                        reason = "human approval required"
                     else:
-                        permit.neo_tx_hash = neo_result.get("tx_hash", "")
-                        permit.neo_mode = neo_result.get("neo_mode", "mock")
-                        self.permit_store.save(permit)
-                        status = APPROVED
+                        permit_id = str(uuid.uuid4())
+                        permit = self.permit_issuer.issue(
+                            explain_payload=explain_payload,
+                            policy_version=policy.version,
+                            risk_level=policy_result["risk_level"],
+                            neo_tx_hash="PENDING",
+                            permit_id=permit_id,
+                            neo_mode="pending",
+                        )
+                        neo_args = {
+                            "permit_id": permit_id,
+                            "decision_hash": permit.decision_hash,
+                            "policy_version": policy.version,
+                            "issued_at": int(permit.issued_at.timestamp()),
+                            "expires_at": int(permit.expires_at.timestamp()),
+                        }
+                        try:
+                            async with self._stage("neo"):
+                                if self.neo_outbox is not None:
+                                    # Anchored in the background; the permit is stored as
+                                    # neo_mode="pending" and updated when the outbox reports back.
+                                    await asyncio.to_thread(self.permit_store.save, permit)
+                                    await asyncio.to_thread(self.neo_outbox.enqueue, **neo_args)
+                                    neo_result = {"tx_hash": "PENDING", "neo_mode": "pending"}
+                                else:
+                                    neo_result = await self._arun_tool(self.neo_tool, **neo_args)
+                        except Exception as exc:
+                            status = HOLD
+                            reason = f"neo write failed: {exc}"
+                            permit = None
+                            neo_result = {"tx_hash": None, "neo_mode": "error", "error": str(exc)}
+                        else:
+                            if neo_result.get("neo_mode") != "pending":
+                                permit.neo_tx_hash = neo_result.get("tx_hash", "")
+                                permit.neo_mode = neo_result.get("neo_mode", "mock")
+                                permit.neo_proof = neo_result.get("neo_proof")
+                                await asyncio.to_thread(self.permit_store.save, permit)
+                            status = APPROVED
 
         notify_status = "SKIPPED"
         notify_error = None
+        notify_payload = {"request_id": request_id, "status": status}
         try:
-            self._run_tool(self.notify_tool, channel="audit", payload={"request_id": request_id, "status": status})
-            notify_status = "OK"
+            if self.notify_dispatcher is not None:
+                # Sent in the background; the record says whether it was queued or spilled to disk.
+                notify_status = QUEUED
+                if not self.notify_dispatcher.offer("audit", notify_payload):
+                    notify_status = await asyncio.to_thread(self.notify_dispatcher.submit, "audit", notify_payload)
+            else:
+                await asyncio.to_thread(self.notify_tool.send, "audit", notify_payload)
+                notify_status = "OK"
         except Exception as exc:
             notify_status = "FAILED"
             notify_error = str(exc)
@@ -144,6 +598,9 @@ class Orchestrator:
             "user_request": user_request,
             "context": context,
             "explain": explain_payload,
+            "decision_cached": decision.get("cached", False),
+            "explain_attempts": explain_attempts,
+            "stage": stage,
             "policy": policy_result,
             "status": status,
             "final_status": status,
@@ -153,7 +610,9 @@ class Orchestrator:
             "notify_status": notify_status,
             "notify_error": notify_error,
         }
-        self.audit_logger.append(audit_record)
+        if stage == "stream":
+            audit_record["partial_decision"] = decision["draft_decision"]
+        await self._append_audit(audit_record)
 
         return {
             "request_id": request_id,
@@ -165,60 +624,85 @@ class Orchestrator:
             "neo": neo_result,
         }
 
-    def execute(self, permit_id: str, action: Dict[str, Any]) -> Dict[str, Any]:
-        audit_record = self.audit_logger.find_latest_by_permit_id(permit_id)
-        if not audit_record or not audit_record.get("permit"):
-            self.audit_logger.append(
-                {
-                    "action": "execute",
-                    "permit_id": permit_id,
-                    "status": REJECTED,
-                    "final_status": REJECTED,
-                    "reason": "permit not found",
-                }
-            )
-            return {"ok": False, "status": REJECTED, "reason": "permit not found"}
+    async def _reject_missing_permit(self, permit_id: str) -> Dict[str, Any]:
+        audit_record = await asyncio.to_thread(self.audit_logger.find_latest_by_permit_id, permit_id)
+        reason = "permit not loaded" if audit_record and audit_record.get("permit") else "permit not found"
+        await asyncio.to_thread(
+            self.audit_logger.append,
+            {
+                "action": "execute",
+                "permit_id": permit_id,
+                "status": REJECTED,
+                "final_status": REJECTED,
+                "reason": reason,
+            },
+        )
+        return {"ok": False, "status": REJECTED, "reason": reason}
 
-        explain_payload = audit_record.get("explain") or {}
-        permit = self.permit_store.get(permit_id)
+    async def aexecute(self, permit_id: str, action: Dict[str, Any]) -> Dict[str, Any]:
+        # Permit, content-store and audit reads and writes touch the disk; they run
+        # in worker threads so other requests on the loop keep going.
+        permit = await asyncio.to_thread(self.permit_store.get, permit_id)
         if permit is None:
-            self.audit_logger.append(
-                {
-                    "action": "execute",
-                    "permit_id": permit_id,
-                    "status": REJECTED,
-                    "final_status": REJECTED,
-                    "reason": "permit not loaded",
-                }
-            )
-            return {"ok": False, "status": REJECTED, "reason": "permit not loaded"}
+            return await self._reject_missing_permit(permit_id)
+
+        # The permit's decision_hash is the explain payload's content-store key.
+        explain_payload = None
+        if self.content_store is not None:
+            explain_payload = await asyncio.to_thread(self.content_store.get, permit.decision_hash)
+        if explain_payload is None:
+            # Issued before the content store (or with it off): the payload is inline in the audit log.
+            audit_record = await asyncio.to_thread(self.audit_logger.find_latest_by_permit_id, permit_id)
+            if not audit_record or not audit_record.get("permit"):
+                return await self._reject_missing_permit(permit_id)
+            explain_payload = audit_record.get("explain") or {}
 
         now = datetime.now(timezone.utc)
         if permit.expires_at <= now:
-            self.audit_logger.append(
+            await asyncio.to_thread(
+                self.audit_logger.append,
                 {
                     "action": "execute",
                     "permit_id": permit_id,
                     "status": REJECTED,
                     "final_status": REJECTED,
                     "reason": "permit expired",
-                }
+                },
             )
             return {"ok": False, "status": REJECTED, "reason": "permit expired"}
 
         expected_hash = sha256_hex(explain_payload)
         if permit.decision_hash != expected_hash:
-            self.audit_logger.append(
+            await asyncio.to_thread(
+                self.audit_logger.append,
                 {
                     "action": "execute",
                     "permit_id": permit_id,
                     "status": REJECTED,
                     "final_status": REJECTED,
                     "reason": "decision hash mismatch",
-                }
+                },
             )
             return {"ok": False, "status": REJECTED, "reason": "decision hash mismatch"}
 
+        if permit.neo_mode == "pending":
+            try:
+                accept_pending = self.policy_tool.snapshot().accept_pending_low_risk
+            except Exception:
+                accept_pending = False
+            if not (accept_pending and permit.risk_level == "LOW"):
+                await asyncio.to_thread(
+                    self.audit_logger.append,
+                    {
+                        "action": "execute",
+                        "permit_id": permit_id,
+                        "status": REJECTED,
+                        "final_status": REJECTED,
+                        "reason": "permit not anchored yet",
+                    },
+                )
+                return {"ok": False, "status": REJECTED, "reason": "permit not anchored yet"}
+
         tool = action.get("tool")
         payload = action.get("payload", {})
         tool_result = None
@@ -227,7 +711,7 @@ class Orchestrator:
 
         try:
             if tool == "neo_write":
-                tool_result = self._run_tool(
+                tool_result = await self._arun_tool(
                     self.neo_tool,
                     permit_id=permit.permit_id,
                     decision_hash=permit.decision_hash,
@@ -236,9 +720,9 @@ class Orchestrator:
                     expires_at=int(permit.expires_at.timestamp()),
                 )
             elif tool == "notify":
-                tool_result = self._run_tool(self.notify_tool, **payload)
+                tool_result = await self._arun_tool(self.notify_tool, **payload)
             elif tool == "storage":
-                tool_result = self._run_tool(self.storage, **payload)
+                tool_result = await self._arun_tool(self.storage, **payload)
             else:
                 status = REJECTED
                 reason = "unknown tool"
@@ -255,7 +739,7 @@ class Orchestrator:
             "tool": tool,
             "tool_result": tool_result,
         }
-        self.audit_logger.append(audit_entry)
+        await asyncio.to_thread(self.audit_logger.append, audit_entry)
 
         return {
             "ok": status == EXECUTED,
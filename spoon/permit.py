@@ -1,8 +1,9 @@
 import json
 import os
+import threading
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 from spoon.hashing import sha256_hex
 from spoon.tools.storage_tool import StorageTool
@@ -18,11 +19,15 @@ class Permit:
     expires_at: datetime
     neo_tx_hash: str
     neo_mode: str = "mock"
+    # Inclusion proof against the batch root anchored on Neo (NEO_BATCH_SIZE > 1).
+    neo_proof: Optional[Dict[str, Any]] = None
 
-    def to_dict(self) -> Dict[str, str]:
+    def to_dict(self) -> Dict[str, Any]:
         payload = asdict(self)
         payload["issued_at"] = self.issued_at.isoformat()
         payload["expires_at"] = self.expires_at.isoformat()
+        if self.neo_proof is None:
+            del payload["neo_proof"]
         return payload
 
     @classmethod
@@ -36,28 +41,48 @@ class Permit:
             expires_at=datetime.fromisoformat(payload["expires_at"]),
             neo_tx_hash=payload["neo_tx_hash"],
             neo_mode=payload.get("neo_mode", "mock"),
+            neo_proof=payload.get("neo_proof"),
         )
 
 
 class PermitStore:
+    """Permits by id, read from ``permits.jsonl`` on first use."""
+
     def __init__(self, storage: StorageTool) -> None:
         self.storage = storage
-        self._cache: Dict[str, Permit] = {}
+        self._cache: Optional[Dict[str, Permit]] = None
+        self._lock = threading.Lock()
         self._path = os.path.join(self.storage.base_dir, "permits.jsonl")
-        if os.path.exists(self._path):
-            with open(self._path, "r", encoding="utf-8") as f:
-                for line in f:
-                    if not line.strip():
-                        continue
-                    permit = Permit.from_dict(json.loads(line))
-                    self._cache[permit.permit_id] = permit
+
+    @property
+    def loaded(self) -> bool:
+        return self._cache is not None
+
+    def load(self) -> Dict[str, Permit]:
+        """Read the permit file now if it has not been read yet."""
+        cache = self._cache
+        if cache is not None:
+            return cache
+        with self._lock:
+            if self._cache is None:
+                cache = {}
+                self.storage.flush("permits.jsonl")
+                if os.path.exists(self._path):
+                    with open(self._path, "r", encoding="utf-8") as f:
+                        for line in f:
+                            if not line.strip():
+                                continue
+                            permit = Permit.from_dict(json.loads(line))
+                            cache[permit.permit_id] = permit
+                self._cache = cache
+            return self._cache
 
     def save(self, permit: Permit) -> None:
-        self._cache[permit.permit_id] = permit
+        self.load()[permit.permit_id] = permit
         self.storage.append_jsonl("permits.jsonl", permit.to_dict())
 
     def get(self, permit_id: str) -> Optional[Permit]:
-        return self._cache.get(permit_id)
+        return self.load().get(permit_id)
 
 
 class PermitIssuer:
@@ -0,0 +1,157 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from spoon.matcher import PatternMatcher
+
+# (st_dev, st_ino, st_mtime_ns, st_size) of the policy file a snapshot was compiled from.
+SourceKey = Tuple[int, int, int, int]
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    id: str
+    type: str
+    message: str
+    patterns: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class CompiledPolicy:
+    """Immutable, pre-processed view of policy.json.
+
+    A request evaluates against exactly one snapshot, so the rules it was
+    checked against and the ``policy_version`` recorded on its permit always
+    agree, even if the file is swapped mid-request.
+    """
+
+    version: str
+    rules: Tuple[CompiledRule, ...]
+    registered_tools: FrozenSet[str]
+    source: Optional[SourceKey] = None
+    # Whether /gate/execute accepts LOW-risk permits whose Neo anchor is still pending.
+    accept_pending_low_risk: bool = False
+    # Every rule's patterns in one automaton, tagged with the rule's index.
+    matcher: PatternMatcher = field(default=None, compare=False, repr=False)  # type: ignore[assignment]
+
+    def __post_init__(self) -> None:
+        if self.matcher is None:
+            matcher = PatternMatcher((p, i) for i, rule in enumerate(self.rules) for p in rule.patterns)
+            object.__setattr__(self, "matcher", matcher)
+
+
+def compile_policy(raw: Dict[str, Any], source: Optional[SourceKey] = None) -> CompiledPolicy:
+    rules = tuple(
+        CompiledRule(
+            id=str(rule.get("id", "")),
+            type=str(rule.get("type", "")),
+            message=rule.get("message", rule.get("id", "policy_violation")),
+            patterns=tuple(p.lower() for p in rule.get("patterns", [])),
+        )
+        for rule in raw.get("rules", [])
+    )
+    return CompiledPolicy(
+        version=raw.get("version", "v1.0"),
+        rules=rules,
+        registered_tools=frozenset(raw.get("registered_tools", [])),
+        source=source,
+        accept_pending_low_risk=bool(raw.get("accept_pending_low_risk", False)),
+    )
+
+
+def evaluate(policy: CompiledPolicy, decision: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    context = context or {}
+    lowered = decision.lower()
+    violations: List[str] = []
+    required_human_approval = False
+    risk_level = "LOW"
+
+    matched = policy.matcher.find(lowered)
+    for i, rule in enumerate(policy.rules):
+        if i in matched:
+            if rule.type == "blocklist":
+                violations.append(rule.message)
+                risk_level = "HIGH"
+            elif rule.type == "require_approval":
+                required_human_approval = True
+                risk_level = "MEDIUM"
+
+    requested_tools = set(context.get("tools", [])) if isinstance(context.get("tools"), list) else set()
+    unknown_tools = requested_tools - policy.registered_tools
+    if unknown_tools:
+        violations.append(f"unregistered tools: {', '.join(sorted(unknown_tools))}")
+        risk_level = "HIGH"
+
+    return {
+        "ok": len(violations) == 0 and not required_human_approval,
+        "violations": violations,
+        "risk_level": risk_level,
+        "required_human_approval": required_human_approval,
+        "policy_version": policy.version,
+    }
+
+
+def screen_request(policy: CompiledPolicy, user_request: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Pre-LLM screen: blocklist rules and the unregistered-tool check on the raw request.
+
+    ``require_approval`` rules are left to the full evaluation, since whether a
+    request needs approval depends on the decision drafted for it.
+    """
+    result = evaluate(policy, user_request, context)
+    if result["required_human_approval"]:
+        result["required_human_approval"] = False
+        result["risk_level"] = "HIGH" if result["violations"] else "LOW"
+    result["ok"] = not result["violations"]
+    return result
+
+
+class StreamScreen:
+    """Watches a decision for blocklist patterns while it is being generated."""
+
+    def __init__(self, policy: CompiledPolicy) -> None:
+        self._scanner = policy.matcher.scanner()
+        self._blocklist = [i for i, rule in enumerate(policy.rules) if rule.type == "blocklist"]
+        self._rules = policy.rules
+
+    def feed(self, piece: str) -> List[str]:
+        """Scan the next piece; return the messages of blocklist rules hit so far."""
+        found = self._scanner.feed(piece.lower())
+        return [self._rules[i].message for i in self._blocklist if i in found]
+
+
+BatchItem = Tuple[str, Optional[Dict[str, Any]]]
+
+
+def evaluate_batch(policy: CompiledPolicy, items: Sequence[BatchItem]) -> List[Dict[str, Any]]:
+    """Evaluate many (decision, context) pairs against one snapshot.
+
+    An item that cannot be evaluated fails closed on its own instead of
+    failing the whole batch.
+    """
+    results = []
+    for decision, context in items:
+        try:
+            results.append(evaluate(policy, decision, context))
+        except Exception as exc:
+            results.append(
+                {
+                    "ok": False,
+                    "violations": [f"policy tool error: {exc}"],
+                    "risk_level": "HIGH",
+                    "required_human_approval": False,
+                    "policy_version": policy.version,
+                }
+            )
+    return results
+
+
+_worker_policy: Optional[CompiledPolicy] = None
+
+
+def _init_worker(policy: CompiledPolicy) -> None:
+    global _worker_policy
+    _worker_policy = policy
+
+
+def _evaluate_chunk(items: Sequence[BatchItem]) -> List[Dict[str, Any]]:
+    assert _worker_policy is not None
+    return evaluate_batch(_worker_policy, items)
@@ -1,14 +1,18 @@
+import asyncio
 import os
 import re
 import shutil
 import subprocess
+import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from spoon_ai.tools.base import BaseTool
 
 from spoon.config import SETTINGS
+from spoon.neo_batch import NeoBatcher, permit_leaf
+from spoon.neo_rpc import ContractArg, NeoRpcClient
 from spoon.tools.storage_tool import StorageTool
 
 
@@ -33,6 +37,10 @@ class NeoTool(BaseTool):
     simulate: bool = True
     storage: StorageTool = Field(exclude=True)
 
+    _batcher: Optional[NeoBatcher] = PrivateAttr(default=None)
+    _rpc: Optional[NeoRpcClient] = PrivateAttr(default=None)
+    _rpc_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
     def __init__(self, storage: StorageTool, **kwargs: Any) -> None:
         super().__init__(storage=storage, **kwargs)
         self.simulate = True
@@ -63,26 +71,23 @@ class NeoTool(BaseTool):
         match = re.search(r"0x[a-fA-F0-9]{64}", text)
         return match.group(0) if match else None
 
-    def _write_real(
-        self,
-        permit_id: str,
-        decision_hash: str,
-        policy_version: str,
-        issued_at: int,
-        expires_at: int,
-    ) -> Dict[str, Any]:
+    def _get_rpc(self) -> NeoRpcClient:
+        with self._rpc_lock:
+            if self._rpc is None:
+                self._rpc = NeoRpcClient(
+                    SETTINGS.neo_rpc_url,
+                    SETTINGS.neo_wif,
+                    SETTINGS.neo_contract_hash,
+                    timeout=SETTINGS.neo_tx_timeout,
+                )
+            return self._rpc
+
+    def _invoke_neoxp(self, method: str, *args: ContractArg) -> Dict[str, Any]:
         cmd = os.getenv("NEO_EXPRESS_CMD", "neoxp")
         if not shutil.which(cmd):
             raise NeoToolError("neoxp CLI not found (install Neo Express)")
 
-        if SETTINGS.neo_simulate:
-            raise NeoToolError("NEO_SIMULATE=1 set; refusing real tx")
-
-        if not SETTINGS.neo_rpc_url or not SETTINGS.neo_wif or not SETTINGS.neo_contract_hash:
-            raise NeoToolError("missing NEO_RPC_URL / NEO_WIF / NEO_CONTRACT_HASH")
-
-        decision_hash_hex = decision_hash if decision_hash.startswith("0x") else f"0x{decision_hash}"
-        args = [
+        command = [
             cmd,
             "contract",
             "invoke",
@@ -93,20 +98,12 @@ class NeoTool(BaseTool):
             "--hash",
             SETTINGS.neo_contract_hash,
             "--method",
-            "register_permit",
-            "--arg",
-            permit_id,
-            "--arg",
-            decision_hash_hex,
-            "--arg",
-            str(issued_at),
-            "--arg",
-            str(expires_at),
-            "--arg",
-            policy_version,
+            method,
         ]
+        for arg in args:
+            command += ["--arg", f"0x{arg.hex()}" if isinstance(arg, bytes) else str(arg)]
 
-        result = subprocess.run(args, capture_output=True, text=True)
+        result = subprocess.run(command, capture_output=True, text=True)
         output = "\n".join([result.stdout, result.stderr])
         if result.returncode != 0:
             raise NeoToolError(f"neoxp invoke failed: {output.strip()}")
@@ -114,20 +111,91 @@ class NeoTool(BaseTool):
         tx_hash = self._extract_tx_hash(output)
         if not tx_hash:
             raise NeoToolError(f"tx hash not found in output: {output.strip()}")
+        return {"tx_hash": tx_hash}
+
+    def _invoke(self, method: str, *args: ContractArg) -> Dict[str, Any]:
+        """Invoke a contract method and return its receipt (``tx_hash`` plus fees when known).
 
+        Goes through the in-process JSON-RPC client unless NEO_CLIENT=neoxp.
+        """
+        if SETTINGS.neo_simulate:
+            raise NeoToolError("NEO_SIMULATE=1 set; refusing real tx")
+
+        if not SETTINGS.neo_rpc_url or not SETTINGS.neo_wif or not SETTINGS.neo_contract_hash:
+            raise NeoToolError("missing NEO_RPC_URL / NEO_WIF / NEO_CONTRACT_HASH")
+
+        if SETTINGS.neo_client == "neoxp":
+            return self._invoke_neoxp(method, *args)
+        return self._get_rpc().invoke(method, list(args))
+
+    def _write_real(
+        self,
+        permit_id: str,
+        decision_hash: str,
+        policy_version: str,
+        issued_at: int,
+        expires_at: int,
+    ) -> Dict[str, Any]:
+        decision_bytes = bytes.fromhex(decision_hash[2:] if decision_hash.startswith("0x") else decision_hash)
+        receipt = self._invoke("register_permit", permit_id, decision_bytes, issued_at, expires_at, policy_version)
         record = {
             "permit_id": permit_id,
             "decision_hash": decision_hash,
             "policy_version": policy_version,
             "issued_at": issued_at,
             "expires_at": expires_at,
-            "tx_hash": tx_hash,
+            **receipt,
             "timestamp": int(time.time()),
             "mode": "real",
             "rpc_url": SETTINGS.neo_rpc_url,
         }
         self.storage.append_jsonl("neo_tx.jsonl", record)
-        return {"tx_hash": tx_hash, "neo_mode": "real", "rpc_url": SETTINGS.neo_rpc_url}
+        return {**receipt, "neo_mode": "real", "rpc_url": SETTINGS.neo_rpc_url}
+
+    def _real_mode(self) -> bool:
+        return bool(SETTINGS.neo_rpc_url and SETTINGS.neo_wif and SETTINGS.neo_contract_hash and not SETTINGS.neo_simulate)
+
+    def _anchor_batch(self, batch_id: str, merkle_root: str, leaves: List[str]) -> Dict[str, Any]:
+        """Register one batch root, on chain or simulated, and record it in neo_tx.jsonl."""
+        anchored_at = int(time.time())
+        if self._real_mode():
+            tx_hash = self._invoke(
+                "register_batch_root", batch_id, bytes.fromhex(merkle_root), len(leaves), anchored_at
+            )["tx_hash"]
+            mode = "real"
+        else:
+            tx_hash = f"MOCK_TX_{batch_id[:24]}"
+            mode = "mock"
+        self.storage.append_jsonl(
+            "neo_tx.jsonl",
+            {
+                "batch_id": batch_id,
+                "merkle_root": merkle_root,
+                "count": len(leaves),
+                "leaves": leaves,
+                "tx_hash": tx_hash,
+                "timestamp": anchored_at,
+                "mode": mode,
+            },
+        )
+        return {"tx_hash": tx_hash, "neo_mode": mode, "rpc_url": SETTINGS.neo_rpc_url}
+
+    def _get_batcher(self) -> NeoBatcher:
+        if self._batcher is None:
+            self._batcher = NeoBatcher(
+                self._anchor_batch,
+                max_size=SETTINGS.neo_batch_size,
+                window=SETTINGS.neo_batch_window_ms / 1000.0,
+            )
+        return self._batcher
+
+    def close(self) -> None:
+        if self._batcher is not None:
+            self._batcher.close()
+            self._batcher = None
+        if self._rpc is not None:
+            self._rpc.close()
+            self._rpc = None
 
     async def execute(
         self,
@@ -137,6 +205,17 @@ class NeoTool(BaseTool):
         issued_at: int,
         expires_at: int,
     ) -> Dict[str, Any]:
-        if SETTINGS.neo_rpc_url and SETTINGS.neo_wif and SETTINGS.neo_contract_hash and not SETTINGS.neo_simulate:
-            return self._write_real(permit_id, decision_hash, policy_version, issued_at, expires_at)
-        return self._write_simulated(permit_id, decision_hash, policy_version, issued_at, expires_at)
+        if SETTINGS.neo_batch_size > 1:
+            # Anchored with other permits under one Merkle root; the result
+            # carries this permit's inclusion proof (neo_proof).
+            leaf = permit_leaf(permit_id, decision_hash, policy_version, issued_at, expires_at)
+            return await asyncio.wrap_future(self._get_batcher().submit(leaf))
+        if self._real_mode():
+            # Both clients block (HTTP round trips or a subprocess); keep them off the event loop.
+            return await asyncio.to_thread(
+                self._write_real, permit_id, decision_hash, policy_version, issued_at, expires_at
+            )
+        # The simulated write appends to neo_tx.jsonl, which may flush or fsync.
+        return await asyncio.to_thread(
+            self._write_simulated, permit_id, decision_hash, policy_version, issued_at, expires_at
+        )
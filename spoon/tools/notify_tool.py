@@ -1,8 +1,10 @@
-from typing import Any, Dict
+import asyncio
+from typing import Any, Dict, Iterable, Tuple
 
 from pydantic import Field
 from spoon_ai.tools.base import BaseTool
 
+from spoon.config import SETTINGS
 from spoon.tools.storage_tool import StorageTool
 
 
@@ -26,6 +28,15 @@ class NotifyTool(BaseTool):
     def send(self, channel: str, payload: Dict[str, Any]) -> None:
         self.storage.append_jsonl("notifications.jsonl", {"channel": channel, **payload})
 
+    def send_batch(self, notifications: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """``send`` for several (channel, payload) pairs, committed with one flush."""
+        writer = self.storage.writer("notifications.jsonl")
+        ticket = 0
+        for channel, payload in notifications:
+            _, ticket = writer.write({"channel": channel, **payload})
+        if ticket:
+            writer.commit(ticket, SETTINGS.storage_durability)
+
     async def execute(self, channel: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        self.send(channel, payload)
+        await asyncio.to_thread(self.send, channel, payload)
         return {"notified": True}
@@ -1,9 +1,23 @@
 import json
-from typing import Any, Dict, List
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
 
+from pydantic import PrivateAttr
 from spoon_ai.tools.base import BaseTool
 
 from spoon.config import SETTINGS
+from spoon.policy import (
+    BatchItem,
+    CompiledPolicy,
+    _evaluate_chunk,
+    _init_worker,
+    compile_policy,
+    evaluate,
+    evaluate_batch,
+)
 
 
 def _load_policy(path: str) -> Dict[str, Any]:
@@ -24,41 +38,104 @@ class PolicyTool(BaseTool):
     }
     policy_path: str = SETTINGS.policy_path
 
+    _snapshot: Optional[CompiledPolicy] = PrivateAttr(default=None)
+    _reload_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _pool: Optional[ProcessPoolExecutor] = PrivateAttr(default=None)
+    _pool_policy: Optional[CompiledPolicy] = PrivateAttr(default=None)
+    _pool_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _pool_users: Dict[ProcessPoolExecutor, int] = PrivateAttr(default_factory=dict)
+
     def _load(self) -> Dict[str, Any]:
         return _load_policy(self.policy_path)
 
+    def snapshot(self) -> CompiledPolicy:
+        """Current compiled policy; recompiled only when the file's identity changes."""
+        st = os.stat(self.policy_path)
+        source = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+        current = self._snapshot
+        if current is not None and current.source == source:
+            return current
+        with self._reload_lock:
+            if self._snapshot is None or self._snapshot.source != source:
+                # Readers keep whichever snapshot they already hold; the swap is a
+                # single reference assignment. A file that fails to parse raises and
+                # leaves no half-loaded policy behind.
+                self._snapshot = compile_policy(self._load(), source)
+            return self._snapshot
+
     @property
     def version(self) -> str:
-        return self._load().get("version", "v1.0")
-
-    async def execute(self, decision: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
-        context = context or {}
-        policy = self._load()
-        lowered = decision.lower()
-        violations: List[str] = []
-        required_human_approval = False
-        risk_level = "LOW"
-
-        for rule in policy.get("rules", []):
-            patterns = [p.lower() for p in rule.get("patterns", [])]
-            if any(p in lowered for p in patterns):
-                if rule.get("type") == "blocklist":
-                    violations.append(rule.get("message", rule.get("id", "policy_violation")))
-                    risk_level = "HIGH"
-                elif rule.get("type") == "require_approval":
-                    required_human_approval = True
-                    risk_level = "MEDIUM"
-
-        registered_tools = set(policy.get("registered_tools", []))
-        requested_tools = set(context.get("tools", [])) if isinstance(context.get("tools"), list) else set()
-        unknown_tools = requested_tools - registered_tools
-        if unknown_tools:
-            violations.append(f"unregistered tools: {', '.join(sorted(unknown_tools))}")
-            risk_level = "HIGH"
-
-        return {
-            "ok": len(violations) == 0 and not required_human_approval,
-            "violations": violations,
-            "risk_level": risk_level,
-            "required_human_approval": required_human_approval,
-        }
+        return self.snapshot().version
+
+    async def execute(
+        self,
+        decision: str,
+        context: Dict[str, Any] = None,
+        policy: Optional[CompiledPolicy] = None,
+    ) -> Dict[str, Any]:
+        return evaluate(policy or self.snapshot(), decision, context)
+
+    def _acquire_pool(self, policy: CompiledPolicy, workers: int) -> ProcessPoolExecutor:
+        # Workers receive the compiled snapshot once, at start-up; the pool is
+        # replaced when the policy file changes. A replaced pool keeps running
+        # until the batches still using it finish (see _release_pool).
+        with self._pool_lock:
+            if self._pool is None or self._pool_policy is not policy:
+                old = self._pool
+                self._pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(policy,),
+                )
+                self._pool_policy = policy
+                self._pool_users[self._pool] = 0
+                if old is not None and not self._pool_users.get(old):
+                    self._pool_users.pop(old, None)
+                    old.shutdown(wait=False)
+            self._pool_users[self._pool] += 1
+            return self._pool
+
+    def _release_pool(self, pool: ProcessPoolExecutor) -> None:
+        with self._pool_lock:
+            self._pool_users[pool] -= 1
+            if pool is not self._pool and not self._pool_users[pool]:
+                del self._pool_users[pool]
+                pool.shutdown(wait=False)
+
+    def evaluate_batch(
+        self,
+        items: Sequence[BatchItem],
+        policy: Optional[CompiledPolicy] = None,
+        workers: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Evaluate (decision, context) pairs against one snapshot, in input order.
+
+        Batches of at least POLICY_BATCH_PARALLEL_MIN items are split across a
+        process pool of POLICY_BATCH_WORKERS (default: CPU count) workers.
+        """
+        policy = policy or self.snapshot()
+        workers = workers or SETTINGS.policy_batch_workers or os.cpu_count() or 1
+        if workers <= 1 or len(items) < SETTINGS.policy_batch_parallel_min:
+            return evaluate_batch(policy, items)
+
+        size = max(len(items) // (workers * 4), 1)
+        chunks = [list(items[i : i + size]) for i in range(0, len(items), size)]
+        results: List[Dict[str, Any]] = []
+        pool = self._acquire_pool(policy, workers)
+        try:
+            for chunk_results in pool.map(_evaluate_chunk, chunks):
+                results.extend(chunk_results)
+        finally:
+            self._release_pool(pool)
+        return results
+
+    def close(self) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                # A pool still in use is left to its last batch to shut down.
+                if not self._pool_users.get(self._pool):
+                    self._pool_users.pop(self._pool, None)
+                    self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
+                self._pool_policy = None
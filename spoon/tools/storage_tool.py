@@ -1,10 +1,11 @@
-import json
+import asyncio
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from spoon_ai.tools.base import BaseTool
 
 from spoon.config import SETTINGS
+from spoon.jsonl_writer import JsonlWriter, close_under, close_writer, get_writer, peek_writer
 
 
 class StorageTool(BaseTool):
@@ -26,11 +27,41 @@ class StorageTool(BaseTool):
         super().__init__(**kwargs)
         os.makedirs(self.base_dir, exist_ok=True)
 
-    def append_jsonl(self, filename: str, payload: Dict[str, Any]) -> None:
+    def writer(self, filename: str) -> JsonlWriter:
+        return get_writer(os.path.join(self.base_dir, filename))
+
+    def append_jsonl(self, filename: str, payload: Dict[str, Any], durability: Optional[str] = None) -> int:
+        """Append one JSON line and return the byte offset it was written at.
+
+        ``durability`` (default STORAGE_DURABILITY) is one of ``buffered``,
+        ``flush`` or ``fsync``; concurrent appends share one flush or fsync.
+        """
+        writer = self.writer(filename)
+        offset, ticket = writer.write(payload)
+        writer.commit(ticket, durability or SETTINGS.storage_durability)
+        return offset
+
+    def size(self, filename: str) -> int:
+        """Logical size of ``filename``, including records still in the write buffer."""
         path = os.path.join(self.base_dir, filename)
-        with open(path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        writer = peek_writer(path)
+        if writer is not None:
+            return writer.end
+        return os.path.getsize(path) if os.path.exists(path) else 0
+
+    def flush(self, filename: str) -> None:
+        """Push buffered records to the OS so readers of the file see them."""
+        writer = peek_writer(os.path.join(self.base_dir, filename))
+        if writer is not None:
+            writer.flush()
+
+    def close(self, filename: str) -> None:
+        close_writer(os.path.join(self.base_dir, filename), SETTINGS.storage_durability)
+
+    def close_all(self) -> None:
+        """Flush and close the writers of every file under ``base_dir``; later appends reopen them."""
+        close_under(self.base_dir, SETTINGS.storage_durability)
 
     async def execute(self, filename: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        self.append_jsonl(filename, payload)
+        await asyncio.to_thread(self.append_jsonl, filename, payload)
         return {"stored": True}
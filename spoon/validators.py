@@ -1,68 +1,242 @@
+import functools
 import json
-from typing import Any, Dict, List, Optional
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_BUILTIN_SCHEMA = os.path.join(ROOT, "schemas", "explain.schema.json")
+
+# check(value, path, errors) appends one message per problem found under ``path``.
+_Check = Callable[[Any, str, List[str]], None]
+
+_ANNOTATIONS = {"$schema", "$id", "$comment", "title", "description", "default", "examples"}
+_TYPES: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+}
 
 
 class ExplainValidationError(Exception):
-    pass
+    """Raised with every problem found; ``errors`` lists them one per entry."""
+
+    def __init__(self, message: str, errors: Optional[List[str]] = None) -> None:
+        super().__init__(message)
+        self.errors = errors if errors is not None else [message]
+
+
+def _at(path: str, message: str) -> str:
+    return f"{path}: {message}" if path else message
+
+
+def _child(path: str, name: str) -> str:
+    return f"{path}.{name}" if path else name
+
+
+def _same(a: Any, b: Any) -> bool:
+    # JSON Schema equality: true is not 1.
+    return a == b and isinstance(a, bool) == isinstance(b, bool)
+
+
+def _type(arg: Any, schema: Dict[str, Any]) -> Optional[_Check]:
+    names = [arg] if isinstance(arg, str) else list(arg)
+    if any(name not in _TYPES for name in names):
+        return None
+    tests = [_TYPES[name] for name in names]
+    expected = " or ".join(names)
+
+    def check(value: Any, path: str, errors: List[str]) -> None:
+        if not any(test(value) for test in tests):
+            errors.append(_at(path, f"must be {expected}"))
+
+    return check
+
+
+def _required(arg: Any, schema: Dict[str, Any]) -> Optional[_Check]:
+    def check(value: Any, path: str, errors: List[str]) -> None:
+        if isinstance(value, dict):
+            for name in arg:
+                if name not in value:
+                    errors.append(_at(path, f"missing required field: {name}"))
+
+    return check
+
+
+def _properties(arg: Any, schema: Dict[str, Any]) -> Optional[_Check]:
+    compiled = {name: _compile(sub) for name, sub in arg.items()}
+    if any(sub is None for sub in compiled.values()):
+        return None
+
+    def check(value: Any, path: str, errors: List[str]) -> None:
+        if isinstance(value, dict):
+            for name, sub in compiled.items():
+                if name in value:
+                    sub(value[name], _child(path, name), errors)
+
+    return check
+
+
+def _additional_properties(arg: Any, schema: Dict[str, Any]) -> Optional[_Check]:
+    if not isinstance(arg, bool):
+        return None
+    allowed = frozenset(schema.get("properties", ()))
+
+    def check(value: Any, path: str, errors: List[str]) -> None:
+        if not arg and isinstance(value, dict):
+            for name in value:
+                if name not in allowed:
+                    errors.append(_at(path, f"unexpected field: {name}"))
+
+    return check
+
+
+def _items(arg: Any, schema: Dict[str, Any]) -> Optional[_Check]:
+    item_check = _compile(arg) if isinstance(arg, dict) else None
+    if item_check is None:
+        return None
+
+    def check(value: Any, path: str, errors: List[str]) -> None:
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                item_check(item, f"{path}[{index}]", errors)
 
+    return check
 
-def _require_list_str(value: Any, field: str) -> List[str]:
-    if not isinstance(value, list) or not all(isinstance(v, str) and v.strip() for v in value):
-        raise ExplainValidationError(f"{field} must be a non-empty list of strings")
-    return value
 
+def _length(kind: type, noun: str, minimum: bool) -> Callable[[Any, Dict[str, Any]], Optional[_Check]]:
+    def factory(limit: Any, schema: Dict[str, Any]) -> Optional[_Check]:
+        def check(value: Any, path: str, errors: List[str]) -> None:
+            if isinstance(value, kind):
+                if minimum and len(value) < limit:
+                    errors.append(_at(path, f"must have at least {limit} {noun}"))
+                elif not minimum and len(value) > limit:
+                    errors.append(_at(path, f"must have at most {limit} {noun}"))
+
+        return check
+
+    return factory
+
+
+def _enum(arg: Any, schema: Dict[str, Any]) -> Optional[_Check]:
+    options = list(arg)
+    listed = ", ".join(map(str, options))
+
+    def check(value: Any, path: str, errors: List[str]) -> None:
+        if not any(_same(value, option) for option in options):
+            errors.append(_at(path, f"must be one of {listed}"))
+
+    return check
+
+
+_KEYWORDS: Dict[str, Callable[[Any, Dict[str, Any]], Optional[_Check]]] = {
+    "type": _type,
+    "required": _required,
+    "properties": _properties,
+    "additionalProperties": _additional_properties,
+    "items": _items,
+    "minItems": _length(list, "items", minimum=True),
+    "maxItems": _length(list, "items", minimum=False),
+    "minLength": _length(str, "characters", minimum=True),
+    "maxLength": _length(str, "characters", minimum=False),
+    "enum": _enum,
+}
+
+
+def _compile(schema: Any) -> Optional[_Check]:
+    """Compile the JSON Schema subset the explain schema uses into one closure.
+
+    Returns None for any keyword outside that subset so the caller can fall back
+    to a full jsonschema validator.
+    """
+    if not isinstance(schema, dict):
+        return None
+    checks: List[_Check] = []
+    for keyword, arg in schema.items():
+        if keyword in _ANNOTATIONS:
+            continue
+        factory = _KEYWORDS.get(keyword)
+        check = factory(arg, schema) if factory is not None else None
+        if check is None:
+            return None
+        checks.append(check)
+
+    def run(value: Any, path: str, errors: List[str]) -> None:
+        for check in checks:
+            check(value, path, errors)
+
+    return run
+
+
+@functools.lru_cache(maxsize=None)
+def compile_schema(schema_path: str) -> Callable[[Any], List[str]]:
+    """Load ``schema_path`` once and return a function listing an instance's errors."""
+    with open(schema_path, "r", encoding="utf-8") as f:
+        schema = json.load(f)
+    check = _compile(schema)
+    if check is not None:
+
+        def errors_of(instance: Any) -> List[str]:
+            errors: List[str] = []
+            check(instance, "", errors)
+            return errors
+
+        return errors_of
 
-def _validate_schema(payload: Dict[str, Any], schema_path: Optional[str]) -> None:
-    if not schema_path:
-        return
     try:
         import jsonschema  # type: ignore
     except Exception:
-        return
-    with open(schema_path, "r", encoding="utf-8") as f:
-        schema = json.load(f)
-    jsonschema.validate(instance=payload, schema=schema)
+        return lambda instance: []
+    validator = jsonschema.validators.validator_for(schema)(schema)
+
+    def jsonschema_errors(instance: Any) -> List[str]:
+        errors = []
+        for error in validator.iter_errors(instance):
+            path = "".join(f"[{p}]" if isinstance(p, int) else f".{p}" for p in error.absolute_path)
+            errors.append(_at(path.lstrip("."), error.message))
+        return errors
+
+    return jsonschema_errors
+
+
+def _blank(value: Any) -> bool:
+    return isinstance(value, str) and not value.strip()
+
+
+def _rule_errors(payload: Dict[str, Any]) -> List[str]:
+    # Checks the schema cannot express; values of the wrong type are left to the schema.
+    errors: List[str] = []
+    if _blank(payload.get("decision")):
+        errors.append("decision: must not be blank")
+    for field in ("rationale", "assumptions"):
+        items = payload.get(field)
+        for index, item in enumerate(items if isinstance(items, list) else []):
+            if _blank(item):
+                errors.append(f"{field}[{index}]: must not be blank")
+    risks = payload.get("risks")
+    for index, risk in enumerate(risks if isinstance(risks, list) else []):
+        if isinstance(risk, dict) and risk.get("severity") == "HIGH" and not str(risk.get("mitigation") or "").strip():
+            errors.append(f"risks[{index}].mitigation: required for HIGH severity")
+    alternatives = payload.get("alternatives")
+    for index, alt in enumerate(alternatives if isinstance(alternatives, list) else []):
+        if isinstance(alt, dict):
+            for field in ("option", "why_not"):
+                if _blank(alt.get(field)):
+                    errors.append(f"alternatives[{index}].{field}: must not be blank")
+    return errors
 
 
 def validate_explain_payload(payload: Dict[str, Any], schema_path: Optional[str] = None) -> None:
+    """Check ``payload`` against the explain schema, ``schema_path`` if given, and the
+    explain rules, raising one ExplainValidationError that lists every problem."""
     if not isinstance(payload, dict):
         raise ExplainValidationError("payload must be an object")
-
-    for key in ["decision", "rationale", "assumptions", "risks", "alternatives"]:
-        if key not in payload:
-            raise ExplainValidationError(f"missing required field: {key}")
-
-    if not isinstance(payload["decision"], str) or not payload["decision"].strip():
-        raise ExplainValidationError("decision must be a non-empty string")
-
-    _require_list_str(payload["rationale"], "rationale")
-    _require_list_str(payload["assumptions"], "assumptions")
-
-    risks = payload["risks"]
-    if not isinstance(risks, list) or not risks:
-        raise ExplainValidationError("risks must be a non-empty list")
-
-    for risk in risks:
-        if not isinstance(risk, dict):
-            raise ExplainValidationError("risk entries must be objects")
-        for key in ["risk", "severity", "mitigation"]:
-            if key not in risk:
-                raise ExplainValidationError(f"risk entry missing: {key}")
-        if risk["severity"] not in {"LOW", "MEDIUM", "HIGH"}:
-            raise ExplainValidationError("invalid severity value")
-        if risk["severity"] == "HIGH" and not str(risk.get("mitigation", "")).strip():
-            raise ExplainValidationError("HIGH severity requires mitigation")
-
-    alternatives = payload["alternatives"]
-    if not isinstance(alternatives, list) or not alternatives:
-        raise ExplainValidationError("alternatives must be a non-empty list")
-    for alt in alternatives:
-        if not isinstance(alt, dict):
-            raise ExplainValidationError("alternative entries must be objects")
-        for key in ["option", "why_not"]:
-            if key not in alt:
-                raise ExplainValidationError(f"alternative entry missing: {key}")
-        if not str(alt.get("option", "")).strip() or not str(alt.get("why_not", "")).strip():
-            raise ExplainValidationError("alternative fields must be non-empty")
-
-    _validate_schema(payload, schema_path)
+    errors = compile_schema(_BUILTIN_SCHEMA)(payload)
+    if schema_path and os.path.abspath(schema_path) != _BUILTIN_SCHEMA:
+        errors = list(dict.fromkeys(errors + compile_schema(os.path.abspath(schema_path))(payload)))
+    errors += _rule_errors(payload)
+    if errors:
+        raise ExplainValidationError("; ".join(errors), errors)
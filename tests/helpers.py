@@ -0,0 +1,35 @@
+import os
+from typing import Any, Dict
+
+from spoon.orchestrator import Orchestrator
+
+POLICY_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "policies", "policy.json")
+
+
+def explain_payload(decision: str = "Deploy") -> Dict[str, Any]:
+    return {
+        "decision": decision,
+        "rationale": ["ok"],
+        "assumptions": ["ok"],
+        "risks": [{"risk": "Risk", "severity": "LOW", "mitigation": "Mitigate"}],
+        "alternatives": [{"option": "Alt", "why_not": "Slower"}],
+    }
+
+
+async def deploy(user_request, context, request_id="", fresh=False):
+    return {"draft_decision": "Deploy", "context": context}
+
+
+def explain_draft(user_request, draft_decision, context):
+    return explain_payload(draft_decision)
+
+
+def make_orchestrator(data_dir: str, decide=deploy, explain=explain_draft, policy_path: str = POLICY_PATH) -> Orchestrator:
+    """Orchestrator on ``data_dir`` with the decision and explain steps replaced by
+    ``decide`` and ``explain``; pass None to keep the real agent."""
+    orch = Orchestrator(policy_path=policy_path, data_dir=data_dir)
+    if decide is not None:
+        orch.decision_agent.arun = decide
+    if explain is not None:
+        orch.explain_agent.run = explain
+    return orch
@@ -0,0 +1,220 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from spoon.audit import AuditIntegrityError, AuditLogger, AuditWriter
+from spoon.tools.storage_tool import StorageTool
+
+import spoon.config as config
+
+
+class TestAuditIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        object.__setattr__(config.SETTINGS, "audit_hmac_secret", "test-secret")
+
+    def _permit_record(self, permit_id: str, request_id: str, decision: str):
+        return {
+            "request_id": request_id,
+            "permit": {"permit_id": permit_id},
+            "explain": {"decision": decision},
+        }
+
+    def test_latest_record_by_permit_and_request_id(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            audit = AuditLogger(StorageTool(tmp))
+            audit.append(self._permit_record("permit-1", "req-1", "first"))
+            audit.append({"action": "execute", "permit_id": "permit-1"})
+            audit.append(self._permit_record("permit-1", "req-2", "second"))
+            latest = audit.find_latest_by_permit_id("permit-1")
+            self.assertEqual(latest["explain"]["decision"], "second")
+            self.assertEqual(audit.find_latest_by_request_id("req-1")["explain"]["decision"], "first")
+            self.assertIsNone(audit.find_latest_by_permit_id("missing"))
+
+    def test_index_sees_records_from_other_loggers(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            reader = AuditLogger(StorageTool(tmp))
+            writer = AuditLogger(StorageTool(tmp))
+            writer.append(self._permit_record("permit-1", "req-1", "first"))
+            self.assertEqual(reader.find_latest_by_permit_id("permit-1")["request_id"], "req-1")
+
+    def test_index_resumes_from_last_indexed_offset(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = StorageTool(tmp)
+            audit = AuditLogger(storage)
+            audit.append(self._permit_record("permit-1", "req-1", "first"))
+            # Records written without going through the logger are picked up on restart.
+            storage.append_jsonl("audit_log.jsonl", self._permit_record("permit-2", "req-2", "second"))
+            restarted = AuditLogger(storage)
+            self.assertEqual(restarted.find_latest_by_permit_id("permit-2")["request_id"], "req-2")
+            with open(os.path.join(tmp, "audit_log.idx.jsonl"), "r", encoding="utf-8") as f:
+                offsets = [json.loads(line)["offset"] for line in f]
+            self.assertEqual(len(offsets), len(set(offsets)))
+
+    def test_stale_index_is_rebuilt(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            audit = AuditLogger(StorageTool(tmp))
+            audit.append(self._permit_record("permit-1", "req-1", "first"))
+            audit.append(self._permit_record("permit-2", "req-2", "second"))
+            os.remove(os.path.join(tmp, "audit_log.jsonl"))
+            fresh = AuditLogger(StorageTool(tmp))
+            fresh.append(self._permit_record("permit-3", "req-3", "third"))
+            self.assertIsNone(fresh.find_latest_by_permit_id("permit-2"))
+            self.assertEqual(fresh.find_latest_by_permit_id("permit-3")["request_id"], "req-3")
+
+
+class TestAuditRecovery(unittest.TestCase):
+    def setUp(self) -> None:
+        object.__setattr__(config.SETTINGS, "audit_hmac_secret", "test-secret")
+        object.__setattr__(config.SETTINGS, "audit_checkpoint_every", 2)
+
+    def tearDown(self) -> None:
+        object.__setattr__(config.SETTINGS, "audit_checkpoint_every", 100)
+
+    def test_chain_head_recovered_after_restart(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            first = AuditLogger(StorageTool(tmp)).append({"n": 1})
+            second = AuditLogger(StorageTool(tmp)).append({"n": 2})
+            self.assertEqual(second["prev_hash"], first["hash"])
+
+    def test_torn_final_line_is_tolerated(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            first = AuditLogger(StorageTool(tmp)).append({"n": 1})
+            with open(os.path.join(tmp, "audit_log.jsonl"), "a", encoding="utf-8") as f:
+                f.write('{"n": 2, "hash": "tor')
+            second = AuditLogger(StorageTool(tmp)).append({"n": 3})
+            self.assertEqual(second["prev_hash"], first["hash"])
+            with open(os.path.join(tmp, "audit_log.jsonl"), "r", encoding="utf-8") as f:
+                self.assertEqual(json.loads(f.readlines()[-1])["n"], 3)
+
+    def test_chain_follows_other_loggers(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            a = AuditLogger(StorageTool(tmp))
+            b = AuditLogger(StorageTool(tmp))
+            first = b.append({"n": 1})
+            second = a.append({"n": 2})
+            self.assertEqual(second["prev_hash"], first["hash"])
+
+    def test_checkpoint_mismatch_fails_closed(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            audit = AuditLogger(StorageTool(tmp))
+            audit.append({"n": 1})
+            audit.append({"n": 2})
+            path = os.path.join(tmp, "audit_log.jsonl")
+            with open(path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(lines[0])
+            with self.assertRaises(AuditIntegrityError):
+                AuditLogger(StorageTool(tmp))
+
+
+class TestAuditSegments(unittest.TestCase):
+    def setUp(self) -> None:
+        object.__setattr__(config.SETTINGS, "audit_hmac_secret", "test-secret")
+        object.__setattr__(config.SETTINGS, "audit_segment_records", 3)
+
+    def tearDown(self) -> None:
+        object.__setattr__(config.SETTINGS, "audit_segment_records", 0)
+
+    def _fill(self, audit: AuditLogger, count: int):
+        return [
+            audit.append({"request_id": f"req-{i}", "permit": {"permit_id": f"permit-{i}"}})
+            for i in range(count)
+        ]
+
+    def test_segments_are_sealed_and_chained(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            records = self._fill(AuditLogger(StorageTool(tmp)), 7)
+            self.assertTrue(os.path.exists(os.path.join(tmp, "audit_log.000002.jsonl")))
+            with open(os.path.join(tmp, "audit_segments.jsonl"), "r", encoding="utf-8") as f:
+                seals = [json.loads(line) for line in f]
+            self.assertEqual([s["count"] for s in seals], [3, 3])
+            self.assertEqual(seals[1]["prev_segment_hash"], seals[0]["segment_hash"])
+            self.assertEqual(records[3]["prev_hash"], records[2]["hash"])
+            restarted = AuditLogger(StorageTool(tmp)).append({"n": 8})
+            self.assertEqual(restarted["prev_hash"], records[6]["hash"])
+
+    def test_inclusion_proof_for_sealed_and_active_segments(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            audit = AuditLogger(StorageTool(tmp))
+            self._fill(audit, 5)
+            sealed = audit.inclusion_proof(permit_id="permit-1")
+            self.assertTrue(sealed["sealed"])
+            self.assertTrue(AuditLogger.verify_inclusion(sealed))
+            active = audit.inclusion_proof(request_id="req-4")
+            self.assertFalse(active["sealed"])
+            self.assertTrue(AuditLogger.verify_inclusion(active))
+            sealed["record_hash"] = active["record_hash"]
+            self.assertFalse(AuditLogger.verify_inclusion(sealed))
+
+    def test_archived_segment_keeps_chain(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            records = self._fill(AuditLogger(StorageTool(tmp)), 4)
+            os.remove(os.path.join(tmp, "audit_log.000001.jsonl"))
+            audit = AuditLogger(StorageTool(tmp))
+            self.assertIsNone(audit.find_latest_by_permit_id("permit-0"))
+            self.assertEqual(audit.find_latest_by_permit_id("permit-3")["hash"], records[3]["hash"])
+            self.assertEqual(audit.append({"n": 5})["prev_hash"], records[3]["hash"])
+
+
+
+class TestAuditDurability(unittest.TestCase):
+    def setUp(self) -> None:
+        object.__setattr__(config.SETTINGS, "audit_hmac_secret", "test-secret")
+        for name in ("strict_mode", "storage_durability"):
+            self.addCleanup(object.__setattr__, config.SETTINGS, name, getattr(config.SETTINGS, name))
+
+    def test_strict_mode_flushes_even_when_buffered(self) -> None:
+        object.__setattr__(config.SETTINGS, "strict_mode", True)
+        object.__setattr__(config.SETTINGS, "storage_durability", "buffered")
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = StorageTool(tmp)
+            audit = AuditLogger(storage)
+            for i in range(3):
+                audit.append({"request_id": f"r{i}", "status": "APPROVED"})
+            path = os.path.join(tmp, "audit_log.jsonl")
+            self.assertEqual(os.path.getsize(path), storage.size("audit_log.jsonl"))
+            storage.close("audit_log.jsonl")
+
+
+class TestAuditWriter(unittest.TestCase):
+    def setUp(self) -> None:
+        object.__setattr__(config.SETTINGS, "audit_hmac_secret", "test-secret")
+
+    def test_full_queue_appends_inline(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            audit = AuditLogger(StorageTool(tmp))
+            gate = threading.Event()
+            started = threading.Event()
+            append = audit.append
+
+            def held_append(record):
+                if threading.current_thread().name == "audit-writer":
+                    started.set()
+                    gate.wait()
+                return append(record)
+
+            audit.append = held_append
+            writer = AuditWriter(audit, max_queue=2)
+            self.assertTrue(writer.submit({"request_id": "r0"}))
+            started.wait(5)
+            # r0 is held by the worker; two more fill the queue, the rest are written inline.
+            queued = [writer.submit({"request_id": f"r{i}"}) for i in range(1, 5)]
+            self.assertEqual(queued, [True, True, False, False])
+            self.assertEqual(writer.stats()["queued"], 2)
+            self.assertIsNotNone(audit.find_latest_by_request_id("r4"))
+            self.assertIsNone(audit.find_latest_by_request_id("r1"))
+            gate.set()
+            writer.close()
+            stats = writer.stats()
+            self.assertEqual((stats["written"], stats["inline"], stats["queued"]), (3, 2, 0))
+            for i in range(5):
+                self.assertIsNotNone(audit.find_latest_by_request_id(f"r{i}"))
+            self.assertFalse(writer.submit({"request_id": "late"}))
+            self.assertIsNotNone(audit.find_latest_by_request_id("late"))
+
+
+if __name__ == "__main__":
+    unittest.main()
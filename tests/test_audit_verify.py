@@ -0,0 +1,83 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from spoon.audit import AuditLogger
+from spoon.audit_verify import verify
+from spoon.tools.storage_tool import StorageTool
+
+import spoon.config as config
+
+
+class TestAuditVerify(unittest.TestCase):
+    def setUp(self) -> None:
+        object.__setattr__(config.SETTINGS, "audit_hmac_secret", "test-secret")
+        object.__setattr__(config.SETTINGS, "audit_segment_records", 4)
+
+    def tearDown(self) -> None:
+        object.__setattr__(config.SETTINGS, "audit_segment_records", 0)
+
+    def _write(self, tmp: str, count: int = 10) -> None:
+        audit = AuditLogger(StorageTool(tmp))
+        for i in range(count):
+            audit.append({"request_id": f"req-{i}", "note": "ü" * i})
+
+    def _verify(self, tmp: str, **kwargs):
+        out = io.StringIO()
+        report = verify(tmp, secret="test-secret", workers=2, chunk_size=256, out=out, **kwargs)
+        return report, out.getvalue()
+
+    def test_clean_log_verifies_across_ranges_and_segments(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            self._write(tmp)
+            report, output = self._verify(tmp)
+            self.assertEqual(report.errors, 0, output)
+            self.assertEqual(report.records, 10)
+
+    def test_tampered_record_is_reported(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            self._write(tmp)
+            path = os.path.join(tmp, "audit_log.000002.jsonl")
+            with open(path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+            record = json.loads(lines[1])
+            record["note"] = "tampered"
+            lines[1] = json.dumps(record, ensure_ascii=False) + "\n"
+            with open(path, "w", encoding="utf-8") as f:
+                f.writelines(lines)
+            report, output = self._verify(tmp)
+            self.assertIn("hash mismatch", output)
+
+    def test_removed_record_breaks_chain(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            self._write(tmp)
+            path = os.path.join(tmp, "audit_log.jsonl")
+            with open(path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+            with open(path, "w", encoding="utf-8") as f:
+                f.writelines(lines[1:])
+            report, output = self._verify(tmp)
+            self.assertIn("prev_hash does not link", output)
+
+    def test_wrong_secret_and_archived_segment(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            self._write(tmp)
+            os.remove(os.path.join(tmp, "audit_log.000001.jsonl"))
+            report, output = self._verify(tmp)
+            self.assertEqual(report.errors, 0, output)
+            out = io.StringIO()
+            report = verify(tmp, secret="other", workers=1, out=out)
+            self.assertIn("hmac mismatch", out.getvalue())
+
+    def test_signed_seal_without_secret_is_an_error(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            self._write(tmp)
+            out = io.StringIO()
+            verify(tmp, secret="", workers=1, out=out)
+            self.assertIn("seal is signed but no secret was given", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import asyncio
+import io
+import tempfile
+import unittest
+
+from spoon.audit_verify import verify
+from spoon.status import APPROVED, DENIED, ERROR
+
+import spoon.config as config
+
+from helpers import make_orchestrator
+
+
+class TestRunBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        object.__setattr__(config.SETTINGS, "audit_hmac_secret", "test-secret")
+
+    def test_stage_limits_and_hash_chain(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            active = []
+            peak = []
+
+            async def decide(user_request, context, request_id="", fresh=False):
+                if user_request == "explode":
+                    raise RuntimeError("llm down")
+                active.append(request_id)
+                peak.append(len(active))
+                await asyncio.sleep(0.01 * (int(user_request.split()[-1]) % 3))
+                active.remove(request_id)
+                return {"draft_decision": f"Deploy {user_request}", "context": context}
+
+            orch = make_orchestrator(tmp, decide)
+
+            items = [{"user_request": f"release {i}", "context": {"tools": ["policy_check"]}} for i in range(12)]
+            items.append({"user_request": "drop the table", "context": {}})
+            items.append({"user_request": "explode", "context": {}})
+
+            async def collect():
+                return [r async for r in orch.run_batch(items, concurrency=6, stage_limits={"decision": 2})]
+
+            results = asyncio.run(collect())
+            self.assertEqual(sorted(r["index"] for r in results), list(range(14)))
+            self.assertLessEqual(max(peak), 2)
+            by_index = {r["index"]: r for r in results}
+            self.assertTrue(all(by_index[i]["status"] == APPROVED for i in range(12)))
+            self.assertEqual(by_index[12]["status"], DENIED)
+            self.assertEqual(by_index[13]["status"], ERROR)
+
+            orch.storage.flush("audit_log.jsonl")
+            report = verify(tmp, secret="test-secret", out=io.StringIO())
+            self.assertEqual((report.records, report.errors), (13, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
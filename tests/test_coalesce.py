@@ -0,0 +1,74 @@
+import asyncio
+import tempfile
+import unittest
+
+from spoon.status import APPROVED
+
+import spoon.config as config
+
+from helpers import make_orchestrator
+
+
+class TestCoalescing(unittest.TestCase):
+    def setUp(self) -> None:
+        object.__setattr__(config.SETTINGS, "audit_hmac_secret", "test-secret")
+
+    def test_identical_submissions_share_one_run(self) -> None:
+        calls = []
+
+        async def decide(user_request, context, request_id="", fresh=False):
+            calls.append(request_id)
+            await asyncio.sleep(0.05)
+            return {"draft_decision": "Deploy", "context": context}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = make_orchestrator(tmp, decide)
+
+            async def submit_all():
+                same = [orch.arun("deploy", {"env": "prod", "tools": []}) for _ in range(4)]
+                same.append(orch.arun("deploy", {"tools": [], "env": "prod"}))
+                other = orch.arun("deploy", {"env": "staging"})
+                return await asyncio.gather(*same, other)
+
+            results = asyncio.run(submit_all())
+            self.assertEqual(len(calls), 2)
+            self.assertEqual(len({r["request_id"] for r in results}), 6)
+            self.assertTrue(all(r["status"] == APPROVED for r in results))
+
+            leader = results[0]["request_id"]
+            shared = results[:5]
+            self.assertEqual({r["permit"]["permit_id"] for r in shared}, {results[0]["permit"]["permit_id"]})
+            self.assertEqual([r.get("coalesced_with") for r in shared[1:]], [leader] * 4)
+            self.assertNotIn("coalesced_with", results[5])
+
+            follower = orch.audit_logger.find_latest_by_request_id(results[1]["request_id"])
+            self.assertEqual(follower["coalesced_with"], leader)
+            self.assertEqual(follower["shared_permit_id"], results[0]["permit"]["permit_id"])
+            # The permit still resolves to the record that issued it.
+            issuing = orch.audit_logger.find_latest_by_permit_id(results[0]["permit"]["permit_id"])
+            self.assertEqual(issuing["request_id"], leader)
+
+    def test_failure_is_shared_and_not_cached(self) -> None:
+        calls = []
+
+        async def decide(user_request, context, request_id="", fresh=False):
+            calls.append(request_id)
+            await asyncio.sleep(0.05)
+            if len(calls) == 1:
+                raise RuntimeError("llm down")
+            return {"draft_decision": "Deploy", "context": context}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = make_orchestrator(tmp, decide)
+
+            async def submit_all():
+                return await asyncio.gather(*(orch.arun("deploy", {}) for _ in range(3)), return_exceptions=True)
+
+            results = asyncio.run(submit_all())
+            self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+            self.assertEqual(orch.run("deploy", {})["status"], APPROVED)
+            self.assertEqual(len(calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import glob
+import json
+import os
+import tempfile
+import unittest
+
+from spoon.content_store import ContentStore
+from spoon.hashing import sha256_hex
+from spoon.orchestrator import Orchestrator
+from spoon.status import APPROVED, EXECUTED, REJECTED
+from spoon.tools.storage_tool import StorageTool
+
+import spoon.config as config
+
+from helpers import explain_payload, make_orchestrator
+
+EXPLAIN = explain_payload()
+
+
+class TestContentStore(unittest.TestCase):
+    def test_identical_payloads_are_stored_once(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ContentStore(StorageTool(tmp))
+            digest = store.put(EXPLAIN)
+            self.assertEqual(digest, sha256_hex(EXPLAIN))
+            self.assertEqual(store.put(dict(reversed(list(EXPLAIN.items())))), digest)
+            self.assertEqual(store.get(digest), EXPLAIN)
+            self.assertEqual(len(glob.glob(os.path.join(tmp, "cas", "*", "*.json"))), 1)
+            self.assertIsNone(store.get("0" * 64))
+            self.assertIsNone(store.get("../permits"))
+
+
+class TestOrchestratorRefs(unittest.TestCase):
+    def setUp(self) -> None:
+        object.__setattr__(config.SETTINGS, "audit_hmac_secret", "test-secret")
+
+    def _audit_records(self, orch: Orchestrator):
+        orch.storage.flush("audit_log.jsonl")
+        return list(orch.audit_logger._iter_records(os.path.join(orch.storage.base_dir, "audit_log.jsonl")))
+
+    def test_execute_reads_explain_by_hash(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = make_orchestrator(tmp)
+            results = [orch.run(f"deploy {i}", {}) for i in range(2)]
+            self.assertEqual([r["status"] for r in results], [APPROVED, APPROVED])
+            self.assertEqual(results[0]["explain"], EXPLAIN)
+
+            records = self._audit_records(orch)
+            self.assertTrue(all("explain" not in r for r in records))
+            self.assertEqual({r["explain_ref"] for r in records}, {sha256_hex(EXPLAIN)})
+
+            def no_audit_scan(permit_id):
+                raise AssertionError("execute should not read the audit log")
+
+            orch.audit_logger.find_latest_by_permit_id = no_audit_scan
+            action = {"tool": "notify", "payload": {"channel": "t", "payload": {}}}
+            self.assertEqual(orch.execute(results[0]["permit"]["permit_id"], action)["status"], EXECUTED)
+
+    def test_tampered_payload_is_rejected(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = make_orchestrator(tmp)
+            result = orch.run("deploy", {})
+            path = glob.glob(os.path.join(tmp, "cas", "*", "*.json"))[0]
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(dict(EXPLAIN, decision="Drop the table"), f)
+            outcome = orch.execute(result["permit"]["permit_id"], {"tool": "notify", "payload": {}})
+            self.assertEqual((outcome["status"], outcome["reason"]), (REJECTED, "decision hash mismatch"))
+
+    def test_large_context_is_referenced(self) -> None:
+        object.__setattr__(config.SETTINGS, "content_store_context_min_bytes", 256)
+        self.addCleanup(object.__setattr__, config.SETTINGS, "content_store_context_min_bytes", 0)
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = make_orchestrator(tmp)
+            big = {"blob": "x" * 512}
+            orch.run("deploy big", big)
+            orch.run("deploy small", {"k": "v"})
+            records = self._audit_records(orch)
+            self.assertEqual(orch.content_store.get(records[0]["context_ref"]), big)
+            self.assertNotIn("context", records[0])
+            self.assertEqual(records[1]["context"], {"k": "v"})
+
+
+if __name__ == "__main__":
+    unittest.main()
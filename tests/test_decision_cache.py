@@ -0,0 +1,112 @@
+import asyncio
+import tempfile
+import threading
+import unittest
+
+from spoon.agents.decision_agent import DecisionAgent
+from spoon.decision_cache import DecisionCache
+from spoon.tools.storage_tool import StorageTool
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _CountingLLM:
+    model = "tinyllama"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def set_request_id(self, request_id: str) -> None:
+        pass
+
+    def generate(self, system: str, user: str) -> str:
+        self.calls += 1
+        return f"decision {self.calls}"
+
+    async def agenerate(self, system: str, user: str, request_id=None) -> str:
+        return self.generate(system, user)
+
+
+class TestDecisionCache(unittest.TestCase):
+    def test_lru_and_ttl_eviction(self) -> None:
+        clock = _Clock()
+        cache = DecisionCache(max_entries=2, ttl_seconds=10, clock=clock)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        self.assertEqual(cache.get("a"), "A")
+        cache.put("c", "C")  # evicts "b", the least recently used
+        self.assertIsNone(cache.get("b"))
+        clock.now += 10
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats(), {"size": 1, "hits": 1, "misses": 2, "evictions": 1})
+
+    def test_key_ignores_context_key_order(self) -> None:
+        first = DecisionCache.key("m", "s", "deploy", {"a": 1, "b": [1, 2]})
+        second = DecisionCache.key("m", "s", "deploy", {"b": [1, 2], "a": 1})
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, DecisionCache.key("other", "s", "deploy", {"a": 1, "b": [1, 2]}))
+        self.assertIsNone(DecisionCache.key("m", "s", "deploy", {"a": object()}))
+
+    def test_disk_tier_survives_restart(self) -> None:
+        clock = _Clock()
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = DecisionCache(ttl_seconds=60, storage=StorageTool(tmp), clock=clock)
+            cache.put("old", "stale")
+            clock.now += 30
+            cache.put("new", "fresh")
+
+            clock.now += 40
+            reloaded = DecisionCache(ttl_seconds=60, storage=StorageTool(tmp), clock=clock)
+            self.assertIsNone(reloaded.get("old"))
+            self.assertEqual(reloaded.get("new"), "fresh")
+
+
+class TestDecisionAgentCache(unittest.TestCase):
+    def test_repeat_requests_hit_cache_unless_fresh(self) -> None:
+        llm = _CountingLLM()
+        agent = DecisionAgent(llm, cache=DecisionCache())
+        first = agent.run("deploy", {"tools": ["policy_check"]})
+        second = asyncio.run(agent.arun("deploy", {"tools": ["policy_check"]}))
+        self.assertEqual(llm.calls, 1)
+        self.assertFalse(first["cached"])
+        self.assertTrue(second["cached"])
+        self.assertEqual(second["draft_decision"], first["draft_decision"])
+
+        fresh = agent.run("deploy", {"tools": ["policy_check"]}, fresh=True)
+        self.assertEqual(llm.calls, 2)
+        self.assertFalse(fresh["cached"])
+        self.assertEqual(agent.run("deploy", {"tools": ["policy_check"]})["draft_decision"], "decision 2")
+
+    def test_persisted_put_runs_off_the_event_loop(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = DecisionCache(storage=StorageTool(tmp))
+            threads = []
+            put = cache.put
+
+            def recording_put(key, draft):
+                threads.append(threading.current_thread())
+                put(key, draft)
+
+            cache.put = recording_put
+            agent = DecisionAgent(_CountingLLM(), cache=cache)
+            asyncio.run(agent.arun("deploy", {"tools": ["policy_check"]}))
+            self.assertEqual(len(threads), 1)
+            self.assertIsNot(threads[0], threading.main_thread())
+            cache.storage.close("decision_cache.jsonl")
+
+    def test_no_cache_by_default(self) -> None:
+        llm = _CountingLLM()
+        agent = DecisionAgent(llm)
+        agent.run("deploy", {})
+        agent.run("deploy", {})
+        self.assertEqual(llm.calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
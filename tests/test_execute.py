@@ -1,8 +1,12 @@
+import asyncio
 import os
+import queue
 import tempfile
+import threading
 import unittest
 
 from spoon.audit import AuditLogger
+from spoon.jsonl_writer import peek_writer
 from spoon.orchestrator import Orchestrator
 from spoon.permit import PermitIssuer
 from spoon.status import APPROVED, EXECUTED, REJECTED
@@ -10,6 +14,8 @@ from spoon.tools.storage_tool import StorageTool
 
 import spoon.config as config
 
+from helpers import explain_payload, make_orchestrator
+
 
 class TestExecuteFlow(unittest.TestCase):
     def setUp(self) -> None:
@@ -33,6 +39,19 @@ class TestExecuteFlow(unittest.TestCase):
             result = orch.execute("missing-permit", action={"tool": "storage", "payload": {}})
             self.assertEqual(result["status"], REJECTED)
 
+    def test_close_flushes_and_releases_data_files(self) -> None:
+        object.__setattr__(config.SETTINGS, "storage_durability", "buffered")
+        self.addCleanup(object.__setattr__, config.SETTINGS, "storage_durability", "flush")
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = make_orchestrator(tmp)
+            orch.execute("missing-permit", action={"tool": "storage", "payload": {}})
+            path = os.path.join(tmp, "audit_log.jsonl")
+            self.assertIsNotNone(peek_writer(path))
+            orch.close()
+            self.assertIsNone(peek_writer(path))
+            with open(path, "r", encoding="utf-8") as f:
+                self.assertEqual(len(f.readlines()), 1)
+
     def test_execute_accepts_with_valid_permit(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -65,6 +84,84 @@ class TestExecuteFlow(unittest.TestCase):
             )
             self.assertEqual(result["status"], EXECUTED)
 
+    def test_arun_requests_share_one_event_loop(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            started = []
+            all_started = {}
+
+            async def decide(user_request, context, request_id="", fresh=False):
+                started.append(request_id)
+                if len(started) == 20:
+                    all_started["event"].set()
+                # Only finishes once every decision has started, i.e. they overlap.
+                await asyncio.wait_for(all_started["event"].wait(), 5)
+                return {"draft_decision": "Deploy", "context": context}
+
+            orch = make_orchestrator(tmp, decide)
+
+            async def submit_all():
+                all_started["event"] = asyncio.Event()
+                return await asyncio.gather(*(orch.arun(f"req {i}", {}) for i in range(20)))
+
+            results = asyncio.run(submit_all())
+            self.assertEqual(len(started), 20)
+            self.assertTrue(all(r["status"] == APPROVED for r in results))
+            for r in results:
+                action = {"tool": "notify", "payload": {"channel": "t", "payload": {}}}
+                outcome = asyncio.run(orch.aexecute(r["permit"]["permit_id"], action=action))
+                self.assertEqual(outcome["status"], EXECUTED)
+
+    def test_blocking_writes_do_not_stall_the_loop(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            parked: "queue.Queue[threading.Event]" = queue.Queue()
+            stalled = []
+
+            def park() -> None:
+                # Only a coroutine on the loop releases each call; if the call ran
+                # on the loop, nothing could, and the wait would time out.
+                release = threading.Event()
+                parked.put(release)
+                if not release.wait(5):
+                    stalled.append(threading.current_thread().name)
+
+            def explain(user_request, draft_decision, context):
+                park()
+                return explain_payload()
+
+            orch = make_orchestrator(tmp, explain=explain)
+            append = orch.audit_logger.append
+
+            def parked_append(payload):
+                park()
+                return append(payload)
+
+            orch.audit_logger.append = parked_append
+
+            async def release_parked() -> None:
+                while True:
+                    try:
+                        parked.get_nowait().set()
+                    except queue.Empty:
+                        await asyncio.sleep(0.005)
+
+            async def with_parked_calls(calls):
+                releaser = asyncio.ensure_future(release_parked())
+                try:
+                    return await asyncio.gather(*calls)
+                finally:
+                    releaser.cancel()
+
+            async def submit_all():
+                results = await with_parked_calls([orch.arun(f"req {i}", {}) for i in range(4)])
+                action = {"tool": "notify", "payload": {"channel": "t", "payload": {}}}
+                outcomes = await with_parked_calls([orch.aexecute(r["permit"]["permit_id"], action) for r in results])
+                return results, outcomes
+
+            results, outcomes = asyncio.run(submit_all())
+            self.assertEqual(stalled, [])
+            self.assertTrue(all(r["status"] == APPROVED for r in results))
+            self.assertTrue(all(o["status"] == EXECUTED for o in outcomes))
+
 
 if __name__ == "__main__":
     unittest.main()
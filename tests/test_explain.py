@@ -1,6 +1,13 @@
+import json
+import os
+import tempfile
 import unittest
 
-from spoon.validators import ExplainValidationError, validate_explain_payload
+import jsonschema
+
+from spoon.validators import ExplainValidationError, compile_schema, validate_explain_payload
+
+SCHEMA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "schemas", "explain.schema.json")
 
 
 class TestExplainValidation(unittest.TestCase):
@@ -28,6 +35,72 @@ class TestExplainValidation(unittest.TestCase):
         with self.assertRaises(ExplainValidationError):
             validate_explain_payload(payload)
 
+    def test_reports_every_error(self) -> None:
+        payload = {
+            "decision": "  ",
+            "rationale": [],
+            "assumptions": ["Assume A", 3],
+            "risks": [{"risk": "Risk", "severity": "CRITICAL", "mitigation": "m"}, {"risk": "R", "severity": "HIGH"}],
+        }
+        with self.assertRaises(ExplainValidationError) as ctx:
+            validate_explain_payload(payload, schema_path=SCHEMA)
+        self.assertEqual(
+            sorted(ctx.exception.errors),
+            sorted(
+                [
+                    "missing required field: alternatives",
+                    "rationale: must have at least 1 items",
+                    "assumptions[1]: must be string",
+                    "risks[0].severity: must be one of LOW, MEDIUM, HIGH",
+                    "risks[1]: missing required field: mitigation",
+                    "risks[1].mitigation: required for HIGH severity",
+                    "decision: must not be blank",
+                ]
+            ),
+        )
+
+    def test_compiled_schema_agrees_with_jsonschema(self) -> None:
+        with open(SCHEMA, "r", encoding="utf-8") as f:
+            validator = jsonschema.Draft7Validator(json.load(f))
+        base = {
+            "decision": "Do",
+            "rationale": ["Because"],
+            "assumptions": ["A"],
+            "risks": [{"risk": "R", "severity": "LOW", "mitigation": "M"}],
+            "alternatives": [{"option": "O", "why_not": "W"}],
+        }
+        variants = [
+            base,
+            dict(base, decision=""),
+            dict(base, decision=1),
+            dict(base, rationale="Because"),
+            dict(base, risks=[{"risk": "R", "severity": True, "mitigation": "M"}]),
+            dict(base, risks=[None]),
+            dict(base, alternatives=[{"option": "O"}]),
+            dict(base, extra={"free": "form"}),
+            [base],
+        ]
+        check = compile_schema(SCHEMA)
+        for payload in variants:
+            self.assertEqual(bool(check(payload)), not validator.is_valid(payload), payload)
+
+    def test_unsupported_keywords_fall_back_to_jsonschema(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "strict.schema.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"type": "object", "properties": {"decision": {"type": "string", "pattern": "^[A-Z]"}}}, f)
+            payload = {
+                "decision": "lowercase",
+                "rationale": ["r"],
+                "assumptions": ["a"],
+                "risks": [{"risk": "R", "severity": "LOW", "mitigation": "M"}],
+                "alternatives": [{"option": "O", "why_not": "W"}],
+            }
+            with self.assertRaises(ExplainValidationError) as ctx:
+                validate_explain_payload(payload, schema_path=path)
+            self.assertEqual(len(ctx.exception.errors), 1)
+            self.assertTrue(ctx.exception.errors[0].startswith("decision: 'lowercase' does not match"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,101 @@
+import asyncio
+import tempfile
+import threading
+import time
+import unittest
+
+from spoon.orchestrator import Orchestrator
+from spoon.status import APPROVED
+
+import spoon.config as config
+
+from helpers import explain_payload, make_orchestrator
+
+VALID = explain_payload()
+
+
+class TestHedgedExplain(unittest.TestCase):
+    def setUp(self) -> None:
+        object.__setattr__(config.SETTINGS, "audit_hmac_secret", "test-secret")
+        for name, value in (("explain_hedge", True), ("explain_hedge_delay_ms", 20.0), ("explain_attempts", 3)):
+            self.addCleanup(object.__setattr__, config.SETTINGS, name, getattr(config.SETTINGS, name))
+            object.__setattr__(config.SETTINGS, name, value)
+
+    def _scripted(self, *steps):
+        # Each call takes the next (delay, payload) step.
+        calls = []
+        lock = threading.Lock()
+
+        def explain(user_request, draft_decision, context):
+            with lock:
+                delay, payload = steps[min(len(calls), len(steps) - 1)]
+                calls.append(delay)
+            time.sleep(delay)
+            return dict(payload)
+
+        return explain, calls
+
+    def _audit_attempts(self, orch: Orchestrator, request_id: str) -> int:
+        return orch.audit_logger.find_latest_by_request_id(request_id)["explain_attempts"]
+
+    def _timed(self, orch: Orchestrator):
+        # Timed inside the loop: asyncio.run also waits for abandoned worker threads.
+        async def go():
+            started = time.perf_counter()
+            result = await orch.arun("deploy", {})
+            return result, time.perf_counter() - started
+
+        return asyncio.run(go())
+
+    def test_slow_attempt_is_hedged(self) -> None:
+        explain, calls = self._scripted((0.5, VALID), (0.0, VALID))
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = make_orchestrator(tmp, explain=explain)
+            result, elapsed = self._timed(orch)
+            self.assertLess(elapsed, 0.4)
+            self.assertEqual(result["status"], APPROVED)
+            self.assertEqual(len(calls), 2)
+            self.assertEqual(self._audit_attempts(orch, result["request_id"]), 2)
+            # Only the attempt that finished is sampled, not the cancelled slow one.
+            self.assertEqual(len(orch._explain_latencies), 1)
+            self.assertLess(orch._explain_latencies[0], 0.4)
+
+    def test_invalid_attempt_starts_another_at_once(self) -> None:
+        explain, calls = self._scripted((0.0, dict(VALID, rationale=[])), (0.0, VALID))
+        object.__setattr__(config.SETTINGS, "explain_hedge_delay_ms", 5000.0)
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = make_orchestrator(tmp, explain=explain)
+            result, elapsed = self._timed(orch)
+            self.assertLess(elapsed, 1.0)
+            self.assertEqual(result["status"], APPROVED)
+            self.assertEqual(self._audit_attempts(orch, result["request_id"]), 2)
+
+    def test_attempts_are_capped(self) -> None:
+        explain, calls = self._scripted((0.0, dict(VALID, rationale=[])))
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = make_orchestrator(tmp, explain=explain)
+            result = orch.run("deploy", {})
+            self.assertIn("explain validation failed", result["reason"])
+            self.assertEqual(len(calls), 3)
+            self.assertEqual(self._audit_attempts(orch, result["request_id"]), 3)
+
+    def test_delay_follows_recent_latencies(self) -> None:
+        object.__setattr__(config.SETTINGS, "explain_hedge_delay_ms", 0.0)
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = make_orchestrator(tmp, explain=self._scripted((0.0, VALID))[0])
+            self.assertEqual(orch._hedge_delay(), 0.5)
+            orch._explain_latencies.extend(i / 100 for i in range(1, 101))
+            self.assertAlmostEqual(orch._hedge_delay(), 0.96)
+
+    def test_sequential_mode_records_attempts(self) -> None:
+        object.__setattr__(config.SETTINGS, "explain_hedge", False)
+        explain, calls = self._scripted((0.0, dict(VALID, rationale=[])), (0.0, VALID))
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = make_orchestrator(tmp, explain=explain)
+            result = orch.run("deploy", {})
+            self.assertEqual(result["status"], APPROVED)
+            self.assertEqual(self._audit_attempts(orch, result["request_id"]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
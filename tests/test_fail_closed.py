@@ -1,9 +1,11 @@
 import os
 import tempfile
 import unittest
+from unittest import mock
 
 from spoon.orchestrator import Orchestrator
 from spoon.status import DENIED
+from spoon.tools.policy_tool import PolicyTool
 
 import spoon.config as config
 
@@ -28,18 +30,18 @@ class TestFailClosed(unittest.TestCase):
             base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
             orch = Orchestrator(policy_path=os.path.join(base_dir, "policies", "policy.json"), data_dir=tmp)
 
-            orch.decision_agent.run = lambda user_request, context, request_id="": {
-                "draft_decision": "Deploy",
-                "context": context,
-            }
+            async def decide(user_request, context, request_id="", fresh=False):
+                return {"draft_decision": "Deploy", "context": context}
+
+            orch.decision_agent.arun = decide
             orch.explain_agent.run = lambda user_request, draft_decision, context: self._explain_payload()
 
             async def boom(*args, **kwargs):
                 raise RuntimeError("boom")
 
-            orch.policy_tool.execute = boom
-
-            result = orch.run("test", {})
+            # PolicyTool is a pydantic model, so patch the method on the class.
+            with mock.patch.object(PolicyTool, "execute", boom):
+                result = orch.run("test", {})
             self.assertEqual(result["status"], DENIED)
 
 
@@ -0,0 +1,101 @@
+import enum
+import hashlib
+import json
+import math
+import os
+import random
+import struct
+import tempfile
+import unittest
+from unittest import mock
+
+import spoon.hashing as hashing
+from spoon.audit import AuditLogger, hash_entry
+from spoon.hashing import canonical_bytes
+from spoon.tools.storage_tool import StorageTool
+
+import spoon.config as config
+
+
+def _reference(data) -> bytes:
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+class _Color(str, enum.Enum):
+    RED = "red"
+
+
+def _corpus():
+    rng = random.Random(20)
+    floats = [0.0, -0.0, 0.1, 1 / 3, 1e-4, 9.99e-5, 1e-7, 2.5e-05, 1e15, 1e16, 1e22, 1.7976931348623157e308, 5e-324]
+    floats += [10.0**k for k in range(-30, 30)]
+    while len(floats) < 5000:
+        value = struct.unpack("d", struct.pack("Q", rng.getrandbits(64)))[0]
+        if math.isfinite(value):
+            floats.append(value)
+    yield from ({"v": f} for f in floats)
+    yield {"k": [f for f in floats[:50]], "nested": {"deep": [{"x": 12.5}, -0.000025]}}
+    yield {"text": "quote \" backslash \\ slash / tab \t nl \n ctrl \x00\x1f del \x7f", "uni": "é 中文 😀  "}
+    yield {"é": 1, "e": 2, "z": 3, "Z": 4, "😀": 5, "￿": 6, "": 7}
+    yield {"ints": [0, -1, 2**63 - 1, -(2**63), 2**64, -(2**70)], "flags": [True, False, None]}
+    yield {"tuple": (1, "a"), "empty": [{}, [], ""], "int_keys": {3: "c", 1: "a"}, "str": _Color.RED}
+    yield {"uuid_like": "6f1c2a9e-3b7d-4c5e-9f10-2a3b4c5d6e7f", "hex": "ae-1e+5", "num_in_text": ":1e-7,[0.00001"}
+
+
+class TestCanonicalBytes(unittest.TestCase):
+    def test_matches_reference_encoder(self) -> None:
+        for data in _corpus():
+            self.assertEqual(canonical_bytes(data), _reference(data), data)
+
+    def test_backends_agree(self) -> None:
+        if hashing.orjson is None:
+            self.skipTest("orjson not installed")
+        corpus = list(_corpus())
+        fast = [canonical_bytes(data) for data in corpus]
+        with mock.patch.object(hashing, "_USE_ORJSON", False):
+            self.assertEqual(fast, [canonical_bytes(data) for data in corpus])
+
+    def test_non_finite_floats_keep_the_stdlib_encoding(self) -> None:
+        data = {"a": float("nan"), "b": [float("inf"), -float("inf")], "c": None, "d": (1.5, {"e": float("nan")})}
+        expected = b'{"a":NaN,"b":[Infinity,-Infinity],"c":null,"d":[1.5,{"e":NaN}]}'
+        self.assertEqual(canonical_bytes(data), expected)
+        self.assertEqual(canonical_bytes(data), _reference(data))
+        with mock.patch.object(hashing, "_USE_ORJSON", False):
+            self.assertEqual(canonical_bytes(data), expected)
+        self.assertEqual(hashing.sha256_hex(data), hashlib.sha256(expected).hexdigest())
+
+    def test_unserialisable_values_still_raise(self) -> None:
+        for data in ({"s": {1, 2}}, {"o": object()}):
+            with self.assertRaises(TypeError):
+                canonical_bytes(data)
+
+
+class TestAuditEncoding(unittest.TestCase):
+    def setUp(self) -> None:
+        object.__setattr__(config.SETTINGS, "audit_hmac_secret", "test-secret")
+
+    def test_written_line_is_the_hashed_body(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = StorageTool(tmp)
+            audit = AuditLogger(storage)
+            payload = {"request_id": "r1", "score": 1e-7, "text": "é", "hash": "caller value"}
+            record = audit.append(payload)
+            storage.flush("audit_log.jsonl")
+            with open(os.path.join(tmp, "audit_log.jsonl"), "rb") as f:
+                line = f.readline()
+
+            stored = json.loads(line)
+            self.assertEqual(stored, record)
+            body = {k: v for k, v in stored.items() if k not in ("hash", "hmac")}
+            self.assertEqual(body["hash_v"], 2)
+            self.assertTrue(line.startswith(canonical_bytes(body)[:-1]))
+            self.assertEqual(hash_entry(body, ""), record["hash"])
+
+    def test_records_without_version_keep_the_old_hash(self) -> None:
+        body = {"request_id": "r1", "timestamp": 1, "prev_hash": ""}
+        legacy = json.dumps(body, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        self.assertEqual(hash_entry(body, "prev"), hashlib.sha256(b"prev" + legacy).hexdigest())
+
+
+if __name__ == "__main__":
+    unittest.main()
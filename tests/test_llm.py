@@ -0,0 +1,109 @@
+import asyncio
+import unittest
+from unittest import mock
+
+import spoon.llm as llm_module
+from spoon.llm import SpoonLLM
+
+
+class _FakeProvider:
+    instances = []
+
+    def __init__(self) -> None:
+        self.initialized = 0
+        self.cleaned = 0
+        self.active = 0
+        self.peak = 0
+        _FakeProvider.instances.append(self)
+
+    async def initialize(self, config) -> None:
+        self.initialized += 1
+
+    async def chat(self, messages):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return mock.Mock(content="Deploy")
+
+    async def chat_stream(self, messages):
+        self.streamed = []
+        try:
+            for word in ["Deploy ", "then ", "drop ", "the ", "table"]:
+                await asyncio.sleep(0.005)
+                self.streamed.append(word)
+                yield mock.Mock(delta=word)
+        finally:
+            self.stream_closed = True
+
+    async def cleanup(self) -> None:
+        self.cleaned += 1
+
+
+class TestSpoonLLM(unittest.TestCase):
+    def setUp(self) -> None:
+        _FakeProvider.instances = []
+        patcher = mock.patch.object(llm_module, "OllamaProvider", _FakeProvider)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_provider_is_reused_and_closed_once(self) -> None:
+        llm = SpoonLLM(max_concurrency=4)
+        for _ in range(3):
+            self.assertEqual(llm.generate("system", "user"), "Deploy")
+        self.assertEqual(len(_FakeProvider.instances), 1)
+        provider = _FakeProvider.instances[0]
+        self.assertEqual((provider.initialized, provider.cleaned), (1, 0))
+
+        llm.close()
+        self.assertEqual(provider.cleaned, 1)
+        self.assertEqual(llm.stats()["completed"], 3)
+
+    def test_concurrency_is_capped(self) -> None:
+        llm = SpoonLLM(max_concurrency=3)
+        depths = []
+
+        async def burst():
+            calls = [asyncio.ensure_future(llm.agenerate("system", f"user {i}")) for i in range(12)]
+            await asyncio.sleep(0.005)
+            depths.append(llm.stats()["queue_depth"])
+            return await asyncio.gather(*calls)
+
+        try:
+            results = asyncio.run(burst())
+        finally:
+            llm.close()
+        self.assertEqual(results, ["Deploy"] * 12)
+        self.assertEqual(len(_FakeProvider.instances), 1)
+        self.assertEqual(_FakeProvider.instances[0].peak, 3)
+        self.assertGreater(depths[0], 0)
+        self.assertEqual(llm.stats()["in_flight"], 0)
+
+    def test_closing_stream_cancels_generation(self) -> None:
+        llm = SpoonLLM(max_concurrency=1)
+
+        async def read_two():
+            pieces = []
+            stream = llm.astream("system", "user")
+            async for piece in stream:
+                pieces.append(piece)
+                if len(pieces) == 2:
+                    break
+            await stream.aclose()
+            # The slot is free again, so a full generation can run.
+            return pieces, await llm.agenerate("system", "user")
+
+        try:
+            pieces, after = asyncio.run(read_two())
+        finally:
+            llm.close()
+        provider = _FakeProvider.instances[0]
+        self.assertEqual(pieces, ["Deploy ", "then "])
+        self.assertEqual(after, "Deploy")
+        self.assertTrue(provider.stream_closed)
+        self.assertLess(len(provider.streamed), 5)
+        self.assertEqual(llm.stats()["aborted"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,246 @@
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import httpx
+
+import spoon.config as config
+import spoon.llm as llm_module
+from scripts.fake_ollama import serve
+from spoon.llm import CLOSED, OPEN, LLMUnavailableError, SpoonLLM
+from spoon.status import DENIED
+
+from helpers import make_orchestrator
+
+
+class _HttpProvider:
+    """Talks to the fake Ollama servers over HTTP, like the spoon-core provider."""
+
+    peak: dict = {}
+    active: dict = {}
+
+    async def initialize(self, config) -> None:
+        self.model = config["model"]
+        self.url = config["base_url"]
+        self.client = httpx.AsyncClient(base_url=config["base_url"], timeout=config["timeout"])
+
+    async def chat(self, messages):
+        active = self.active[self.url] = self.active.get(self.url, 0) + 1
+        self.peak[self.url] = max(self.peak.get(self.url, 0), active)
+        try:
+            return await self._chat(messages)
+        finally:
+            self.active[self.url] -= 1
+
+    async def _chat(self, messages):
+        response = await self.client.post(
+            "/api/chat",
+            json={
+                "model": self.model,
+                "stream": False,
+                "messages": [{"role": m.role, "content": m.content} for m in messages],
+            },
+        )
+        response.raise_for_status()
+        return mock.Mock(content=response.json()["message"]["content"])
+
+    async def cleanup(self) -> None:
+        await self.client.aclose()
+
+
+class _CheckingProvider(_HttpProvider):
+    """Fails to initialize while its backend is down."""
+
+    async def initialize(self, config) -> None:
+        async with httpx.AsyncClient() as client:
+            (await client.get(f"{config['base_url']}/api/tags")).raise_for_status()
+        await super().initialize(config)
+
+
+class TestLLMPool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.servers = []
+        cls.urls = []
+        for _ in range(3):
+            server, url = serve()
+            cls.servers.append(server)
+            cls.urls.append(url)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        for server in cls.servers:
+            server.shutdown()
+
+    def setUp(self) -> None:
+        patcher = mock.patch.object(llm_module, "OllamaProvider", _HttpProvider)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        env = mock.patch.dict(
+            os.environ,
+            {"OLLAMA_BREAKER_FAILURES": "2", "OLLAMA_BREAKER_COOLDOWN": "0.2", "OLLAMA_HEALTH_INTERVAL": "0"},
+        )
+        env.start()
+        self.addCleanup(env.stop)
+        for server in self.servers:
+            server.RequestHandlerClass.delay = 0.005
+            server.RequestHandlerClass.fail_status = 0
+        _HttpProvider.peak.clear()
+        _HttpProvider.active.clear()
+
+    def _burst(self, llm: SpoonLLM, count: int):
+        async def burst():
+            return await asyncio.gather(
+                *(llm.agenerate("system", f"user {i}") for i in range(count)), return_exceptions=True
+            )
+
+        return asyncio.run(burst())
+
+    def _backend(self, llm: SpoonLLM, index: int):
+        return llm.stats()["backends"][index]
+
+    def test_patched_provider_does_not_import_the_real_one(self) -> None:
+        llm_module.__dict__.pop("Message", None)
+        # None in sys.modules makes importing the provider module raise ImportError.
+        with mock.patch.dict(sys.modules, {"spoon_ai.llm.providers.ollama_provider": None}):
+            llm = SpoonLLM(base_urls=self.urls[:1])
+            try:
+                self.assertEqual(self._burst(llm, 2)[0], llm.generate("system", "user"))
+            finally:
+                llm.close()
+
+    def test_requests_spread_over_backends(self) -> None:
+        llm = SpoonLLM(max_concurrency=2, base_urls=self.urls)
+        try:
+            results = self._burst(llm, 30)
+        finally:
+            llm.close()
+        self.assertTrue(all(isinstance(r, str) for r in results))
+        completed = [backend["completed"] for backend in llm.stats()["backends"]]
+        self.assertEqual(sum(completed), 30)
+        self.assertTrue(all(n >= 5 for n in completed), completed)
+        self.assertIsNotNone(self._backend(llm, 0)["latency_p50_ms"])
+
+    def test_slow_backend_gets_fewer_requests(self) -> None:
+        self.servers[0].RequestHandlerClass.delay = 0.2
+        llm = SpoonLLM(max_concurrency=4, base_urls=self.urls)
+        try:
+            results = self._burst(llm, 60)
+        finally:
+            llm.close()
+        self.assertTrue(all(isinstance(r, str) for r in results))
+        completed = [backend["completed"] for backend in llm.stats()["backends"]]
+        self.assertLess(completed[0], min(completed[1:]))
+
+    def test_failing_backend_is_skipped_then_recovers(self) -> None:
+        self.servers[1].RequestHandlerClass.fail_status = 503
+        llm = SpoonLLM(max_concurrency=2, base_urls=self.urls)
+        try:
+            results = self._burst(llm, 20)
+            self.assertTrue(all(isinstance(r, str) for r in results), results)
+            self.assertEqual(self._backend(llm, 1)["state"], OPEN)
+            # Only the chats already dispatched before the breaker opened failed there.
+            self.assertIn(self._backend(llm, 1)["failed"], range(2, 5))
+
+            # After the cooldown one probe chat closes the breaker again.
+            self.servers[1].RequestHandlerClass.fail_status = 0
+            time.sleep(0.25)
+            self._burst(llm, 6)
+            self.assertEqual(self._backend(llm, 1)["state"], CLOSED)
+            self.assertGreater(self._backend(llm, 1)["completed"], 0)
+        finally:
+            llm.close()
+
+    def test_health_check_closes_breaker(self) -> None:
+        self.servers[0].RequestHandlerClass.fail_status = 503
+        with mock.patch.dict(os.environ, {"OLLAMA_BREAKER_COOLDOWN": "60", "OLLAMA_HEALTH_INTERVAL": "0.05"}):
+            llm = SpoonLLM(max_concurrency=1, base_urls=self.urls[:2])
+        try:
+            self._burst(llm, 4)
+            self.assertEqual(self._backend(llm, 0)["state"], OPEN)
+            self.servers[0].RequestHandlerClass.fail_status = 0
+            time.sleep(0.3)
+            self.assertEqual(self._backend(llm, 0)["state"], CLOSED)
+        finally:
+            llm.close()
+
+    def test_concurrency_is_capped_per_backend(self) -> None:
+        self.servers[1].RequestHandlerClass.fail_status = 503
+        for server in self.servers:
+            server.RequestHandlerClass.delay = 0.02
+        llm = SpoonLLM(max_concurrency=2, base_urls=self.urls)
+        try:
+            results = self._burst(llm, 40)
+        finally:
+            llm.close()
+        self.assertTrue(all(isinstance(r, str) for r in results), results)
+        self.assertEqual(self._backend(llm, 1)["state"], OPEN)
+        # The open backend's share of slots is not handed to the others.
+        self.assertEqual(max(_HttpProvider.peak.values()), 2, _HttpProvider.peak)
+
+    def test_backend_down_at_startup_joins_after_health_check(self) -> None:
+        self.servers[0].RequestHandlerClass.fail_status = 503
+        with mock.patch.object(llm_module, "OllamaProvider", _CheckingProvider), mock.patch.dict(
+            os.environ, {"OLLAMA_BREAKER_COOLDOWN": "60", "OLLAMA_HEALTH_INTERVAL": "0.05"}
+        ):
+            llm = SpoonLLM(max_concurrency=2, base_urls=self.urls[:2])
+            try:
+                self._burst(llm, 4)
+                self.assertEqual(self._backend(llm, 0)["completed"], 0)
+                self.servers[0].RequestHandlerClass.fail_status = 0
+                time.sleep(0.3)
+                self._burst(llm, 8)
+                self.assertGreater(self._backend(llm, 0)["completed"], 0)
+            finally:
+                llm.close()
+
+    def test_backend_down_at_startup_is_retried_after_cooldown(self) -> None:
+        self.servers[0].RequestHandlerClass.fail_status = 503
+        with mock.patch.object(llm_module, "OllamaProvider", _CheckingProvider):
+            llm = SpoonLLM(max_concurrency=2, base_urls=self.urls[:2])
+            try:
+                self._burst(llm, 4)
+                self.assertEqual(self._backend(llm, 0)["completed"], 0)
+                self.servers[0].RequestHandlerClass.fail_status = 0
+                time.sleep(0.25)
+                self._burst(llm, 8)
+                self.assertGreater(self._backend(llm, 0)["completed"], 0)
+            finally:
+                llm.close()
+
+    def test_all_breakers_open_raises_unavailable(self) -> None:
+        for server in self.servers:
+            server.RequestHandlerClass.fail_status = 503
+        llm = SpoonLLM(max_concurrency=2, base_urls=self.urls)
+        try:
+            results = self._burst(llm, 10)
+        finally:
+            llm.close()
+        self.assertTrue(all(isinstance(r, LLMUnavailableError) for r in results), results)
+        self.assertTrue(all(b["state"] == OPEN for b in llm.stats()["backends"]))
+        self.assertGreater(llm.stats()["unavailable"], 0)
+
+    def test_gate_denies_when_no_backend_is_available(self) -> None:
+        object.__setattr__(config.SETTINGS, "audit_hmac_secret", "test-secret")
+        for server in self.servers:
+            server.RequestHandlerClass.fail_status = 503
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = make_orchestrator(tmp, decide=None, explain=None)
+            orch.llm.close()
+            orch.llm = SpoonLLM(base_urls=self.urls)
+            orch.decision_agent.llm = orch.llm
+            try:
+                result = orch.run("deploy the update", {})
+            finally:
+                orch.close()
+            self.assertEqual(result["status"], DENIED)
+            self.assertIn("llm unavailable", result["reason"])
+            self.assertIsNone(result["permit"])
+
+
+if __name__ == "__main__":
+    unittest.main()
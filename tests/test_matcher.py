@@ -0,0 +1,64 @@
+import random
+import unittest
+
+from spoon.matcher import PatternMatcher
+
+
+class TestPatternMatcher(unittest.TestCase):
+    def _naive(self, pairs, text):
+        return {tag for pattern, tag in pairs if pattern in text}
+
+    def test_overlapping_patterns(self) -> None:
+        pairs = [(p, i) for i, p in enumerate(["he", "she", "his", "hers"] * 10)]
+        matcher = PatternMatcher(pairs)
+        self.assertEqual(matcher.find("ushers"), self._naive(pairs, "ushers"))
+
+    def test_matches_substring_semantics(self) -> None:
+        rng = random.Random(7)
+        alphabet = "abcd "
+        for count in (3, 40, 500):
+            pairs = [
+                ("".join(rng.choice(alphabet) for _ in range(rng.randint(1, 5))), rng.randrange(20))
+                for _ in range(count)
+            ]
+            matcher = PatternMatcher(pairs)
+            for _ in range(20):
+                text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+                self.assertEqual(matcher.find(text), self._naive(pairs, text))
+
+    def test_scanner_matches_across_pieces(self) -> None:
+        rng = random.Random(11)
+        alphabet = "abcd "
+        for count in (3, 40, 500):
+            pairs = [
+                ("".join(rng.choice(alphabet) for _ in range(rng.randint(1, 5))), rng.randrange(20))
+                for _ in range(count)
+            ]
+            matcher = PatternMatcher(pairs)
+            for _ in range(20):
+                text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+                scanner = matcher.scanner()
+                pos = 0
+                while pos < len(text):
+                    step = rng.randint(1, 4)
+                    scanner.feed(text[pos : pos + step])
+                    pos += step
+                self.assertEqual(scanner.found, self._naive(pairs, text))
+
+    def test_scanner_keeps_short_prefix_for_tiny_pieces(self) -> None:
+        pairs = [("private key", 1), ("rm -rf", 2), ("ab", 3)]
+        matcher = PatternMatcher(pairs)
+        for text in ("private key export", "rm -rf /", "xrm -rf"):
+            for step in (1, 2):
+                scanner = matcher.scanner()
+                for pos in range(0, len(text), step):
+                    scanner.feed(text[pos : pos + step])
+                self.assertEqual(scanner.found, self._naive(pairs, text), (text, step))
+
+    def test_empty_pattern_always_matches(self) -> None:
+        matcher = PatternMatcher([("", 1)] + [(f"x{i}", 2) for i in range(50)])
+        self.assertEqual(matcher.find("nothing"), {1})
+
+
+if __name__ == "__main__":
+    unittest.main()
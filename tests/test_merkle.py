@@ -0,0 +1,28 @@
+import hashlib
+import unittest
+
+from spoon.merkle import merkle_proof, merkle_root, verify_proof
+
+
+class TestMerkle(unittest.TestCase):
+    def _leaves(self, count: int):
+        return [hashlib.sha256(str(i).encode()).hexdigest() for i in range(count)]
+
+    def test_every_leaf_proves_against_root(self) -> None:
+        for count in range(1, 10):
+            leaves = self._leaves(count)
+            root = merkle_root(leaves)
+            for index, leaf in enumerate(leaves):
+                self.assertTrue(verify_proof(leaf, merkle_proof(leaves, index), root))
+
+    def test_tampered_proof_is_rejected(self) -> None:
+        leaves = self._leaves(5)
+        root = merkle_root(leaves)
+        proof = merkle_proof(leaves, 2)
+        self.assertFalse(verify_proof(leaves[3], proof, root))
+        proof[0]["position"] = "left" if proof[0]["position"] == "right" else "right"
+        self.assertFalse(verify_proof(leaves[2], proof, root))
+
+
+if __name__ == "__main__":
+    unittest.main()
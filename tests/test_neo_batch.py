@@ -0,0 +1,118 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from spoon.neo_batch import NeoBatcher, contract_proof, permit_leaf, verify_permit_proof
+from spoon.merkle import verify_proof
+from spoon.status import APPROVED, HOLD
+from spoon.tools.neo_tool import NeoTool
+from spoon.tools.storage_tool import StorageTool
+
+import spoon.config as config
+
+from helpers import make_orchestrator
+
+
+class TestNeoBatcher(unittest.TestCase):
+    def test_size_and_window_close_batches(self) -> None:
+        anchored = []
+        def anchor(batch_id, root, leaves):
+            anchored.append(leaves)
+            return {"tx_hash": batch_id}
+
+        batcher = NeoBatcher(anchor, max_size=4, window=0.05)
+        leaves = [permit_leaf(f"p{i}", "ab" * 32, "v1", 1, 2) for i in range(10)]
+        futures = [batcher.submit(leaf) for leaf in leaves]
+        results = [f.result(timeout=5) for f in futures]
+        batcher.close()
+
+        self.assertEqual([len(batch) for batch in anchored], [4, 4, 2])
+        for leaf, result in zip(leaves, results):
+            proof = result["neo_proof"]
+            self.assertEqual(result["tx_hash"], proof["batch_id"])
+            self.assertTrue(verify_proof(leaf, proof["path"], proof["merkle_root"]))
+            self.assertTrue(all(len(step) == 66 for step in contract_proof(proof["path"])))
+
+    def test_anchor_failure_reaches_every_permit(self) -> None:
+        def fail(batch_id, root, leaves):
+            raise RuntimeError("rpc down")
+
+        batcher = NeoBatcher(fail, max_size=2, window=0.01)
+        futures = [batcher.submit("00" * 32) for _ in range(2)]
+        for future in futures:
+            with self.assertRaises(RuntimeError):
+                future.result(timeout=5)
+        batcher.close()
+
+
+class TestNeoToolBatching(unittest.TestCase):
+    def setUp(self) -> None:
+        object.__setattr__(config.SETTINGS, "audit_hmac_secret", "test-secret")
+        object.__setattr__(config.SETTINGS, "neo_batch_size", 8)
+        object.__setattr__(config.SETTINGS, "neo_batch_window_ms", 20)
+        self.addCleanup(object.__setattr__, config.SETTINGS, "neo_batch_size", 0)
+
+    def test_simulated_mode_anchors_one_root(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = StorageTool(tmp)
+            tool = NeoTool(storage)
+
+            async def register_all():
+                calls = [
+                    tool(permit_id=f"p{i}", decision_hash="cd" * 32, policy_version="v1", issued_at=1, expires_at=2)
+                    for i in range(5)
+                ]
+                return await asyncio.gather(*calls)
+
+            results = asyncio.run(register_all())
+            tool.close()
+            storage.flush("neo_tx.jsonl")
+            with open(os.path.join(tmp, "neo_tx.jsonl"), "r", encoding="utf-8") as f:
+                records = [json.loads(line) for line in f]
+
+            self.assertEqual(len(records), 1)
+            self.assertEqual(records[0]["count"], 5)
+            self.assertEqual(records[0]["mode"], "mock")
+            self.assertEqual({r["tx_hash"] for r in results}, {records[0]["tx_hash"]})
+            self.assertEqual([r["neo_proof"]["merkle_root"] for r in results], [records[0]["merkle_root"]] * 5)
+
+    def test_permits_carry_verifiable_proofs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+
+            async def decide(user_request, context, request_id="", fresh=False):
+                return {"draft_decision": f"Deploy {user_request}", "context": context}
+
+            orch = make_orchestrator(tmp, decide, explain=None)
+
+            async def submit_all():
+                return [r async for r in orch.run_batch([{"user_request": f"release {i}"} for i in range(3)])]
+
+            results = asyncio.run(submit_all())
+            orch.close()
+            self.assertTrue(all(r["status"] == APPROVED for r in results))
+            for result in results:
+                self.assertTrue(verify_permit_proof(result["permit"]))
+                stored = orch.permit_store.get(result["permit"]["permit_id"])
+                self.assertEqual(stored.neo_proof, result["permit"]["neo_proof"])
+
+            tampered = dict(results[0]["permit"], policy_version="v9")
+            self.assertFalse(verify_permit_proof(tampered))
+
+    def test_failed_anchor_holds_request(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = make_orchestrator(tmp, explain=None)
+
+            def fail(*args):
+                raise RuntimeError("rpc down")
+
+            object.__setattr__(orch.neo_tool, "_anchor_batch", fail)
+            result = orch.run("release", {})
+            orch.close()
+            self.assertEqual(result["status"], HOLD)
+            self.assertIn("rpc down", result["reason"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from spoon.neo_outbox import NeoOutbox
+from spoon.orchestrator import Orchestrator
+from spoon.status import APPROVED, EXECUTED, REJECTED
+from spoon.tools.storage_tool import StorageTool
+
+import spoon.config as config
+
+from helpers import POLICY_PATH, make_orchestrator
+
+
+class _FlakyNeo:
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.calls = []
+
+    async def __call__(self, **kwargs):
+        self.calls.append(kwargs["permit_id"])
+        if len(self.calls) <= self.failures:
+            raise RuntimeError("rpc timeout")
+        return {"tx_hash": f"TX_{kwargs['permit_id']}", "neo_mode": "mock"}
+
+
+class TestNeoOutbox(unittest.TestCase):
+    def test_retries_until_anchored(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            done = threading.Event()
+            anchored = {}
+
+            def on_anchored(permit_id, result):
+                anchored[permit_id] = result
+                done.set()
+
+            neo = _FlakyNeo(failures=2)
+            outbox = NeoOutbox(StorageTool(tmp), neo, on_anchored, base_delay=0.01, max_delay=0.05)
+            outbox.enqueue("p1", decision_hash="ab", policy_version="v1", issued_at=1, expires_at=2)
+            self.assertTrue(done.wait(5))
+            outbox.close()
+            self.assertEqual(neo.calls, ["p1", "p1", "p1"])
+            self.assertEqual(anchored["p1"]["tx_hash"], "TX_p1")
+            self.assertEqual(outbox.pending(), 0)
+
+    def test_pending_entries_survive_restart(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = StorageTool(tmp)
+            outbox = NeoOutbox(storage, _FlakyNeo(failures=100), lambda *_: None, base_delay=10)
+            for pid in ("p1", "p2"):
+                outbox.enqueue(pid, decision_hash="ab", policy_version="v1", issued_at=1, expires_at=2)
+            outbox.close()
+
+            done = threading.Event()
+            anchored = []
+
+            def on_anchored(permit_id, result):
+                anchored.append(permit_id)
+                if len(anchored) == 2:
+                    done.set()
+
+            restarted = NeoOutbox(storage, _FlakyNeo(failures=0), on_anchored)
+            self.assertTrue(done.wait(5))
+            restarted.close()
+            self.assertEqual(sorted(anchored), ["p1", "p2"])
+            self.assertEqual(NeoOutbox(storage, _FlakyNeo(failures=0), on_anchored).pending(), 0)
+
+    def test_failed_callback_does_not_rewrite_anchor(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = StorageTool(tmp)
+            neo = _FlakyNeo(failures=0)
+
+            def failing(permit_id, result):
+                raise LookupError("permit not stored yet")
+
+            outbox = NeoOutbox(storage, neo, failing, base_delay=0.01, max_delay=0.02)
+            outbox.enqueue("p1", decision_hash="ab", policy_version="v1", issued_at=1, expires_at=2)
+            time.sleep(0.2)
+            outbox.close()
+            self.assertEqual(neo.calls, ["p1"])
+            self.assertEqual(outbox.pending(), 1)
+
+            # After a restart only the callback is retried, with the recorded transaction.
+            done = threading.Event()
+            anchored = {}
+
+            def on_anchored(permit_id, result):
+                anchored[permit_id] = result
+                done.set()
+
+            restarted_neo = _FlakyNeo(failures=0)
+            restarted = NeoOutbox(storage, restarted_neo, on_anchored)
+            self.assertTrue(done.wait(5))
+            restarted.close()
+            self.assertEqual(restarted_neo.calls, [])
+            self.assertEqual(anchored["p1"]["tx_hash"], "TX_p1")
+            self.assertEqual(NeoOutbox(storage, restarted_neo, on_anchored).pending(), 0)
+
+
+class TestPendingPermits(unittest.TestCase):
+    def setUp(self) -> None:
+        object.__setattr__(config.SETTINGS, "audit_hmac_secret", "test-secret")
+        object.__setattr__(config.SETTINGS, "neo_outbox", True)
+        self.addCleanup(object.__setattr__, config.SETTINGS, "neo_outbox", False)
+
+    def _orchestrator(self, tmp: str, accept_pending: bool) -> Orchestrator:
+        with open(POLICY_PATH, "r", encoding="utf-8") as f:
+            policy = json.load(f)
+        policy["accept_pending_low_risk"] = accept_pending
+        policy_path = os.path.join(tmp, "policy.json")
+        with open(policy_path, "w", encoding="utf-8") as f:
+            json.dump(policy, f)
+
+        orch = make_orchestrator(os.path.join(tmp, "data"), explain=None, policy_path=policy_path)
+        self.addCleanup(orch.close)
+        return orch
+
+    def _gate_neo(self, orch: Orchestrator) -> threading.Event:
+        release = threading.Event()
+        write = orch.neo_tool._write_simulated
+
+        def gated(*args):
+            release.wait(5)
+            return write(*args)
+
+        object.__setattr__(orch.neo_tool, "_write_simulated", gated)
+        return release
+
+    def test_pending_permit_waits_for_anchor(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = self._orchestrator(tmp, accept_pending=False)
+            release = self._gate_neo(orch)
+            result = orch.run("deploy", {})
+            self.assertEqual(result["status"], APPROVED)
+            self.assertEqual(result["permit"]["neo_mode"], "pending")
+
+            permit_id = result["permit"]["permit_id"]
+            action = {"tool": "notify", "payload": {"channel": "t", "payload": {}}}
+            rejected = orch.execute(permit_id, action)
+            self.assertEqual((rejected["status"], rejected["reason"]), (REJECTED, "permit not anchored yet"))
+
+            release.set()
+            orch.neo_outbox.close()
+            self.assertEqual(orch.permit_store.get(permit_id).neo_mode, "mock")
+            self.assertEqual(orch.execute(permit_id, action)["status"], EXECUTED)
+
+    def test_policy_can_accept_pending_low_risk(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = self._orchestrator(tmp, accept_pending=True)
+            release = self._gate_neo(orch)
+            result = orch.run("deploy", {})
+            outcome = orch.execute(
+                result["permit"]["permit_id"], {"tool": "notify", "payload": {"channel": "t", "payload": {}}}
+            )
+            release.set()
+            orch.neo_outbox.close()
+            self.assertEqual(outcome["status"], EXECUTED)
+
+
+if __name__ == "__main__":
+    unittest.main()
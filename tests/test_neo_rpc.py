@@ -0,0 +1,67 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+import base58
+
+import spoon.config as config
+from scripts.fake_neo_rpc import NETWORK_FEE, SYSTEM_FEE, serve
+from spoon.neo_rpc import NeoRpcError
+from spoon.tools.neo_tool import NeoTool
+from spoon.tools.storage_tool import StorageTool
+
+WIF = base58.b58encode_check(b"\x80" + b"\x01" * 32 + b"\x01").decode("ascii")
+CONTRACT = "0x" + "ab" * 20
+
+
+class TestNeoRpcClient(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server, url = serve()
+        self.addCleanup(self.server.shutdown)
+        for name, value in (
+            ("neo_rpc_url", url),
+            ("neo_wif", WIF),
+            ("neo_contract_hash", CONTRACT),
+            ("neo_simulate", False),
+            ("neo_client", "rpc"),
+            ("neo_batch_size", 0),
+        ):
+            self.addCleanup(object.__setattr__, config.SETTINGS, name, getattr(config.SETTINGS, name))
+            object.__setattr__(config.SETTINGS, name, value)
+
+    def _write(self, tool: NeoTool, permit_id: str):
+        return asyncio.run(
+            tool.execute(permit_id=permit_id, decision_hash="cd" * 32, policy_version="v1", issued_at=1, expires_at=2)
+        )
+
+    def test_signed_transactions_over_one_connection(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            tool = NeoTool(StorageTool(tmp))
+            self.addCleanup(tool.close)
+            results = [self._write(tool, f"permit-{i}") for i in range(5)]
+
+            self.assertEqual([r["neo_mode"] for r in results], ["real"] * 5)
+            sent = self.server.transactions
+            self.assertEqual([r["tx_hash"] for r in results], [f"0x{tx.hash()}" for tx in sent])
+            self.assertEqual((sent[0].system_fee, sent[0].network_fee), (SYSTEM_FEE, NETWORK_FEE))
+            self.assertIn(b"register_permit", sent[0].script)
+            self.assertEqual(self.server.connections, 1)
+
+            with open(os.path.join(tmp, "neo_tx.jsonl"), "r", encoding="utf-8") as f:
+                record = json.loads(f.readline())
+            self.assertEqual((record["mode"], record["network_fee"]), ("real", NETWORK_FEE))
+
+    def test_fault_is_raised(self) -> None:
+        self.server.fault = "permit already registered"
+        with tempfile.TemporaryDirectory() as tmp:
+            tool = NeoTool(StorageTool(tmp))
+            self.addCleanup(tool.close)
+            with self.assertRaisesRegex(NeoRpcError, "already registered"):
+                self._write(tool, "permit-1")
+            self.assertEqual(self.server.transactions, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
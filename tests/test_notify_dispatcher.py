@@ -0,0 +1,172 @@
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+import spoon.config as config
+from spoon.notify_dispatcher import QUEUED, SPILLED, NotifyDispatcher
+from spoon.tools.notify_tool import NotifyTool
+from spoon.tools.storage_tool import StorageTool
+
+from helpers import make_orchestrator
+
+
+class _Sink:
+    """Stands in for NotifyTool: records batches, can block or fail on demand."""
+
+    def __init__(self, failures: int = 0) -> None:
+        self.batches = []
+        self.failures = failures
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def send_batch(self, notifications) -> None:
+        self.gate.wait()
+        if self.failures:
+            self.failures -= 1
+            raise OSError("sink down")
+        self.batches.append(list(notifications))
+
+    def sent(self):
+        return [payload["n"] for batch in self.batches for _, payload in batch]
+
+
+class TestNotifyDispatcher(unittest.TestCase):
+    def test_notifications_are_batched(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            sink = _Sink()
+            dispatcher = NotifyDispatcher(StorageTool(tmp), sink, batch_size=8, batch_window=0.2)
+            statuses = [dispatcher.submit("audit", {"n": i}) for i in range(20)]
+            dispatcher.close()
+        self.assertEqual(set(statuses), {QUEUED})
+        self.assertEqual(sorted(sink.sent()), list(range(20)))
+        self.assertLessEqual(len(sink.batches), 4)
+
+    def test_full_queue_spills_to_disk(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            sink = _Sink()
+            sink.gate.clear()
+            dispatcher = NotifyDispatcher(StorageTool(tmp), sink, max_queue=4, batch_size=2, batch_window=0)
+            statuses = [dispatcher.submit("audit", {"n": i}) for i in range(12)]
+            self.assertIn(SPILLED, statuses)
+            self.assertTrue(os.path.exists(os.path.join(tmp, "notify_spill.jsonl")))
+            sink.gate.set()
+            dispatcher.close()
+            self.assertEqual(sorted(sink.sent()), list(range(12)))
+            self.assertFalse(os.path.exists(os.path.join(tmp, "notify_spill.draining.jsonl")))
+            self.assertEqual(dispatcher.stats()["spilled"], statuses.count(SPILLED))
+
+    def test_failed_batch_is_retried(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            sink = _Sink(failures=1)
+            dispatcher = NotifyDispatcher(StorageTool(tmp), sink, batch_window=0, retry_delay=0.05)
+            dispatcher.submit("audit", {"n": 1})
+            deadline = time.monotonic() + 5
+            while not sink.batches and time.monotonic() < deadline:
+                time.sleep(0.01)
+            dispatcher.close()
+        self.assertEqual(sink.sent(), [1])
+        self.assertEqual(dispatcher.stats()["failed"], 1)
+
+    def test_spill_left_by_earlier_process_is_sent(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = StorageTool(tmp)
+            down = _Sink(failures=10**6)
+            first = NotifyDispatcher(storage, down, batch_window=0, retry_delay=60)
+            first.submit("audit", {"n": 7})
+            first.close()
+            sink = _Sink()
+            second = NotifyDispatcher(storage, sink, batch_window=0)
+            second.close()
+        self.assertEqual(sink.sent(), [7])
+
+    def test_notify_tool_writes_batch(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = StorageTool(tmp)
+            NotifyTool(storage).send_batch([("audit", {"n": 1}), ("audit", {"n": 2})])
+            storage.close("notifications.jsonl")
+            with open(os.path.join(tmp, "notifications.jsonl"), encoding="utf-8") as f:
+                lines = [json.loads(line) for line in f]
+        self.assertEqual(lines, [{"channel": "audit", "n": 1}, {"channel": "audit", "n": 2}])
+
+
+class TestOrchestratorSideEffects(unittest.TestCase):
+    def setUp(self) -> None:
+        object.__setattr__(config.SETTINGS, "audit_hmac_secret", "test-secret")
+        for name, value in (("notify_async", True), ("audit_async", True), ("strict_mode", True)):
+            self.addCleanup(object.__setattr__, config.SETTINGS, name, getattr(config.SETTINGS, name))
+            object.__setattr__(config.SETTINGS, name, value)
+
+    def _notifications(self, tmp: str):
+        with open(os.path.join(tmp, "notifications.jsonl"), encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_strict_mode_writes_audit_before_returning(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = make_orchestrator(tmp)
+            try:
+                self.assertIsNone(orch._audit_writer)
+                result = orch.run("deploy", {})
+                record = orch.audit_logger.find_latest_by_request_id(result["request_id"])
+                self.assertEqual(record["notify_status"], QUEUED)
+            finally:
+                orch.close()
+            self.assertEqual(self._notifications(tmp)[-1]["request_id"], result["request_id"])
+
+    def test_audit_is_async_outside_strict_mode(self) -> None:
+        object.__setattr__(config.SETTINGS, "strict_mode", False)
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = make_orchestrator(tmp)
+            try:
+                self.assertIsNotNone(orch._audit_writer)
+                results = [orch.run(f"deploy {i}", {}) for i in range(5)]
+            finally:
+                orch.close()
+            for result in results:
+                self.assertEqual(orch.audit_logger.find_latest_by_request_id(result["request_id"])["status"], "APPROVED")
+            self.assertEqual(orch.stats()["audit"]["written"], 5)
+            self.assertEqual(len(self._notifications(tmp)), 5)
+
+    def test_execute_right_after_run_with_backlogged_writer(self) -> None:
+        object.__setattr__(config.SETTINGS, "strict_mode", False)
+        for content_store in (True, False):
+            with self.subTest(content_store=content_store), tempfile.TemporaryDirectory() as tmp:
+                orch = make_orchestrator(tmp)
+                if not content_store:
+                    orch.content_store = None
+                gate = threading.Event()
+                append = orch.audit_logger.append
+
+                def held_append(record):
+                    if threading.current_thread().name == "audit-writer":
+                        gate.wait()
+                    return append(record)
+
+                orch.audit_logger.append = held_append
+                # A distinct explain payload per request, so each permit needs its own content-store entry.
+                orch.explain_agent.run = lambda user_request, draft_decision, context: {
+                    "decision": f"Deploy ({user_request})",
+                    "rationale": ["ok"],
+                    "assumptions": ["ok"],
+                    "risks": [{"risk": "Risk", "severity": "LOW", "mitigation": "Mitigate"}],
+                    "alternatives": [{"option": "Alt", "why_not": "Slower"}],
+                }
+
+                async def run_then_execute():
+                    results = await asyncio.gather(*(orch.arun(f"deploy {i}", {}) for i in range(4)))
+                    action = {"tool": "notify", "payload": {"channel": "t", "payload": {}}}
+                    return await asyncio.gather(*(orch.aexecute(r["permit"]["permit_id"], action) for r in results))
+
+                try:
+                    outcomes = asyncio.run(run_then_execute())
+                finally:
+                    gate.set()
+                    orch.close()
+                self.assertEqual([o["status"] for o in outcomes], ["EXECUTED"] * 4, outcomes)
+
+
+if __name__ == "__main__":
+    unittest.main()
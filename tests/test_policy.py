@@ -1,7 +1,13 @@
 import asyncio
+import json
 import os
+import tempfile
+import threading
+import time
 import unittest
 
+import spoon.config as config
+from spoon.policy import compile_policy
 from spoon.tools.policy_tool import PolicyTool
 
 
@@ -24,5 +30,110 @@ class TestPolicyTool(unittest.TestCase):
         self.assertTrue(result["required_human_approval"])
 
 
+class TestPolicyReload(unittest.TestCase):
+    def _write(self, path: str, version: str, patterns) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": version,
+                    "rules": [{"id": "r", "type": "blocklist", "patterns": patterns, "message": "blocked"}],
+                    "registered_tools": ["policy"],
+                },
+                f,
+            )
+
+    def test_snapshot_is_reused_until_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "policy.json")
+            self._write(path, "v1", ["DROP"])
+            policy = PolicyTool(policy_path=path)
+            first = policy.snapshot()
+            self.assertIs(policy.snapshot(), first)
+            self.assertEqual(first.rules[0].patterns, ("drop",))
+
+            self._write(path, "v2", ["wipe"])
+            os.utime(path, ns=(0, first.source[2] + 1))
+            result = asyncio.run(policy.execute("wipe the disk", {"tools": ["policy"]}))
+            self.assertFalse(result["ok"])
+            self.assertEqual(result["policy_version"], "v2")
+
+    def test_pinned_snapshot_wins_over_reload(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "policy.json")
+            self._write(path, "v1", ["drop"])
+            policy = PolicyTool(policy_path=path)
+            pinned = policy.snapshot()
+            self._write(path, "v2", ["wipe"])
+            os.utime(path, ns=(0, pinned.source[2] + 1))
+            result = asyncio.run(policy.execute("drop table", {}, policy=pinned))
+            self.assertEqual(result["policy_version"], "v1")
+            self.assertFalse(result["ok"])
+
+
+class TestPolicyBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.policy = PolicyTool(policy_path=os.path.join(base_dir, "policies", "policy.json"))
+        self.items = [
+            ("delete all records", {"tools": ["policy"]}),
+            ("transfer funds", {"tools": ["policy"]}),
+            ("summarise the report", {"tools": ["policy_check"]}),
+            ("summarise the report", {"tools": ["shell"]}),
+            ("summarise the report", None),
+        ]
+
+    def tearDown(self) -> None:
+        self.policy.close()
+
+    def test_batch_matches_single_evaluation(self) -> None:
+        expected = [asyncio.run(self.policy.execute(d, c)) for d, c in self.items]
+        self.assertEqual(self.policy.evaluate_batch(self.items), expected)
+
+    def test_bad_item_fails_closed_alone(self) -> None:
+        results = self.policy.evaluate_batch([(None, {}), ("summarise the report", {"tools": ["policy_check"]})])
+        self.assertFalse(results[0]["ok"])
+        self.assertEqual(results[0]["risk_level"], "HIGH")
+        self.assertTrue(results[1]["ok"])
+
+    def test_worker_processes_preserve_order(self) -> None:
+        items = self.items * 20
+        old = config.SETTINGS.policy_batch_parallel_min
+        object.__setattr__(config.SETTINGS, "policy_batch_parallel_min", 10)
+        try:
+            results = self.policy.evaluate_batch(items, workers=2)
+        finally:
+            object.__setattr__(config.SETTINGS, "policy_batch_parallel_min", old)
+        self.assertEqual(results, self.policy.evaluate_batch(items, workers=1))
+
+    def test_policy_change_lets_running_batch_finish(self) -> None:
+        items = self.items * 400
+        old = config.SETTINGS.policy_batch_parallel_min
+        object.__setattr__(config.SETTINGS, "policy_batch_parallel_min", 10)
+        self.addCleanup(object.__setattr__, config.SETTINGS, "policy_batch_parallel_min", old)
+        pinned = self.policy.snapshot()
+        other = compile_policy({"version": "v2", "rules": [], "registered_tools": ["policy"]})
+        outcome = {}
+
+        def first_batch() -> None:
+            try:
+                outcome["results"] = self.policy.evaluate_batch(items, policy=pinned, workers=2)
+            except BaseException as exc:
+                outcome["error"] = exc
+
+        thread = threading.Thread(target=first_batch)
+        thread.start()
+        deadline = time.monotonic() + 10
+        while self.policy._pool is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        # A new snapshot replaces the pool while the first batch is still queued on the old one.
+        second = self.policy.evaluate_batch(self.items * 4, policy=other, workers=2)
+        thread.join(60)
+        self.assertNotIn("error", outcome)
+        self.assertEqual(outcome["results"], self.policy.evaluate_batch(items, policy=pinned, workers=1))
+        self.assertTrue(all(r["policy_version"] == "v2" for r in second))
+        self.assertEqual(list(self.policy._pool_users.values()), [0])
+
+
 if __name__ == "__main__":
     unittest.main()
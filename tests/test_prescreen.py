@@ -0,0 +1,128 @@
+import json
+import tempfile
+import unittest
+
+from spoon.policy import StreamScreen, compile_policy, evaluate, screen_request
+from spoon.status import APPROVED, DENIED
+
+import spoon.config as config
+
+from helpers import POLICY_PATH, make_orchestrator
+
+
+class TestScreenRequest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.policy = compile_policy(
+            {
+                "version": "v1",
+                "rules": [
+                    {"id": "d", "type": "blocklist", "patterns": ["drop"], "message": "destructive"},
+                    {"id": "t", "type": "require_approval", "patterns": ["transfer"], "message": "approval"},
+                ],
+                "registered_tools": ["policy_check"],
+            }
+        )
+
+    def test_blocklist_and_unregistered_tools_deny(self) -> None:
+        self.assertFalse(screen_request(self.policy, "DROP the table", {})["ok"])
+        result = screen_request(self.policy, "list tables", {"tools": ["shell"]})
+        self.assertEqual(result["violations"], ["unregistered tools: shell"])
+
+    def test_approval_rules_are_left_to_full_evaluation(self) -> None:
+        result = screen_request(self.policy, "transfer funds", {"tools": ["policy_check"]})
+        self.assertTrue(result["ok"])
+        self.assertFalse(result["required_human_approval"])
+
+
+class TestStreamScreen(unittest.TestCase):
+    def setUp(self) -> None:
+        with open(POLICY_PATH) as f:
+            self.policy = compile_policy(json.load(f))
+
+    def test_small_tokens_match_like_joined_text(self) -> None:
+        for tokens in (["Private", " key", " export"], list("rm -rf /"), ["r", "m ", "-r", "f"]):
+            screen = StreamScreen(self.policy)
+            hits = []
+            for token in tokens:
+                hits = screen.feed(token)
+            self.assertTrue(hits, tokens)
+            self.assertEqual(hits, evaluate(self.policy, "".join(tokens), {})["violations"])
+
+
+class TestPrescreen(unittest.TestCase):
+    def setUp(self) -> None:
+        object.__setattr__(config.SETTINGS, "audit_hmac_secret", "test-secret")
+
+    def test_denies_before_llm_and_reports_hit_rate(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            calls = []
+
+            async def decide(user_request, context, request_id="", fresh=False):
+                calls.append(user_request)
+                return {"draft_decision": "Deploy", "context": context}
+
+            orch = make_orchestrator(tmp, decide, explain=None)
+
+            denied = orch.run("delete all records", {})
+            self.assertEqual(denied["status"], DENIED)
+            self.assertEqual(denied["reason"], "destructive operations are blocked")
+            self.assertEqual(orch.run("deploy", {"tools": ["rm"]})["status"], DENIED)
+            self.assertEqual(calls, [])
+
+            self.assertEqual(orch.run("deploy", {"tools": ["policy_check"]})["status"], APPROVED)
+            self.assertEqual(calls, ["deploy"])
+
+            record = orch.audit_logger.find_latest_by_request_id(denied["request_id"])
+            self.assertEqual(record["stage"], "prescreen")
+            self.assertEqual(record["final_status"], DENIED)
+            self.assertEqual(record["policy"]["policy_version"], "v1.0")
+            self.assertEqual(orch.stats()["prescreen"], {"screened": 3, "denied": 2, "hit_rate": 2 / 3})
+
+
+class _StreamingLLM:
+    model = "tinyllama"
+
+    def __init__(self, words) -> None:
+        self.words = words
+        self.sent = 0
+
+    async def astream(self, system, user, request_id=None):
+        for word in self.words:
+            self.sent += 1
+            yield word
+
+
+class TestStreamAbort(unittest.TestCase):
+    def setUp(self) -> None:
+        object.__setattr__(config.SETTINGS, "audit_hmac_secret", "test-secret")
+        object.__setattr__(config.SETTINGS, "llm_stream", True)
+        self.addCleanup(object.__setattr__, config.SETTINGS, "llm_stream", False)
+
+    def test_blocklist_hit_stops_generation(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = make_orchestrator(tmp, decide=None, explain=None)
+            llm = _StreamingLLM(["Archive, then ", "DEL", "ETE the ", "old ", "rows"])
+            orch.decision_agent.llm = llm
+
+            result = orch.run("clean up the old rows", {"tools": ["policy_check"]})
+            self.assertEqual(result["status"], DENIED)
+            self.assertEqual(result["reason"], "destructive operations are blocked")
+            self.assertEqual(llm.sent, 3)
+
+            record = orch.audit_logger.find_latest_by_request_id(result["request_id"])
+            self.assertEqual(record["stage"], "stream")
+            self.assertEqual(record["partial_decision"], "Archive, then DELETE the")
+            self.assertEqual(record["explain"], {})
+
+    def test_clean_stream_runs_full_pipeline(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = make_orchestrator(tmp, decide=None)
+            orch.decision_agent.llm = _StreamingLLM(["Archive ", "the ", "old ", "rows"])
+
+            result = orch.run("archive the old rows", {"tools": ["policy_check"]})
+            self.assertEqual(result["status"], APPROVED)
+            self.assertEqual(result["explain"]["decision"], "Archive the old rows")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from fastapi.testclient import TestClient
+
+import apps.api.main as api_main
+import apps.api.routes as routes
+import spoon.config as config
+from scripts.fake_ollama import serve
+from spoon.audit import AuditLogger
+from spoon.orchestrator import Orchestrator
+from spoon.permit import Permit, PermitStore
+from spoon.tools.storage_tool import StorageTool
+
+from helpers import POLICY_PATH
+
+
+def _permit(permit_id: str) -> Permit:
+    issued = datetime.now(timezone.utc)
+    return Permit(
+        permit_id=permit_id,
+        decision_hash="ab" * 32,
+        policy_version="v1.0",
+        risk_level="LOW",
+        issued_at=issued,
+        expires_at=issued + timedelta(seconds=300),
+        neo_tx_hash="MOCK_TX",
+    )
+
+
+class TestLazyStores(unittest.TestCase):
+    def setUp(self) -> None:
+        object.__setattr__(config.SETTINGS, "audit_hmac_secret", "test-secret")
+
+    def test_permit_store_reads_file_on_first_use(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            PermitStore(StorageTool(tmp)).save(_permit("old"))
+            store = PermitStore(StorageTool(tmp))
+            self.assertFalse(store.loaded)
+            store.save(_permit("new"))
+            self.assertTrue(store.loaded)
+            self.assertIsNotNone(store.get("old"))
+            self.assertIsNotNone(store.get("new"))
+
+    def test_audit_index_loads_on_first_lookup(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            AuditLogger(StorageTool(tmp)).append({"request_id": "r1", "status": "APPROVED"})
+            audit = AuditLogger(StorageTool(tmp))
+            self.assertFalse(audit.index_loaded)
+            self.assertEqual(audit.find_latest_by_request_id("r1")["status"], "APPROVED")
+            self.assertTrue(audit.index_loaded)
+
+
+class TestWarmUp(unittest.TestCase):
+    def setUp(self) -> None:
+        object.__setattr__(config.SETTINGS, "audit_hmac_secret", "test-secret")
+        self.server, self.url = serve()
+        self.addCleanup(self.server.shutdown)
+        env = mock.patch.dict(os.environ, {"OLLAMA_BASE_URLS": self.url, "OLLAMA_HEALTH_INTERVAL": "0"})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def test_warm_up_reports_each_subsystem(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = Orchestrator(policy_path=POLICY_PATH, data_dir=tmp)
+            try:
+                self.assertEqual(set(orch.readiness().values()), {"lazy"})
+                self.assertFalse(orch.permit_store.loaded)
+                states = orch.warm_up()
+            finally:
+                orch.close()
+        self.assertEqual(states, {"policy": "ready", "permits": "ready", "audit_index": "ready", "llm": "ready"})
+
+    def test_unreachable_llm_is_reported_not_fatal(self) -> None:
+        self.server.RequestHandlerClass.fail_status = 503
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = Orchestrator(policy_path=POLICY_PATH, data_dir=tmp)
+            try:
+                states = orch.warm_up()
+            finally:
+                orch.close()
+        self.assertEqual(states["llm"], "unavailable")
+        self.assertEqual(states["policy"], "ready")
+
+    def test_api_builds_gate_in_background(self) -> None:
+        object.__setattr__(config.SETTINGS, "gate_warmup", True)
+        self.addCleanup(object.__setattr__, config.SETTINGS, "gate_warmup", False)
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(routes, "DATA_DIR", tmp), mock.patch.object(
+            routes, "POLICY_PATH", POLICY_PATH
+        ):
+            with TestClient(api_main.app) as client:
+                self.assertEqual(client.get("/health").status_code, 200)
+                deadline = time.monotonic() + 30
+                response = client.get("/ready")
+                while response.status_code != 200 and time.monotonic() < deadline:
+                    time.sleep(0.05)
+                    response = client.get("/ready")
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json()["subsystems"]["audit_index"], "ready")
+            self.assertIsNone(routes.peek_orchestrator())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from spoon.audit import AuditLogger
+from spoon.tools.storage_tool import StorageTool
+
+import spoon.config as config
+
+
+class TestStorageWriter(unittest.TestCase):
+    def _read(self, path: str):
+        with open(path, "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_offsets_point_at_records_for_every_durability(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = StorageTool(tmp)
+            offsets = {}
+            for i, durability in enumerate(["buffered", "flush", "fsync", "buffered"]):
+                offsets[i] = storage.append_jsonl("log.jsonl", {"n": i, "text": "é" * i}, durability=durability)
+            storage.flush("log.jsonl")
+            with open(os.path.join(tmp, "log.jsonl"), "rb") as f:
+                for i, offset in offsets.items():
+                    f.seek(offset)
+                    self.assertEqual(json.loads(f.readline())["n"], i)
+
+    def test_concurrent_appends_are_all_committed(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = StorageTool(tmp)
+
+            def worker(tid: int) -> None:
+                for i in range(50):
+                    storage.append_jsonl("log.jsonl", {"t": tid, "i": i}, durability="fsync")
+
+            threads = [threading.Thread(target=worker, args=(t,)) for t in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            records = self._read(os.path.join(tmp, "log.jsonl"))
+            self.assertEqual(len(records), 400)
+            for tid in range(8):
+                self.assertEqual([r["i"] for r in records if r["t"] == tid], list(range(50)))
+
+    def test_replaced_file_is_reopened(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = StorageTool(tmp)
+            path = os.path.join(tmp, "log.jsonl")
+            storage.append_jsonl("log.jsonl", {"n": 1})
+            os.replace(path, path + ".old")
+            self.assertEqual(storage.append_jsonl("log.jsonl", {"n": 2}), 0)
+            self.assertEqual(self._read(path), [{"n": 2}])
+
+
+class TestBufferedAudit(unittest.TestCase):
+    def setUp(self) -> None:
+        object.__setattr__(config.SETTINGS, "audit_hmac_secret", "test-secret")
+        object.__setattr__(config.SETTINGS, "storage_durability", "buffered")
+
+    def tearDown(self) -> None:
+        object.__setattr__(config.SETTINGS, "storage_durability", "flush")
+
+    def test_chain_and_lookup_with_buffered_writes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            audit = AuditLogger(StorageTool(tmp))
+            other = AuditLogger(StorageTool(tmp))
+            records = []
+
+            def worker(logger: AuditLogger, tid: int) -> None:
+                for i in range(25):
+                    records.append(logger.append({"permit": {"permit_id": f"p-{tid}-{i}"}}))
+
+            threads = [threading.Thread(target=worker, args=(audit if t % 2 else other, t)) for t in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            self.assertEqual(other.find_latest_by_permit_id("p-1-24")["permit"]["permit_id"], "p-1-24")
+            on_disk = self._chain(os.path.join(tmp, "audit_log.jsonl"))
+            self.assertEqual(len(on_disk), 100)
+
+    def _chain(self, path: str):
+        with open(path, "r", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        for prev, record in zip(records, records[1:]):
+            self.assertEqual(record["prev_hash"], prev["hash"])
+        return records
+
+
+if __name__ == "__main__":
+    unittest.main()